@@ -38,6 +38,7 @@ except ImportError:
 json_dumps: Callable[..., bytes]
 orjson: Any
 ujson: Any
+msgspec: Any
 
 try:
     import orjson  # type: ignore[no-redef]
@@ -49,6 +50,11 @@ try:
 except ImportError:
     ujson = None
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 if orjson:
     json_loads = orjson.loads
     json_dumps = orjson.dumps
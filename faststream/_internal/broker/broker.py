@@ -132,6 +132,8 @@ class BrokerUsecase(
         for sub in self.subscribers:
             await sub.stop()
 
+        self.config.logger.close()
+
         self.running = False
 
     @deprecated(
@@ -33,6 +33,7 @@ class Registrator(Generic[MsgType, BrokerConfigType]):
         self._subscribers: WeakSet[SubscriberUsecase[MsgType]] = WeakSet()
         self._publishers: WeakSet[PublisherUsecase] = WeakSet()
         self.routers: list[Registrator[MsgType, Any]] = []
+        self._version = 0
 
         self.include_routers(*routers)
 
@@ -40,6 +41,11 @@ class Registrator(Generic[MsgType, BrokerConfigType]):
     def subscribers(self) -> list["SubscriberUsecase[MsgType]"]:
         return [*self._subscribers, *(sub for r in self.routers for sub in r.subscribers)]
 
+    @property
+    def _subscribers_version(self) -> int:
+        """Grows on each subscriber registration in the object or nested routers."""
+        return self._version + sum(r._subscribers_version for r in self.routers)
+
     @property
     def publishers(self) -> list["PublisherUsecase"]:
         return [*self._publishers, *(pub for r in self.routers for pub in r.publishers)]
@@ -64,6 +70,7 @@ class Registrator(Generic[MsgType, BrokerConfigType]):
         subscriber: "SubscriberUsecase[MsgType]",
     ) -> "SubscriberUsecase[MsgType]":
         self._subscribers.add(subscriber)
+        self._version += 1
         return subscriber
 
     @abstractmethod
@@ -94,6 +101,7 @@ class Registrator(Generic[MsgType, BrokerConfigType]):
 
         router.config.add_config(self.config)
         self.routers.append(router)
+        self._version += 1
 
     def include_routers(
         self,
@@ -3,7 +3,7 @@ import sys
 import warnings
 from contextlib import suppress
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 import anyio
 import typer
@@ -36,6 +36,7 @@ from .utils.parser import parse_cli_args
 if TYPE_CHECKING:
     from faststream._internal.basic_types import SettingField
     from faststream._internal.broker import BrokerUsecase
+    from faststream._internal.cli.supervisors.health import WorkerHealth
 
 cli = typer.Typer(pretty_exceptions_short=True)
 cli.add_typer(docs_app, name="docs", help="Documentations commands")
@@ -82,6 +83,26 @@ def run(
         help="Run [workers] applications with process spawning.",
         envvar="FASTSTREAM_WORKERS",
     ),
+    cpu_affinity: bool = typer.Option(
+        False,
+        "--cpu-affinity",
+        is_flag=True,
+        help="Pin [workers] processes to separate CPU sets.",
+    ),
+    health_timeout: float | None = typer.Option(
+        None,
+        "--health-timeout",
+        help="Kill and restart a worker if its event loop does not respond for [health-timeout] seconds.",
+        show_default=False,
+        envvar="FASTSTREAM_HEALTH_TIMEOUT",
+    ),
+    max_messages_per_worker: int | None = typer.Option(
+        None,
+        "--max-messages-per-worker",
+        help="Gracefully restart a worker after it consumed [max-messages-per-worker] messages.",
+        show_default=False,
+        envvar="FASTSTREAM_MAX_MESSAGES_PER_WORKER",
+    ),
     app_dir: str = APP_DIR_OPTION,
     is_factory: bool = FACTORY_OPTION,
     reload: bool = RELOAD_FLAG,
@@ -130,6 +151,15 @@ def run(
     if workers <= 1:
         extra["worker_id"] = None
 
+    supervisor_options = (
+        cpu_affinity or health_timeout is not None or max_messages_per_worker is not None
+    )
+    if supervisor_options and workers <= 1:
+        typer.echo(
+            "Supervisor options has no effect without `--workers` option."
+            "\nProbably, you forgot it?",
+        )
+
     if reload:
         try:
             from faststream._internal.cli.supervisors.watchfiles import WatchReloader
@@ -159,9 +189,16 @@ def run(
                 target=_run,
                 args=(*args, logging.DEBUG),
                 workers=workers,
+                cpu_affinity=cpu_affinity,
+                health_timeout=health_timeout,
+                max_messages_per_worker=max_messages_per_worker,
             ).run()
 
         elif isinstance(app_obj, AsgiFastStream):
+            if supervisor_options:
+                msg = "Supervisor options are not supported for AsgiFastStream yet."
+                raise SetupError(msg)
+
             from faststream._internal.cli.supervisors.asgi_multiprocess import (
                 ASGIMultiprocess,
             )
@@ -193,6 +230,7 @@ def _run(
     log_config: Path | None,
     log_level: int = logging.NOTSET,
     app_level: int = logging.INFO,  # option for reloader only
+    health: Optional["WorkerHealth"] = None,  # option for supervisor only
 ) -> None:
     """Runs the specified application."""
     _, app_obj = import_from_string(app, is_factory=is_factory)
@@ -203,6 +241,7 @@ def _run(
         log_level=log_level,
         app_level=app_level,
         log_config=log_config,
+        health=health,
     )
 
 
@@ -212,6 +251,7 @@ def _run_imported_app(
     log_config: Path | None,
     log_level: int = logging.NOTSET,
     app_level: int = logging.INFO,  # option for reloader only
+    health: Optional["WorkerHealth"] = None,
 ) -> None:
     if not isinstance(app_obj, Application):
         msg = f'Imported object "{app_obj}" must be "Application" type.'
@@ -232,11 +272,19 @@ def _run_imported_app(
             uvloop.install()
 
     try:
-        anyio.run(
-            app_obj.run,
-            app_level,
-            extra_options,
-        )
+        if health is None:
+            anyio.run(
+                app_obj.run,
+                app_level,
+                extra_options,
+            )
+        else:
+            anyio.run(
+                health.run,
+                app_obj,
+                app_level,
+                extra_options,
+            )
 
     except StartupValidationError as startup_exc:
         from faststream._internal.cli.utils.errors import draw_startup_errors
@@ -0,0 +1,133 @@
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import anyio
+
+from faststream._internal.logger import logger
+from faststream._internal.middlewares import BaseMiddleware
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from faststream._internal.application import Application
+    from faststream._internal.basic_types import AsyncFuncAny, SettingField
+    from faststream._internal.context.repository import ContextRepo
+    from faststream.message import StreamMessage
+
+
+class MessagesCounter:
+    """Broker middleware factory to count consumed messages."""
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(
+        self,
+        msg: Any | None,
+        /,
+        *,
+        context: "ContextRepo",
+    ) -> "_CountMiddleware":
+        return _CountMiddleware(msg, context=context, counter=self)
+
+
+class _CountMiddleware(BaseMiddleware):
+    def __init__(
+        self,
+        msg: Any | None,
+        /,
+        *,
+        context: "ContextRepo",
+        counter: MessagesCounter,
+    ) -> None:
+        super().__init__(msg, context=context)
+        self.counter = counter
+
+    async def consume_scope(
+        self,
+        call_next: "AsyncFuncAny",
+        msg: "StreamMessage[Any]",
+    ) -> Any:
+        self.counter.count += 1
+        return await call_next(msg)
+
+
+class WorkerHealth:
+    """Worker side of the supervisor health channel.
+
+    Sends consumed messages count and graceful timeout to the supervisor
+    from the application event loop, so a hung loop stops the pings.
+    """
+
+    def __init__(self, conn: "Connection", interval: float) -> None:
+        self.conn = conn
+        self.interval = interval
+
+    async def run(
+        self,
+        app: "Application",
+        log_level: int = logging.INFO,
+        run_extra_options: dict[str, "SettingField"] | None = None,
+    ) -> None:
+        counter = MessagesCounter()
+        for broker in app.brokers:
+            broker.add_middleware(counter)
+
+        graceful_timeout = max(
+            (b.config.graceful_timeout or 0.0 for b in app.brokers),
+            default=0.0,
+        )
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(self._ping, app, counter, graceful_timeout)
+            await app.run(log_level, run_extra_options)
+            tg.cancel_scope.cancel()
+
+    async def _ping(
+        self,
+        app: "Application",
+        counter: MessagesCounter,
+        graceful_timeout: float,
+    ) -> None:
+        while True:
+            try:
+                self.conn.send((counter.count, graceful_timeout))
+            except OSError:
+                logger.error("Supervisor process is gone. Stopping worker.")
+                app.exit()
+                return
+
+            await anyio.sleep(self.interval)
+
+
+class WorkerMonitor:
+    """Supervisor side of the worker health channel."""
+
+    __slots__ = ("conn", "graceful_timeout", "last_seen", "messages", "recycling")
+
+    def __init__(self, conn: "Connection") -> None:
+        self.conn = conn
+
+        self.last_seen: float | None = None
+        self.messages = 0
+        self.graceful_timeout = 0.0
+        self.recycling = False
+
+    def poll(self) -> None:
+        """Read all pings sent by the worker."""
+        try:
+            while self.conn.poll():
+                self.messages, self.graceful_timeout = self.conn.recv()
+                self.last_seen = time.monotonic()
+        except (EOFError, OSError):
+            pass
+
+    def is_hung(self, timeout: float) -> bool:
+        """Worker is hung if it pinged before, but has been silent for `timeout` seconds."""
+        return self.last_seen is not None and time.monotonic() - self.last_seen > timeout
+
+    def close(self) -> None:
+        self.conn.close()
@@ -1,17 +1,37 @@
+import os
 import signal
+import time
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
+from faststream._internal._compat import IS_WINDOWS
 from faststream._internal.cli.supervisors.basereload import BaseReload
+from faststream._internal.cli.supervisors.health import WorkerHealth, WorkerMonitor
+from faststream._internal.cli.supervisors.utils import (
+    get_cpu_sets,
+    get_subprocess,
+    spawn,
+)
 from faststream._internal.logger import logger
+from faststream.exceptions import SetupError
 
 if TYPE_CHECKING:
     from multiprocessing.context import SpawnProcess
 
     from faststream._internal.basic_types import DecoratedCallable
 
+HEALTH_PING_INTERVAL = 1.0
+# time to stop a worker over its graceful timeout if no `health_timeout` set
+DRAIN_TIMEOUT = 30.0
+
 
 class Multiprocess(BaseReload):
-    """A class to represent a multiprocess."""
+    """A class to represent a multiprocess.
+
+    Besides restarting dead workers, it can pin workers to CPU sets, kill
+    workers with a hung event loop, recycle workers after a number of consumed
+    messages and restart all supervised workers one by one on `SIGHUP`.
+    """
 
     def __init__(
         self,
@@ -19,19 +39,53 @@ class Multiprocess(BaseReload):
         args: tuple[Any, ...],
         workers: int,
         reload_delay: float = 0.5,
+        *,
+        cpu_affinity: bool = False,
+        health_timeout: float | None = None,
+        max_messages_per_worker: int | None = None,
     ) -> None:
         super().__init__(target, args, reload_delay)
 
         self.workers = workers
+        self.health_timeout = health_timeout
+        self.max_messages_per_worker = max_messages_per_worker
+
+        self.cpu_sets: list[set[int]] | None = None
+        if cpu_affinity:
+            if not hasattr(os, "sched_setaffinity"):
+                msg = "CPU affinity is not supported on this platform."
+                raise SetupError(msg)
+            self.cpu_sets = get_cpu_sets(workers)
+
         self.processes: list[SpawnProcess] = []
+        self.monitors: list[WorkerMonitor | None] = []
+
+        self._rolling: deque[tuple[int, SpawnProcess]] = deque()
+        self._draining: tuple[SpawnProcess, float] | None = None
+        self._previous_sighup: Any = None
+
+    @property
+    def _supervised(self) -> bool:
+        return self.health_timeout is not None or self.max_messages_per_worker is not None
+
+    def rolling_restart(self) -> None:
+        """Restart all workers one by one, waiting for each to stop gracefully."""
+        self._rolling.extend(enumerate(self.processes))
 
     def startup(self) -> None:
         logger.info("Started parent process [%s]", self.pid)
 
+        if self._supervised and not IS_WINDOWS:  # pragma: py-not-win32
+            self._previous_sighup = signal.signal(
+                signal.SIGHUP,
+                lambda *_: self.rolling_restart(),
+            )
+
         for worker_id in range(self.workers):
-            process = self.start_process(worker_id=worker_id)
+            process, monitor = self._start_worker(worker_id)
             logger.info("Started child process %s [%s]", worker_id, process.pid)
             self.processes.append(process)
+            self.monitors.append(monitor)
 
     def shutdown(self) -> None:
         for worker_id, process in enumerate(self.processes):
@@ -39,28 +93,152 @@ class Multiprocess(BaseReload):
             logger.info("Stopping child process %s [%s]", worker_id, process.pid)
             process.join()
 
+        if self._draining is not None:
+            self._draining[0].join()
+
+        for monitor in self.monitors:
+            if monitor is not None:
+                monitor.close()
+
+        if self._previous_sighup is not None:  # pragma: py-not-win32
+            signal.signal(signal.SIGHUP, self._previous_sighup)
+            self._previous_sighup = None
+
         logger.info("Stopping parent process [%s]", self.pid)
 
     def restart(self) -> None:
-        active_processes = []
-
         for worker_id, process in enumerate(self.processes):
+            monitor = self.monitors[worker_id]
+            if monitor is not None:
+                monitor.poll()
+
+            if not process.is_alive():
+                log_msg = "Worker %s (pid:%s) exited with code %s."
+                if process.exitcode and abs(process.exitcode) == signal.SIGKILL:
+                    log_msg += " Perhaps out of memory?"
+                logger.error(log_msg, worker_id, process.pid, process.exitcode)
+
+                process.kill()
+                self._replace_worker(worker_id)
+
+            elif monitor is None:
+                continue
+
+            elif self.health_timeout is not None and monitor.is_hung(self.health_timeout):
+                logger.error(
+                    "Worker %s (pid:%s) has not responded for %s seconds. Killing it.",
+                    worker_id,
+                    process.pid,
+                    self.health_timeout,
+                )
+                process.kill()
+                process.join()
+                self._replace_worker(worker_id)
+
+            elif (
+                self.max_messages_per_worker is not None
+                and not monitor.recycling
+                and monitor.messages >= self.max_messages_per_worker
+            ):
+                logger.info(
+                    "Worker %s (pid:%s) consumed %s messages. Recycling it.",
+                    worker_id,
+                    process.pid,
+                    monitor.messages,
+                )
+                monitor.recycling = True
+                self._rolling.append((worker_id, process))
+
+        self._drain_next()
+
+    def should_restart(self) -> bool:
+        return (
+            self._supervised
+            or bool(self._rolling)
+            or self._draining is not None
+            or not all(p.is_alive() for p in self.processes)
+        )
+
+    def _drain_next(self) -> None:
+        """Drain no more than one worker at a time."""
+        if self._draining is not None:
+            process, deadline = self._draining
             if process.is_alive():
-                active_processes.append(process)
+                if time.monotonic() < deadline:
+                    return
+
+                logger.error(
+                    "Worker (pid:%s) was not stopped in time. Killing it.",
+                    process.pid,
+                )
+                process.kill()
+
+            process.join()
+            self._draining = None
+
+        while self._rolling:
+            worker_id, process = self._rolling.popleft()
+            if self.processes[worker_id] is not process:
+                # already restarted
                 continue
 
-            log_msg = "Worker %s (pid:%s) exited with code %s."
-            if process.exitcode and abs(process.exitcode) == signal.SIGKILL:
-                log_msg += " Perhaps out of memory?"
-            logger.error(log_msg, worker_id, process.pid, process.exitcode)
+            graceful_timeout = 0.0
+            if (monitor := self.monitors[worker_id]) is not None:
+                graceful_timeout = monitor.graceful_timeout
 
-            process.kill()
+            deadline = (
+                time.monotonic()
+                + graceful_timeout
+                + (self.health_timeout or DRAIN_TIMEOUT)
+            )
 
-            new_process = self.start_process(worker_id=worker_id)
-            logger.info("Started child process [%s]", new_process.pid)
-            active_processes.append(new_process)
+            # start the new worker first to keep the consumers number
+            self._replace_worker(worker_id)
 
-        self.processes = active_processes
+            logger.info("Stopping child process %s [%s]", worker_id, process.pid)
+            process.terminate()
+            self._draining = (process, deadline)
+            return
 
-    def should_restart(self) -> bool:
-        return not all(p.is_alive() for p in self.processes)
+    def _replace_worker(self, worker_id: int) -> None:
+        if (monitor := self.monitors[worker_id]) is not None:
+            monitor.close()
+
+        process, monitor = self._start_worker(worker_id)
+        logger.info("Started child process [%s]", process.pid)
+
+        self.processes[worker_id] = process
+        self.monitors[worker_id] = monitor
+
+    def _start_worker(
+        self,
+        worker_id: int,
+    ) -> tuple["SpawnProcess", WorkerMonitor | None]:
+        self._args[1]["worker_id"] = worker_id
+
+        kwargs: dict[str, Any] = {}
+        monitor: WorkerMonitor | None = None
+        child_conn = None
+        if self._supervised:
+            parent_conn, child_conn = spawn.Pipe(duplex=False)
+            monitor = WorkerMonitor(parent_conn)
+
+            interval = HEALTH_PING_INTERVAL
+            if self.health_timeout is not None:
+                interval = min(interval, self.health_timeout / 4)
+
+            kwargs["health"] = WorkerHealth(child_conn, interval)
+
+        process = get_subprocess(
+            target=self._target,
+            args=self._args,
+            kwargs=kwargs,
+            cpus=self.cpu_sets[worker_id] if self.cpu_sets else None,
+        )
+        process.start()
+
+        if child_conn is not None:
+            # keep the only write end in the worker
+            child_conn.close()
+
+        return process, monitor
@@ -53,7 +53,12 @@ def set_exit(
         signal.signal(sig, func)
 
 
-def get_subprocess(target: "DecoratedCallableNone", args: Any) -> "SpawnProcess":
+def get_subprocess(
+    target: "DecoratedCallableNone",
+    args: Any,
+    kwargs: dict[str, Any] | None = None,
+    cpus: set[int] | None = None,
+) -> "SpawnProcess":
     """Spawn a subprocess."""
     stdin_fileno: int | None
     try:
@@ -64,7 +69,12 @@ def get_subprocess(target: "DecoratedCallableNone", args: Any) -> "SpawnProcess"
     return spawn.Process(
         target=subprocess_started,
         args=args,
-        kwargs={"t": target, "stdin_fileno": stdin_fileno},
+        kwargs={
+            **(kwargs or {}),
+            "t": target,
+            "stdin_fileno": stdin_fileno,
+            "cpus": cpus,
+        },
     )
 
 
@@ -72,8 +82,20 @@ def subprocess_started(
     *args: Any,
     t: "DecoratedCallableNone",
     stdin_fileno: int | None,
+    cpus: set[int] | None = None,
+    **kwargs: Any,
 ) -> None:
     """Start a subprocess."""
     if stdin_fileno is not None:  # pragma: no cover
         sys.stdin = os.fdopen(stdin_fileno)
-    t(*args)
+    if cpus:  # pragma: no cover
+        os.sched_setaffinity(0, cpus)
+    t(*args, **kwargs)
+
+
+def get_cpu_sets(workers: int) -> list[set[int]]:
+    """Split CPUs available for the current process between workers."""
+    cpus = sorted(os.sched_getaffinity(0))
+    if workers >= len(cpus):
+        return [{cpus[i % len(cpus)]} for i in range(workers)]
+    return [set(cpus[i::workers]) for i in range(workers)]
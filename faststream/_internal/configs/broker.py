@@ -32,6 +32,9 @@ class BrokerConfig:
     graceful_timeout: float | None = None
     extra_context: dict[str, Any] = field(default_factory=dict)
 
+    # grows on each middlewares change to rebuild cached subscriber pipelines
+    middlewares_version: int = field(default=0, init=False, repr=False)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id: {id(self)})"
 
@@ -45,9 +48,11 @@ class BrokerConfig:
 
     def add_middleware(self, middleware: "BrokerMiddleware[Any]") -> None:
         self.broker_middlewares = (*self.broker_middlewares, middleware)
+        self.middlewares_version += 1
 
     def insert_middleware(self, middleware: "BrokerMiddleware[Any]") -> None:
         self.broker_middlewares = (middleware, *self.broker_middlewares)
+        self.middlewares_version += 1
 
 
 BrokerConfigType = TypeVar313(
@@ -62,6 +67,7 @@ ConfigType = Union["ConfigComposition[Any]", "BrokerConfigType", BrokerConfig]
 class ConfigComposition(Generic[BrokerConfigType]):
     def __init__(self, config: BrokerConfigType) -> None:
         self.configs: tuple[ConfigType, ...] = (config,)
+        self._version = 0
 
     @property
     def broker_config(self) -> "BrokerConfigType":
@@ -73,6 +79,7 @@ class ConfigComposition(Generic[BrokerConfigType]):
 
     def add_config(self, config: "ConfigType") -> None:
         self.configs = (config, *self.configs)
+        self._version += 1
 
     # broker priority options
     @property
@@ -139,6 +146,10 @@ class ConfigComposition(Generic[BrokerConfigType]):
     def broker_middlewares(self) -> Sequence["BrokerMiddleware[Any]"]:
         return [m for c in self.configs for m in c.broker_middlewares]
 
+    @property
+    def middlewares_version(self) -> int:
+        return self._version + sum(c.middlewares_version for c in self.configs)
+
     @property
     def broker_dependencies(self) -> Iterable["Dependant"]:
         return (b for c in self.configs for b in c.broker_dependencies)
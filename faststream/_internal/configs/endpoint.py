@@ -24,6 +24,7 @@ class PublisherUsecaseConfig(EndpointConfig):
 @dataclass(kw_only=True)
 class SubscriberUsecaseConfig(EndpointConfig):
     no_reply: bool = False
+    log_sample_rate: float | None = None
 
     _ack_policy: AckPolicy = field(default_factory=lambda: EMPTY, repr=False)
 
@@ -1,4 +1,5 @@
 import inspect
+import sys
 from collections.abc import Awaitable, Callable, Mapping, Reversible, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
@@ -6,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Optional
 from fast_depends import Provider
 from fast_depends.core import CallModel, build_call_model
 
-from faststream._internal.constants import EMPTY
+from faststream._internal.constants import EMPTY, ContentTypes
 from faststream._internal.context import ContextRepo
 from faststream._internal.utils import apply_types, to_async
 
@@ -19,6 +20,10 @@ if TYPE_CHECKING:
     from faststream.message import StreamMessage
 
 
+_NOT_DECODED = object()
+_JSON_CONTENT_TYPE = ContentTypes.JSON.value
+
+
 @dataclass(kw_only=True)
 class BuiltDependant:
     original_call: Callable[..., Any]
@@ -66,6 +71,7 @@ class FastDependsConfig:
         *,
         dependencies: Sequence["Dependant"] = (),
         call_decorators: Reversible["Decorator"] = (),
+        default_decoder: bool = False,
     ) -> BuiltDependant:
         for d in reversed((*call_decorators, *self.call_decorators)):
             call = d(call)
@@ -83,16 +89,27 @@ class FastDependsConfig:
                 serializer_cls=self._serializer,
             )
 
-            if self.use_fastdepends:
-                wrapper: InjectWrapper[..., Any] = apply_types(
-                    None, context__=self.context
+            if self.use_fastdepends and (
+                direct_call := _build_direct_call(
+                    wrapped_call,
+                    dependent,
+                    # custom decoders should see the message before the handler
+                    serializer=self._serializer if default_decoder else None,
+                )
+            ):
+                wrapped_call = direct_call
+
+            else:
+                if self.use_fastdepends:
+                    wrapper: InjectWrapper[..., Any] = apply_types(
+                        None, context__=self.context
+                    )
+                    wrapped_call = wrapper(func=wrapped_call, model=dependent)
+
+                wrapped_call = _unwrap_message_to_fast_depends_decorator(
+                    wrapped_call,
+                    dependent,
                 )
-                wrapped_call = wrapper(func=wrapped_call, model=dependent)
-
-            wrapped_call = _unwrap_message_to_fast_depends_decorator(
-                wrapped_call,
-                dependent,
-            )
 
         return BuiltDependant(
             original_call=call,
@@ -101,6 +118,123 @@ class FastDependsConfig:
         )
 
 
+def _build_direct_call(
+    func: Callable[..., Awaitable[Any]],
+    dependent: "CallModel",
+    *,
+    serializer: Optional["SerializerProto"] = None,
+) -> Callable[["StreamMessage[Any]"], Awaitable[Any]] | None:
+    """Build a call bypassing FastDepends resolution if the handler needs none.
+
+    Handlers without dependencies, context fields and with a single message
+    argument are called directly. The body is casted with the serializer model
+    compiled once by `build_call_model`, so validation errors stay the same.
+
+    If `serializer` supports typed decoding, raw JSON bodies are decoded straight
+    to the argument type. Bodies failed such decoding go the regular way.
+    """
+    if dependent.call is not func or len(dependent.params) > 1:
+        return None
+
+    if any((
+        dependent.is_generator,
+        dependent.dependencies,
+        dependent.extra_dependencies,
+        dependent.custom_fields,
+        dependent.args_name,
+        dependent.kwargs_name,
+    )):
+        return None
+
+    model_serializer = dependent.serializer
+
+    cast_response: Callable[[Any], Any] | None = None
+    if model_serializer is not None:
+        response_type = model_serializer.response_option["return"].field_type
+        if response_type is not inspect.Parameter.empty and response_type is not Any:
+            cast_response = model_serializer.response
+
+    if not dependent.params:
+
+        async def call_wrapper(message: "StreamMessage[Any]") -> Any:
+            await message.decode()
+            return await func()
+
+    else:
+        option = dependent.params[0]
+        name = option.field_name
+        is_positional = name in dependent.positional_args
+
+        cast_body: Callable[[Any], Any] | None = None
+        json_decoder: Callable[[Any], Any] | None = None
+        if model_serializer is not None and option.field_type is not Any:
+
+            def cast_body(body: Any) -> Any:
+                return model_serializer({name: body})[name]
+
+            json_decoder = _build_json_decoder(serializer, option.field_type)
+
+        async def call_wrapper(message: "StreamMessage[Any]") -> Any:
+            body: Any = _NOT_DECODED
+
+            if json_decoder is not None and message.content_type == _JSON_CONTENT_TYPE:
+                body = json_decoder(message.body)
+
+            if body is _NOT_DECODED:
+                body = await message.decode()
+
+                if cast_body is not None:
+                    body = cast_body(body)
+
+            if is_positional:
+                return await func(body)
+            return await func(**{name: body})
+
+    if cast_response is None:
+        return call_wrapper
+
+    async def cast_wrapper(message: "StreamMessage[Any]") -> Any:
+        return cast_response(await call_wrapper(message))
+
+    return cast_wrapper
+
+
+def _build_json_decoder(
+    serializer: Optional["SerializerProto"],
+    annotation: Any,
+) -> Callable[[Any], Any] | None:
+    """Build raw JSON to `annotation` decoder if `serializer` supports it."""
+    # MsgSpecSerializer users import msgspec already
+    if serializer is None or "msgspec" not in sys.modules:
+        return None
+
+    import msgspec
+    from fast_depends.msgspec import MsgSpecSerializer
+
+    if not isinstance(serializer, MsgSpecSerializer):
+        return None
+
+    try:
+        decoder = msgspec.json.Decoder(
+            annotation,
+            strict=False,
+            dec_hook=serializer.dec_hook,
+        )
+    except TypeError:  # unsupported annotation
+        return None
+
+    def decode_json(body: Any) -> Any:
+        if not isinstance(body, bytes | bytearray | memoryview):
+            return _NOT_DECODED
+
+        try:
+            return decoder.decode(body)
+        except msgspec.MsgspecError:
+            return _NOT_DECODED
+
+    return decode_json
+
+
 def _unwrap_message_to_fast_depends_decorator(
     func: Callable[..., Any],
     dependent: "CallModel",
@@ -95,11 +95,13 @@ class HandlerCallWrapper(Generic[P_HandlerParams, T_HandlerReturn]):
         dependencies: Sequence["Dependant"],
         _call_decorators: Reversible["Decorator"],
         config: "FastDependsConfig",
+        default_decoder: bool = False,
     ) -> "CallModel":
         dependent = config.build_call(
             self._original_call,
             dependencies=dependencies,
             call_decorators=_call_decorators,
+            default_decoder=default_decoder,
         )
         self._original_call = dependent.original_call
         self._wrapped_call = dependent.wrapped_call
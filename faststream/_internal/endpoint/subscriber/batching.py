@@ -0,0 +1,58 @@
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class AdaptiveBatchSize:
+    """Batch size adapting to keep a batch processing time close to the target.
+
+    Size shrinks in proportion to the processing time overrun and grows
+    (at most twice per batch) only after a full batch was processed faster
+    than the target, so it stays within `[min_size, max_size]` bounds.
+    """
+
+    __slots__ = ("max_size", "min_size", "size", "target_latency")
+
+    def __init__(
+        self,
+        target_latency: float,
+        *,
+        max_size: int,
+        min_size: int = 1,
+    ) -> None:
+        self.target_latency = target_latency
+        self.max_size = max_size
+        self.min_size = min_size
+
+        self.size = min_size
+
+    def update(self, count: int, latency: float) -> int:
+        """Adjust the size by the processing time of `count` messages batch."""
+        if count < 1:
+            return self.size
+
+        # the batch size fitting the target by the current per message cost
+        fit = count * self.target_latency / latency if latency > 0 else math.inf
+
+        if fit < self.size:
+            size = int(fit)
+
+        elif count >= self.size:
+            size = int(min(fit, self.size * 2))
+
+        else:
+            # the batch was not full, so nothing to say about larger sizes
+            return self.size
+
+        self.size = min(max(size, self.min_size), self.max_size)
+        return self.size
+
+    @contextmanager
+    def measure(self, count: int) -> Iterator[None]:
+        """Update the size by the wrapped batch processing time."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.update(count, time.perf_counter() - start)
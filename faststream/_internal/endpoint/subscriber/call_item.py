@@ -2,7 +2,6 @@ from collections import UserList
 from collections.abc import Iterable, Reversible, Sequence
 from functools import partial
 from inspect import unwrap
-from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -34,6 +33,7 @@ class HandlerItem(Generic[MsgType]):
     """A class representing handler overloaded item."""
 
     __slots__ = (
+        "_item_call",
         "dependant",
         "dependencies",
         "filter",
@@ -62,6 +62,7 @@ class HandlerItem(Generic[MsgType]):
         self.item_middlewares = item_middlewares
         self.dependencies = dependencies
         self.dependant = None
+        self._item_call: AsyncFuncAny | None = None
 
     def __repr__(self) -> str:
         filter_call = unwrap(self.filter)
@@ -73,6 +74,7 @@ class HandlerItem(Generic[MsgType]):
         *,
         parser: "AsyncCallable",
         decoder: "AsyncCallable",
+        default_decoder: bool = False,
         config: "FastDependsConfig",
         broker_dependencies: Iterable["Dependant"],
         _call_decorators: Reversible["Decorator"],
@@ -84,9 +86,21 @@ class HandlerItem(Generic[MsgType]):
             self.dependant = self.handler.set_wrapped(
                 dependencies=(*broker_dependencies, *self.dependencies),
                 _call_decorators=_call_decorators,
+                default_decoder=default_decoder,
                 config=config,
             )
 
+            self._item_call = self._build_item_call()
+
+    def _build_item_call(self) -> "AsyncFuncAny":
+        """Wrap handler with its own middlewares once instead of per-message."""
+        call: AsyncFuncAny = self.handler.call_wrapped
+
+        for middleware in self.item_middlewares[::-1]:
+            call = cast("AsyncFuncAny", partial(middleware, call))
+
+        return call
+
     @property
     def name(self) -> str:
         """Returns the name of the original call."""
@@ -137,9 +151,9 @@ class HandlerItem(Generic[MsgType]):
         _extra_middlewares: Iterable["SubscriberMiddleware[Any]"],
     ) -> Any:
         """Execute wrapped handler with consume middlewares."""
-        call: AsyncFuncAny = self.handler.call_wrapped
+        call = self._item_call or self._build_item_call()
 
-        for middleware in chain(self.item_middlewares[::-1], _extra_middlewares):
+        for middleware in _extra_middlewares:
             call = partial(middleware, call)
 
         try:
@@ -63,6 +63,14 @@ class _CallOptions(NamedTuple):
     dependencies: Iterable["Dependant"]
 
 
+class _ProcessingPipeline(NamedTuple):
+    """Message processing stages compiled once at subscriber start."""
+
+    context_scopes: tuple[tuple[str, Any], ...]
+    middlewares: tuple["BrokerMiddleware[Any]", ...]
+    middlewares_version: int
+
+
 class SubscriberUsecase(Endpoint, Generic[MsgType]):
     """A class representing an asynchronous handler."""
 
@@ -83,6 +91,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         self.specification = specification
 
         self._no_reply = config.no_reply
+        self._log_sample_rate = config.log_sample_rate
         self._parser = config.parser
         self._decoder = config.decoder
         self.ack_policy = config.ack_policy
@@ -96,6 +105,8 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
         self._call_decorators: tuple[Decorator, ...] = ()
 
+        self._pipeline: _ProcessingPipeline | None = None
+
         self.running = False
         self.lock = FakeContext()
 
@@ -131,6 +142,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
             call._setup(
                 parser=async_parser,
                 decoder=async_decoder,
+                default_decoder=async_decoder is self._decoder,
                 config=self._outer_config.fd_config,
                 broker_dependencies=self._outer_config.broker_dependencies,
                 _call_decorators=self._call_decorators,
@@ -139,8 +151,32 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
             call.handler.refresh(with_mock=False)
 
     def _post_start(self) -> None:
+        # context can't be changed after start, so we can build it once
+        # instead of per-message, middlewares are rebuilt only if changed
+        self._pipeline = self._build_pipeline()
         self.running = True
 
+    def _build_pipeline(self) -> _ProcessingPipeline:
+        logger_state = self._outer_config.logger
+
+        return _ProcessingPipeline(
+            context_scopes=(
+                ("logger", logger_state.logger.logger),
+                *self._outer_config.extra_context.items(),
+            ),
+            middlewares=self.__build__middlewares_stack(),
+            middlewares_version=self._outer_config.middlewares_version,
+        )
+
+    def _get_pipeline(self) -> _ProcessingPipeline:
+        if (pipeline := self._pipeline) is None:
+            return self._build_pipeline()
+
+        if pipeline.middlewares_version != self._outer_config.middlewares_version:
+            pipeline = self._pipeline = self._build_pipeline()
+
+        return pipeline
+
     @abstractmethod
     async def stop(self) -> None:
         """Stop message consuming.
@@ -283,19 +319,18 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
     async def process_message(self, msg: MsgType) -> "Response":
         """Execute all message processing stages."""
         context = self._outer_config.fd_config.context
-        logger_state = self._outer_config.logger
+        pipeline = self._get_pipeline()
 
         async with AsyncExitStack() as stack:
             stack.enter_context(self.lock)
 
             # Enter context before middlewares
-            stack.enter_context(context.scope("logger", logger_state.logger.logger))
-            for k, v in self._outer_config.extra_context.items():
-                stack.enter_context(context.scope(k, v))
+            for k, v in pipeline.context_scopes:
+                stack.callback(context.reset_local, k, context.set_local(k, v))
 
             # enter all middlewares
             middlewares: list[BaseMiddleware] = []
-            for base_m in self.__build__middlewares_stack():
+            for base_m in pipeline.middlewares:
                 middleware = base_m(msg, context=context)
                 middlewares.append(middleware)
                 await middleware.__aenter__()
@@ -319,12 +354,14 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
                     for m in middlewares:
                         stack.push_async_exit(m.__aexit__)
 
+                    reversed_middlewares = middlewares[::-1]
+
                     result_msg = ensure_response(
                         await h.call(
                             message=message,
                             # consumer middlewares
                             _extra_middlewares=(
-                                m.consume_scope for m in middlewares[::-1]
+                                m.consume_scope for m in reversed_middlewares
                             ),
                         ),
                     )
@@ -339,7 +376,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
                         await p._publish(
                             result_msg.as_publish_command(),
                             _extra_middlewares=(
-                                m.publish_scope for m in middlewares[::-1]
+                                m.publish_scope for m in reversed_middlewares
                             ),
                         )
 
@@ -366,7 +403,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
         if self.ack_policy is AckPolicy.MANUAL:
             broker_middlewares = (
-                CriticalLogMiddleware(logger_state),
+                CriticalLogMiddleware(logger_state, self._log_sample_rate),
                 *self._broker_middlewares,
             )
 
@@ -377,7 +414,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
                     ack_policy=self.ack_policy,
                     extra_options=self.extra_watcher_options,
                 ),
-                CriticalLogMiddleware(logger_state),
+                CriticalLogMiddleware(logger_state, self._log_sample_rate),
                 *self._broker_middlewares,
             )
 
@@ -1,3 +1,7 @@
+import logging
+import queue
+import sys
+import threading
 from abc import abstractmethod
 from collections.abc import Mapping
 from typing import Any, Optional
@@ -69,7 +73,7 @@ class EmptyLoggerObject(LoggerObject):
 
 
 class RealLoggerObject(LoggerObject):
-    """Empty logger proxy for state.
+    """Real logger proxy for state.
 
     Will be used if user setup custom `logger` (.params_storage.ManualLoggerStorage)
     or in default logger case (.params_storage.DefaultLoggerStorage).
@@ -101,3 +105,82 @@ class RealLoggerObject(LoggerObject):
             extra=extra,
             exc_info=exc_info,
         )
+
+
+class QueuedLoggerObject(RealLoggerObject):
+    """Logger proxy writing records from a background thread.
+
+    Records are created and filtered by the caller, so context-based filters
+    still work. Formatting and I/O are done by the listener thread. Records
+    not fitting into the bounded queue are dropped and counted.
+    """
+
+    logger: logging.Logger
+
+    def __init__(self, logger: logging.Logger, max_size: int) -> None:
+        super().__init__(logger)
+
+        self.dropped_count = 0
+
+        self._queue: queue.Queue[logging.LogRecord | None] = queue.Queue(max_size)
+        self._listener: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(logger={self.logger}, max_size={self._queue.maxsize})"
+
+    def log(
+        self,
+        level: int,
+        msg: Any,
+        /,
+        *,
+        exc_info: Any = None,
+        extra: Mapping[str, Any] | None = None,
+    ) -> None:
+        logger = self.logger
+
+        if not logger.isEnabledFor(level):
+            return
+
+        if isinstance(exc_info, BaseException):
+            exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+        elif exc_info and not isinstance(exc_info, tuple):
+            exc_info = sys.exc_info()
+
+        record = logger.makeRecord(
+            logger.name,
+            level,
+            "(unknown file)",
+            0,
+            msg,
+            (),
+            exc_info or None,
+            extra=extra,
+        )
+
+        if not logger.filter(record):
+            return
+
+        if self._listener is None:
+            self._listener = threading.Thread(
+                target=self._serve,
+                name="faststream-logger",
+                daemon=True,
+            )
+            self._listener.start()
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def close(self) -> None:
+        """Write all queued records and stop the listener thread."""
+        if self._listener is not None:
+            self._queue.put(None)
+            self._listener.join()
+            self._listener = None
+
+    def _serve(self) -> None:
+        while (record := self._queue.get()) is not None:
+            self.logger.callHandlers(record)
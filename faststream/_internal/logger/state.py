@@ -5,6 +5,7 @@ from .logger_proxy import (
     EmptyLoggerObject,
     LoggerObject,
     NotSetLoggerObject,
+    QueuedLoggerObject,
     RealLoggerObject,
 )
 from .params_storage import (
@@ -23,6 +24,8 @@ def make_logger_state(
     logger: Optional["LoggerProto"],
     log_level: int,
     default_storage_cls: type["DefaultLoggerStorage"],
+    queue_size: int | None = None,
+    sample_rate: float = 1.0,
 ) -> "LoggerState":
     storage = make_logger_storage(
         logger=logger,
@@ -32,6 +35,8 @@ def make_logger_state(
     return LoggerState(
         log_level=log_level,
         storage=storage,
+        queue_size=queue_size,
+        sample_rate=sample_rate,
     )
 
 
@@ -40,10 +45,16 @@ class LoggerState:
         self,
         log_level: int = logging.INFO,
         storage: Optional["LoggerParamsStorage"] = None,
+        queue_size: int | None = None,
+        sample_rate: float = 1.0,
     ) -> None:
         self.log_level = log_level
         self.params_storage = storage or EmptyLoggerStorage()
 
+        self.queue_size = queue_size
+        # share of messages to write `Received` and `Processed` lines for
+        self.sample_rate = sample_rate
+
         self.logger: LoggerObject = NotSetLoggerObject()
 
     def __repr__(self) -> str:
@@ -69,9 +80,16 @@ class LoggerState:
             exc_info=exc_info,
         )
 
+    def close(self) -> None:
+        if isinstance(self.logger, QueuedLoggerObject):
+            self.logger.close()
+
     def _setup(self, context: "ContextRepo", /) -> None:
         if not self.logger:
             if logger := self.params_storage.get_logger(context=context):
-                self.logger = RealLoggerObject(logger)
+                if self.queue_size and isinstance(logger, logging.Logger):
+                    self.logger = QueuedLoggerObject(logger, self.queue_size)
+                else:
+                    self.logger = RealLoggerObject(logger)
             else:
                 self.logger = EmptyLoggerObject()
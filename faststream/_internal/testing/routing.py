@@ -0,0 +1,153 @@
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from re import Pattern
+
+    from faststream._internal.broker import BrokerUsecase
+    from faststream._internal.endpoint.subscriber import SubscriberUsecase
+
+ItemT = TypeVar("ItemT")
+IndexT = TypeVar("IndexT")
+
+
+class _Node(Generic[ItemT]):
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node[ItemT]] = {}
+        self.items: list[tuple[int, ItemT]] = []
+
+
+class RoutingIndex(Generic[ItemT]):
+    """Precompiled destination lookup table for testing producers.
+
+    Exact destinations are stored in a dict, wildcard patterns - in a trie by
+    tokens, where `single` matches one token and `multi` matches one or more
+    tokens. Returns candidates in the registration order, so producers should
+    check the final match by themselves.
+    """
+
+    __slots__ = (
+        "_any",
+        "_exact",
+        "_orders",
+        "_regexes",
+        "_root",
+        "multi",
+        "separator",
+        "single",
+    )
+
+    def __init__(
+        self,
+        *,
+        separator: str = ".",
+        single: str = "*",
+        multi: str = ">",
+    ) -> None:
+        self.separator = separator
+        self.single = single
+        self.multi = multi
+
+        self._orders: dict[int, int] = {}
+        self._exact: dict[str, list[tuple[int, ItemT]]] = {}
+        self._root: _Node[ItemT] = _Node()
+        self._regexes: list[tuple[int, Pattern[str], ItemT]] = []
+        self._any: list[tuple[int, ItemT]] = []
+
+    def add(self, destination: str, item: ItemT) -> None:
+        """Route exact destination to the item."""
+        self._exact.setdefault(destination, []).append((self._order(item), item))
+
+    def add_pattern(self, pattern: str, item: ItemT) -> None:
+        """Route wildcard pattern to the item."""
+        tokens = pattern.split(self.separator)
+        if self.single not in tokens and self.multi not in tokens:
+            self.add(pattern, item)
+            return
+
+        node = self._root
+        for token in tokens:
+            node = node.children.setdefault(token, _Node())
+        node.items.append((self._order(item), item))
+
+    def add_regex(self, regex: "Pattern[str]", item: ItemT) -> None:
+        """Route destinations matched by the regular expression to the item."""
+        self._regexes.append((self._order(item), regex, item))
+
+    def add_any(self, item: ItemT) -> None:
+        """Route all destinations to the item."""
+        self._any.append((self._order(item), item))
+
+    def match(self, destination: str) -> list[ItemT]:
+        found: dict[int, ItemT] = dict(self._exact.get(destination, ()))
+
+        if self._root.children:
+            self._match_node(self._root, destination.split(self.separator), 0, found)
+
+        found.update(
+            (order, item)
+            for order, regex, item in self._regexes
+            if regex.match(destination)
+        )
+
+        found.update(self._any)
+
+        return [found[order] for order in sorted(found)]
+
+    def _match_node(
+        self,
+        node: _Node[ItemT],
+        tokens: list[str],
+        position: int,
+        found: dict[int, ItemT],
+    ) -> None:
+        if position == len(tokens):
+            found.update(node.items)
+            return
+
+        children = node.children
+
+        if (child := children.get(tokens[position])) is not None:
+            self._match_node(child, tokens, position + 1, found)
+
+        if (child := children.get(self.single)) is not None:
+            self._match_node(child, tokens, position + 1, found)
+
+        if (child := children.get(self.multi)) is not None:
+            for next_position in range(position + 1, len(tokens) + 1):
+                self._match_node(child, tokens, next_position, found)
+
+    def _order(self, item: ItemT) -> int:
+        return self._orders.setdefault(id(item), len(self._orders))
+
+
+class RoutingTable(Generic[IndexT]):
+    """Routing index over broker subscribers.
+
+    The index is rebuilt on access if broker subscribers were changed.
+    """
+
+    __slots__ = ("_broker", "_build", "_index", "_version")
+
+    def __init__(
+        self,
+        broker: "BrokerUsecase[Any, Any]",
+        build: Callable[[Sequence["SubscriberUsecase[Any]"]], IndexT],
+    ) -> None:
+        self._broker = broker
+        self._build = build
+
+        self._version: int | None = None
+        self._index: IndexT | None = None
+
+    @property
+    def index(self) -> IndexT:
+        version = self._broker._subscribers_version
+
+        if self._index is None or version != self._version:
+            self._index = self._build(self._broker.subscribers)
+            self._version = version
+
+        return self._index
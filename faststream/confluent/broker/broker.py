@@ -107,6 +107,8 @@ class KafkaBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue_size: int | None = None,
+        log_sample_rate: float = 1.0,
         # FastDepends args
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
@@ -208,6 +210,8 @@ class KafkaBroker(
             tags: AsyncAPI server tags.
             logger: User specified logger to pass into Context and log service messages.
             log_level: Service messages log level.
+            log_queue_size: Size of the queue to write service messages from a background thread. Messages are written synchronously if not set.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for.
             apply_types: Whether to use FastDepends or not.
             serializer: Serializer for FastDepends.
         """
@@ -268,6 +272,8 @@ class KafkaBroker(
                 logger=make_kafka_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    queue_size=log_queue_size,
+                    sample_rate=log_sample_rate,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
@@ -54,6 +54,7 @@ class KafkaRegistrator(
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -101,6 +102,7 @@ class KafkaRegistrator(
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -113,6 +115,7 @@ class KafkaRegistrator(
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: None = None,
         group_instance_id: None = None,
         fetch_max_wait_ms: int = 500,
@@ -160,6 +163,7 @@ class KafkaRegistrator(
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -172,6 +176,7 @@ class KafkaRegistrator(
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -219,6 +224,7 @@ class KafkaRegistrator(
         max_workers: int = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -231,6 +237,7 @@ class KafkaRegistrator(
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -278,6 +285,7 @@ class KafkaRegistrator(
         max_workers: int | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -294,6 +302,7 @@ class KafkaRegistrator(
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -340,6 +349,7 @@ class KafkaRegistrator(
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -356,6 +366,9 @@ class KafkaRegistrator(
             *topics: Kafka topics to consume messages from.
             partitions: Sequence of topic partitions.
             polling_interval: Polling interval in seconds.
+            poll_batch_size: Number of messages to fetch by a single request of
+                a dedicated polling thread. If set, messages are fetched in
+                advance and buffered for the subscriber. Non-batch subscribers only.
             group_id: Name of the consumer group to join for dynamic
                 partition assignment (if enabled), and to use for fetching and
                 committing offsets. If `None`, auto-partition assignment (via
@@ -466,6 +479,7 @@ class KafkaRegistrator(
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             title: Specification subscriber object title.
             description: Specification subscriber object description.
                 Uses decorated docstring as default.
@@ -482,6 +496,7 @@ class KafkaRegistrator(
             *topics,
             max_workers=workers,
             polling_interval=polling_interval,
+            poll_batch_size=poll_batch_size,
             partitions=partitions,
             batch=batch,
             max_records=max_records,
@@ -506,6 +521,7 @@ class KafkaRegistrator(
             ack_policy=ack_policy,
             no_ack=no_ack,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             config=cast("KafkaBrokerConfig", self.config),
             # Specification
             title_=title,
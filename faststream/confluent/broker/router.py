@@ -112,6 +112,7 @@ class KafkaRoute(SubscriberRoute):
         publishers: Iterable[KafkaPublisher] = (),
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -158,6 +159,7 @@ class KafkaRoute(SubscriberRoute):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI args
         title: str | None = None,
         description: str | None = None,
@@ -172,6 +174,9 @@ class KafkaRoute(SubscriberRoute):
             publishers: Kafka publishers to broadcast the handler result.
             partitions: Sequence of topic partitions.
             polling_interval: Polling interval in seconds.
+            poll_batch_size: Number of messages to fetch by a single request of
+                a dedicated polling thread. If set, messages are fetched in
+                advance and buffered for the subscriber. Non-batch subscribers only.
             group_id: Name of the consumer group to join for dynamic
                 partition assignment (if enabled), and to use for fetching and
                 committing offsets. If `None`, auto-partition assignment (via
@@ -282,6 +287,7 @@ class KafkaRoute(SubscriberRoute):
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             title: AsyncAPI subscriber object title.
             description: AsyncAPI subscriber object description.
                 Uses decorated docstring as default.
@@ -295,6 +301,7 @@ class KafkaRoute(SubscriberRoute):
             max_workers=max_workers,
             partitions=partitions,
             polling_interval=polling_interval,
+            poll_batch_size=poll_batch_size,
             group_id=group_id,
             group_instance_id=group_instance_id,
             fetch_max_wait_ms=fetch_max_wait_ms,
@@ -318,6 +325,7 @@ class KafkaRoute(SubscriberRoute):
             decoder=decoder,
             middlewares=middlewares,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             # AsyncAPI args
             title=title,
             description=description,
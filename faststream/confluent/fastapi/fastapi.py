@@ -108,6 +108,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue_size: int | None = None,
+        log_sample_rate: float = 1.0,
         # StreamRouter options
         setup_state: bool = True,
         context: ContextRepo | None = None,
@@ -231,6 +233,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             context: faststream.ContextRepo object to store application injections.
             logger: User specified logger to pass into Context and log service messages.
             log_level: Service messages log level.
+            log_queue_size: Size of the queue to write service messages from a background thread. Messages are written synchronously if not set.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for.
             setup_state: Whether to add broker to app scope in lifespan.
                 You should disable this option at old ASGI servers.
             schema_url: The URL path where the AsyncAPI schema will be served (e.g. "/asyncapi").
@@ -372,6 +376,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             # logger options
             logger=logger,
             log_level=log_level,
+            log_queue_size=log_queue_size,
+            log_sample_rate=log_sample_rate,
             # Specification options
             security=security,
             protocol=protocol,
@@ -406,6 +412,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -453,6 +460,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -473,6 +481,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -520,6 +529,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         max_workers: int = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -540,6 +550,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -598,6 +609,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -645,6 +657,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         max_workers: int | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -669,6 +682,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         *topics: str,
         partitions: Sequence["TopicPartition"] = (),
         polling_interval: float = 0.1,
+        poll_batch_size: int | None = None,
         group_id: str | None = None,
         group_instance_id: str | None = None,
         fetch_max_wait_ms: int = 500,
@@ -716,6 +730,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         max_workers: int | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -735,6 +750,9 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             *topics: Kafka topics to consume messages from.
             partitions: Sequence of topic partitions.
             polling_interval: Polling interval in seconds.
+            poll_batch_size: Number of messages to fetch by a single request of
+                a dedicated polling thread. If set, messages are fetched in
+                advance and buffered for the subscriber. Non-batch subscribers only.
             group_id: Name of the consumer group to join for dynamic
                 partition assignment (if enabled), and to use for fetching and
                 committing offsets. If `None`, auto-partition assignment (via
@@ -845,6 +863,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             title: Specification subscriber object title.
             description: Specification subscriber object description.
                 Uses decorated docstring as default.
@@ -933,6 +952,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         subscriber = super().subscriber(
             *topics,
             polling_interval=polling_interval,
+            poll_batch_size=poll_batch_size,
             max_workers=max_workers,
             partitions=partitions,
             group_id=group_id,
@@ -960,6 +980,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             ack_policy=ack_policy,
             no_ack=no_ack,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             title=title,
             description=description,
             include_in_schema=include_in_schema,
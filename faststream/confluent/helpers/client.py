@@ -1,10 +1,14 @@
 import asyncio
+import concurrent.futures
 import logging
+import threading
+from collections import deque
 from collections.abc import Callable, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from functools import partial
 from time import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import anyio
 from confluent_kafka import Consumer, KafkaError, KafkaException, Message, Producer
@@ -16,6 +20,7 @@ from faststream.exceptions import SetupError
 from . import config as config_module
 
 if TYPE_CHECKING:
+    from confluent_kafka import TopicPartition as ConfluentPartition
     from typing_extensions import NotRequired, TypedDict
 
     from faststream._internal.logger import LoggerState
@@ -25,7 +30,7 @@ if TYPE_CHECKING:
     class _SendKwargs(TypedDict):
         value: bytes | str | None
         key: bytes | str | None
-        headers: list[tuple[str, str | bytes]] | None
+        headers: list[tuple[str, str | bytes | None]] | None
         partition: NotRequired[int]
         timestamp: NotRequired[int]
         on_delivery: NotRequired[Callable[..., None]]
@@ -48,24 +53,34 @@ class AsyncConfluentProducer:
             logger=self.logger_state.logger.logger,
         )
 
+        self._reports = _DeliveryReports(asyncio.get_running_loop())
+
         self.__running = True
-        self._poll_task = asyncio.create_task(self._poll_loop())
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop,
+            name="faststream-confluent-producer",
+            daemon=True,
+        )
+        self._poll_thread.start()
 
-    async def _poll_loop(self) -> None:
+    def _poll_loop(self) -> None:
         while self.__running:
             with suppress(Exception):
-                await call_or_await(self.producer.poll, 0.1)
+                self.producer.poll(0.1)
+
+            # resolve all reports served by the poll call at once
+            self._reports.dispatch()
 
     async def stop(self) -> None:
         """Stop the Kafka producer and flush remaining messages."""
         if self.__running:
             self.__running = False
-            if not self._poll_task.done():
-                self._poll_task.cancel()
-            await call_or_await(self.producer.flush)
+            await run_in_executor(None, self._poll_thread.join)
+            await self.flush()
 
     async def flush(self) -> None:
         await call_or_await(self.producer.flush)
+        self._reports.dispatch()
 
     async def send(
         self,
@@ -74,7 +89,7 @@ class AsyncConfluentProducer:
         key: bytes | str | None = None,
         partition: int | None = None,
         timestamp_ms: int | None = None,
-        headers: list[tuple[str, str | bytes]] | None = None,
+        headers: list[tuple[str, str | bytes | None]] | None = None,
         no_confirm: bool = False,
     ) -> "asyncio.Future[Message | None] | Message | None":
         """Sends a single message to a Kafka topic."""
@@ -90,19 +105,8 @@ class AsyncConfluentProducer:
         if timestamp_ms is not None:
             kwargs["timestamp"] = timestamp_ms
 
-        loop = asyncio.get_running_loop()
-        result_future: asyncio.Future[Message | None] = loop.create_future()
-
-        def ack_callback(err: Any, msg: Message | None) -> None:
-            if err or (msg is not None and (err := msg.error())):
-                loop.call_soon_threadsafe(
-                    result_future.set_exception,
-                    KafkaException(err),
-                )
-            else:
-                loop.call_soon_threadsafe(result_future.set_result, msg)
-
-        kwargs["on_delivery"] = ack_callback
+        result_future: asyncio.Future[Message | None] = self._reports.loop.create_future()
+        kwargs["on_delivery"] = partial(self._reports.on_delivery, result_future)
 
         # should be sync to prevent segfault
         self.producer.produce(topic, **kwargs)
@@ -122,20 +126,44 @@ class AsyncConfluentProducer:
         *,
         partition: int | None,
         no_confirm: bool = False,
-    ) -> None:
-        """Sends a batch of messages to a Kafka topic."""
-        async with anyio.create_task_group() as tg:
+    ) -> "asyncio.Future[None] | None":
+        """Sends a batch of messages to a Kafka topic.
+
+        All messages are produced at once and confirmed by a single future.
+        """
+        delivery = _BatchDelivery(self._reports)
+
+        try:
             for msg in batch._builder:
-                tg.start_soon(
-                    self.send,
-                    topic,
-                    msg["value"],
-                    msg["key"],
-                    partition,
-                    msg["timestamp_ms"],
-                    msg["headers"],
-                    no_confirm,
-                )
+                kwargs: _SendKwargs = {
+                    "value": msg["value"],
+                    "key": msg["key"],
+                    "headers": msg["headers"],
+                    "on_delivery": delivery,
+                }
+
+                if partition is not None:
+                    kwargs["partition"] = partition
+
+                if msg["timestamp_ms"] is not None:
+                    kwargs["timestamp"] = msg["timestamp_ms"]
+
+                # should be sync to prevent segfault
+                self.producer.produce(topic, **kwargs)
+                delivery.produced += 1
+
+        except BaseException:
+            # nobody waits for already produced messages reports
+            delivery.future.cancel()
+            raise
+
+        delivery.seal()
+
+        if no_confirm:
+            return delivery.future
+
+        await delivery.future
+        return None
 
     async def ping(
         self,
@@ -191,6 +219,8 @@ class AsyncConfluentConsumer:
         connections_max_idle_ms: int = 540000,
         isolation_level: str = "read_uncommitted",
         allow_auto_create_topics: bool = True,
+        # faststream options
+        poll_batch_size: int | None = None,
     ) -> None:
         self.admin_client = admin_service
         self.logger_state = logger
@@ -239,6 +269,18 @@ class AsyncConfluentConsumer:
         # https://github.com/ag2ai/faststream/issues/1904#issuecomment-2506990895
         self._thread_pool = ThreadPoolExecutor(max_workers=1)
 
+        self._poller = (
+            _BufferedPoller(
+                self.consumer,
+                batch_size=poll_batch_size,
+                logger=self.logger_state,
+            )
+            if poll_batch_size
+            else None
+        )
+        # offsets of messages passed to the application, to not commit buffered ones
+        self._positions: dict[tuple[str, int], int] = {}
+
     @property
     def topics_to_create(self) -> list[str]:
         return list({*self.topics, *(p.topic for p in self.partitions)})
@@ -266,11 +308,24 @@ class AsyncConfluentConsumer:
             )
 
         if self.topics:
-            await run_in_executor(
-                self._thread_pool,
-                self.consumer.subscribe,
-                topics=self.topics,
-            )
+            if self._poller is None:
+                await run_in_executor(
+                    self._thread_pool,
+                    self.consumer.subscribe,
+                    topics=self.topics,
+                )
+
+            else:
+                # buffered messages of revoked partitions shouldn't be processed
+                await run_in_executor(
+                    self._thread_pool,
+                    partial(
+                        self.consumer.subscribe,
+                        self.topics,
+                        on_revoke=self._on_revoke,
+                        on_lost=self._on_revoke,
+                    ),
+                )
 
         elif self.partitions:
             await run_in_executor(
@@ -283,12 +338,31 @@ class AsyncConfluentConsumer:
             msg = "You must provide either `topics` or `partitions` option."
             raise SetupError(msg)
 
+        if self._poller is not None:
+            self._poller.start()
+
     async def commit(self, asynchronous: bool = True) -> None:
         """Commits the offsets of all messages returned by the last poll operation."""
+        if self._poller is None:
+            await run_in_executor(
+                self._thread_pool,
+                self.consumer.commit,
+                asynchronous=asynchronous,
+            )
+            return
+
+        if not self._positions:
+            return
+
+        offsets = [
+            TopicPartition(topic=topic, partition=partition, offset=offset).to_confluent()
+            for (topic, partition), offset in self._positions.items()
+        ]
+        self._positions.clear()
+
         await run_in_executor(
             self._thread_pool,
-            self.consumer.commit,
-            asynchronous=asynchronous,
+            partial(self.consumer.commit, offsets=offsets, asynchronous=asynchronous),
         )
 
     async def stop(self) -> None:
@@ -297,6 +371,10 @@ class AsyncConfluentConsumer:
         # We are doing this to avoid the issue.
         enable_auto_commit = self.config.get("enable.auto.commit", True)
 
+        if self._poller is not None:
+            self._poller.stop()
+            await run_in_executor(self._thread_pool, self._poller.join)
+
         try:
             if enable_auto_commit:
                 await self.commit(asynchronous=False)
@@ -323,8 +401,34 @@ class AsyncConfluentConsumer:
 
     async def getone(self, timeout: float = 0.1) -> Message | None:
         """Consumes a single message from Kafka."""
-        msg = await run_in_executor(self._thread_pool, self.consumer.poll, timeout)
-        return check_msg_error(msg)
+        if self._poller is None:
+            msg = await run_in_executor(self._thread_pool, self.consumer.poll, timeout)
+            return check_msg_error(msg)
+
+        if (msg := await self._poller.get(timeout)) is not None:
+            self._positions[msg.topic(), msg.partition()] = msg.offset() + 1  # type: ignore[index,operator]
+
+        return msg
+
+    def _on_revoke(
+        self,
+        consumer: Consumer,
+        partitions: list["ConfluentPartition"],
+    ) -> None:
+        # called by the polling thread, so wait for the loop to drop partitions
+        assert self._poller
+        self._poller.call_in_loop(
+            self._drop_partitions,
+            {(p.topic, p.partition) for p in partitions},
+        )
+
+    def _drop_partitions(self, partitions: set[tuple[str, int]]) -> None:
+        assert self._poller
+        self._poller.drop(partitions)
+
+        # new partitions owner commits them by itself
+        for key in partitions:
+            self._positions.pop(key, None)
 
     async def getmany(
         self,
@@ -353,6 +457,290 @@ class AsyncConfluentConsumer:
             topic_partition.to_confluent(),
         )
 
+        if self._poller is not None:
+            # buffered messages are fetched before the new position
+            self._poller.clear()
+
+
+class _BufferedPoller:
+    """Polls consumer messages by a dedicated thread in batches.
+
+    Each fetched batch is passed to the event loop by a single callback.
+    The thread stops fetching while `max_batches` batches are not taken
+    by the application, so the buffer is bounded.
+    """
+
+    def __init__(
+        self,
+        consumer: Consumer,
+        *,
+        batch_size: int,
+        max_batches: int = 2,
+        timeout: float = 0.1,
+        call_timeout: float = 10.0,
+        logger: Optional["LoggerState"] = None,
+    ) -> None:
+        self._consumer = consumer
+        self._batch_size = batch_size
+        self._timeout = timeout
+        self._call_timeout = call_timeout
+        self._logger = logger
+
+        self._batches: deque[list[Message] | Exception] = deque()
+        self._batch_position = 0
+        # batches fetched before `clear` call are dropped
+        self._generation = 0
+
+        self._slots = threading.Semaphore(max_batches)
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._waiter: asyncio.Future[None] | None = None
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._thread = threading.Thread(
+            target=self._poll,
+            name="faststream-confluent-poller",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def join(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def clear(self) -> None:
+        self._generation += 1
+        for _ in self._batches:
+            self._slots.release()
+        self._batches.clear()
+        self._batch_position = 0
+
+    async def get(self, timeout: float) -> Message | None:
+        if not self._batches:
+            assert self._loop
+            self._waiter = self._loop.create_future()
+            try:
+                with anyio.move_on_after(timeout):
+                    await self._waiter
+            finally:
+                self._waiter = None
+
+            if not self._batches:
+                return None
+
+        batch = self._batches[0]
+
+        if isinstance(batch, Exception):
+            self._release_batch()
+            raise batch
+
+        msg = batch[self._batch_position]
+        self._batch_position += 1
+
+        if self._batch_position == len(batch):
+            self._release_batch()
+
+        return msg
+
+    def drop(self, partitions: set[tuple[str, int]]) -> None:
+        """Drops buffered messages of the partitions."""
+        batches: deque[list[Message] | Exception] = deque()
+
+        for i, batch in enumerate(self._batches):
+            if isinstance(batch, Exception):
+                batches.append(batch)
+                continue
+
+            if i == 0:
+                batch = batch[self._batch_position :]
+
+            if kept := [m for m in batch if (m.topic(), m.partition()) not in partitions]:
+                batches.append(kept)
+            else:
+                self._slots.release()
+
+        self._batches = batches
+        self._batch_position = 0
+
+    def call_in_loop(self, func: Callable[..., None], *args: Any) -> None:
+        """Calls the function by the event loop and waits for it in the polling thread."""
+        assert self._loop
+
+        async def call() -> None:
+            func(*args)
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(call(), self._loop)
+        except RuntimeError:  # event loop is closed
+            return
+
+        try:
+            future.result(timeout=self._call_timeout)
+
+        except concurrent.futures.TimeoutError:
+            # don't block the polling thread by a stuck event loop forever
+            future.cancel()
+            if self._logger is not None:
+                self._logger.log(
+                    f"Event loop didn't call `{getattr(func, '__name__', func)}` "
+                    f"in {self._call_timeout} seconds, the poller continues without it.",
+                    log_level=logging.WARNING,
+                )
+
+    def _release_batch(self) -> None:
+        self._batches.popleft()
+        self._batch_position = 0
+        self._slots.release()
+
+    def _put(self, generation: int, batch: list[Message] | Exception) -> None:
+        if generation != self._generation:
+            self._slots.release()
+            return
+
+        self._batches.append(batch)
+
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _poll(self) -> None:
+        assert self._loop
+
+        while not self._stopped.is_set():
+            if not self._slots.acquire(timeout=self._timeout):
+                continue
+
+            generation = self._generation
+
+            batch: list[Message] | Exception
+            try:
+                batch = [
+                    msg
+                    for msg in self._consumer.consume(
+                        num_messages=self._batch_size,
+                        timeout=self._timeout,
+                    )
+                    if check_msg_error(msg) is not None
+                ]
+            except Exception as e:
+                batch = e
+
+            if not batch:
+                self._slots.release()
+                continue
+
+            try:
+                self._loop.call_soon_threadsafe(self._put, generation, batch)
+            except RuntimeError:  # event loop is closed
+                return
+
+
+class _DeliveryReports:
+    """Delivery reports of produced messages.
+
+    Reports are collected by threads serving producer callbacks and
+    resolved by a single event loop wakeup per `dispatch` call.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+
+        self._lock = threading.Lock()
+        self._reports: list[tuple[asyncio.Future[Any], Any, Message | None]] = []
+
+    def on_delivery(
+        self,
+        future: "asyncio.Future[Message | None]",
+        err: Any,
+        msg: Message | None,
+    ) -> None:
+        if not err and msg is not None:
+            err = msg.error()
+        self.add(future, err, msg)
+
+    def add(self, future: "asyncio.Future[Any]", err: Any, msg: Message | None) -> None:
+        with self._lock:
+            self._reports.append((future, err, msg))
+
+    def dispatch(self) -> None:
+        with self._lock:
+            if not self._reports:
+                return
+            reports, self._reports = self._reports, []
+
+        with suppress(RuntimeError):  # event loop is closed
+            self.loop.call_soon_threadsafe(self._resolve, reports)
+
+    @staticmethod
+    def _resolve(
+        reports: list[tuple["asyncio.Future[Any]", Any, Message | None]],
+    ) -> None:
+        for future, err, msg in reports:
+            if future.done():
+                continue
+
+            if err:
+                future.set_exception(KafkaException(err))
+            else:
+                future.set_result(msg)
+
+
+class _BatchDelivery:
+    """Delivery callback of batch messages resolving a single future.
+
+    The future is reported after all `produced` messages are delivered
+    and the batch is sealed, failed by the first delivery error if any.
+    """
+
+    __slots__ = (
+        "_delivered",
+        "_error",
+        "_lock",
+        "_reports",
+        "_sealed",
+        "future",
+        "produced",
+    )
+
+    def __init__(self, reports: _DeliveryReports) -> None:
+        self.future: asyncio.Future[None] = reports.loop.create_future()
+        self.produced = 0
+
+        self._reports = reports
+        self._lock = threading.Lock()
+        self._delivered = 0
+        self._sealed = False
+        self._error: Any = None
+
+    def __call__(self, err: Any, msg: Message | None) -> None:
+        if not err and msg is not None:
+            err = msg.error()
+
+        with self._lock:
+            self._delivered += 1
+            if err and self._error is None:
+                self._error = err
+            completed = self._sealed and self._delivered == self.produced
+
+        if completed:
+            self._reports.add(self.future, self._error, None)
+
+    def seal(self) -> None:
+        with self._lock:
+            self._sealed = True
+            completed = self._delivered == self.produced
+
+        if not self.produced:
+            self.future.set_result(None)
+        elif completed:
+            self._reports.add(self.future, self._error, None)
+
 
 def check_msg_error(msg: Message | None) -> Message | None:
     """Checks for errors in the consumed message."""
@@ -1,7 +1,8 @@
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeAlias
 
-from faststream.message import StreamMessage, decode_message
+from faststream.message import StreamMessage, decode_batch_bodies, decode_message
 
 from .message import FAKE_CONSUMER, KafkaMessage
 
@@ -12,6 +13,11 @@ if TYPE_CHECKING:
 
     from .message import ConsumerProtocol
 
+# `Message.headers()` value, header values can be `None`
+_RawHeaders: TypeAlias = (
+    "dict[str, str | bytes | None] | Sequence[tuple[str, str | bytes | None]]"
+)
+
 
 class AsyncConfluentParser:
     """A class to parse Kafka messages."""
@@ -51,24 +57,20 @@ class AsyncConfluentParser:
         message: tuple["Message", ...],
     ) -> KafkaMessage:
         """Parses a batch of messages from a Kafka consumer."""
-        body: list[Any] = []
-        batch_headers: list[dict[str, str]] = []
+        body: list[Any] = [m.value() or b"" for m in message]
 
         first = message[0]
         last = message[-1]
 
-        for m in message:
-            body.append(m.value() or b"")
-            batch_headers.append(_parse_msg_headers(m.headers() or ()))
-
-        headers = next(iter(batch_headers), {})
+        headers = _parse_msg_headers(first.headers() or ())
 
         _, first_timestamp = first.timestamp()
 
         return KafkaMessage(
             body=body,
             headers=headers,
-            batch_headers=batch_headers,
+            # decode other messages headers only if they are requested
+            batch_headers=partial(_parse_batch_headers, message, headers),
             reply_to=headers.get("reply_to", ""),
             content_type=headers.get("content-type"),
             message_id=f"{first.offset()}-{last.offset()}-{first_timestamp}",
@@ -90,10 +92,40 @@ class AsyncConfluentParser:
         msg: "StreamMessage[tuple[Message, ...]]",
     ) -> "DecodedMessage":
         """Decode a batch of messages."""
-        return [decode_message(await self.parse_message(m)) for m in msg.raw_message]
+        return decode_batch_bodies(
+            [m.value() or b"" for m in msg.raw_message],
+            [_get_content_type(m.headers() or ()) for m in msg.raw_message],
+        )
+
+
+def _parse_msg_headers(headers: _RawHeaders) -> dict[str, str]:
+    return {i: _decode_header(j) for i, j in _iter_headers(headers)}
+
+
+def _parse_batch_headers(
+    message: tuple["Message", ...],
+    first_headers: dict[str, str],
+) -> list[dict[str, str]]:
+    return [
+        first_headers,
+        *(_parse_msg_headers(m.headers() or ()) for m in message[1:]),
+    ]
+
+
+def _get_content_type(headers: _RawHeaders) -> str | None:
+    for key, value in _iter_headers(headers):
+        if key == "content-type":
+            return _decode_header(value)
+    return None
+
+
+def _iter_headers(
+    headers: _RawHeaders,
+) -> Iterable[tuple[str, str | bytes | None]]:
+    return headers.items() if isinstance(headers, dict) else headers
 
 
-def _parse_msg_headers(
-    headers: Sequence[tuple[str, bytes | str]],
-) -> dict[str, str]:
-    return {i: j if isinstance(j, str) else j.decode() for i, j in headers}
+def _decode_header(value: str | bytes | None) -> str:
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else value.decode()
@@ -53,9 +53,13 @@ class BatchConfluentMetricsSettingsProvider(
         }
 
 
+_PROVIDER = ConfluentMetricsSettingsProvider()
+_BATCH_PROVIDER = BatchConfluentMetricsSettingsProvider()
+
+
 def settings_provider_factory(
     msg: Union["Message", Sequence["Message"], None],
 ) -> ConfluentMetricsSettingsProvider | BatchConfluentMetricsSettingsProvider:
     if isinstance(msg, Sequence):
-        return BatchConfluentMetricsSettingsProvider()
-    return ConfluentMetricsSettingsProvider()
+        return _BATCH_PROVIDER
+    return _PROVIDER
@@ -27,6 +27,7 @@ class KafkaSubscriberConfig(SubscriberUsecaseConfig):
     topics: Sequence[str] = field(default_factory=list)
     partitions: Sequence["TopicPartition"] = field(default_factory=list)
     polling_interval: float = 0.1
+    poll_batch_size: int | None = None
     group_id: str | None = None
     connection_data: dict[str, Any] = field(default_factory=dict)
 
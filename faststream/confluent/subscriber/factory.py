@@ -24,6 +24,7 @@ def create_subscriber(
     *topics: str,
     partitions: Sequence["TopicPartition"],
     polling_interval: float,
+    poll_batch_size: int | None,
     batch: bool,
     max_records: int | None,
     # Kafka information
@@ -35,6 +36,7 @@ def create_subscriber(
     no_ack: bool,
     max_workers: int,
     no_reply: bool,
+    log_sample_rate: float | None,
     config: "KafkaBrokerConfig",
     # Specification args
     title_: str | None,
@@ -49,15 +51,19 @@ def create_subscriber(
         no_ack=no_ack,
         auto_commit=auto_commit,
         max_workers=max_workers,
+        batch=batch,
+        poll_batch_size=poll_batch_size,
     )
 
     subscriber_config = KafkaSubscriberConfig(
         topics=topics,
         partitions=partitions,
         polling_interval=polling_interval,
+        poll_batch_size=poll_batch_size,
         group_id=group_id,
         connection_data=connection_data,
         no_reply=no_reply,
+        log_sample_rate=log_sample_rate,
         _outer_config=config,
         _ack_policy=ack_policy,
         # deprecated options to remove in 0.7.0
@@ -104,6 +110,8 @@ def _validate_input_for_misconfigure(
     auto_commit: bool,
     no_ack: bool,
     max_workers: int,
+    batch: bool,
+    poll_batch_size: int | None,
     group_id: str | None,
     partitions: Iterable["TopicPartition"],
 ) -> None:
@@ -140,6 +148,15 @@ def _validate_input_for_misconfigure(
         msg = "Max workers not work with manual commit mode."
         raise SetupError(msg)
 
+    if poll_batch_size is not None:
+        if batch:
+            msg = "`poll_batch_size` is not supported by batch subscriber, use `max_records` instead."
+            raise SetupError(msg)
+
+        if poll_batch_size < 1:
+            msg = "`poll_batch_size` should be a positive number."
+            raise SetupError(msg)
+
     if not topics and not partitions:
         msg = "You should provide either `topics` or `partitions`."
         raise SetupError(msg)
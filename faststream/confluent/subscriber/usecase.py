@@ -59,6 +59,7 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
 
         self.consumer = None
         self.polling_interval = config.polling_interval
+        self.poll_batch_size = config.poll_batch_size
 
     @property
     def client_id(self) -> str | None:
@@ -82,6 +83,7 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
             partitions=self.partitions,
             group_id=self.group_id,
             client_id=self.client_id,
+            poll_batch_size=self.poll_batch_size,
             **self.__connection_data,
         )
         self.parser._setup(consumer)
@@ -1,4 +1,4 @@
-from collections.abc import Callable, Generator, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from contextlib import ExitStack, contextmanager
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional, cast
@@ -9,6 +9,7 @@ from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.testing.broker import TestBroker, change_producer
+from faststream._internal.testing.routing import RoutingIndex, RoutingTable
 from faststream.confluent.broker import KafkaBroker
 from faststream.confluent.parser import AsyncConfluentParser
 from faststream.confluent.publisher.producer import AsyncConfluentFastProducer
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.endpoint.subscriber import SubscriberUsecase
     from faststream.confluent.publisher.usecase import LogicPublisher
     from faststream.confluent.response import KafkaPublishCommand
     from faststream.confluent.subscriber.usecase import LogicSubscriber
@@ -107,6 +109,8 @@ class FakeProducer(AsyncConfluentFastProducer):
         self._parser = ParserComposition(broker._parser, default.parse_message)
         self._decoder = ParserComposition(broker._decoder, default.decode_message)
 
+        self._routes = RoutingTable(broker, _build_routes)
+
     def __bool__(self) -> bool:
         return True
 
@@ -129,7 +133,7 @@ class FakeProducer(AsyncConfluentFastProducer):
         )
 
         for handler in _find_handler(
-            cast("Iterable[LogicSubscriber[Any]]", self.broker.subscribers),
+            self._routes.index.match(cmd.destination),
             cmd.destination,
             cmd.partition,
         ):
@@ -141,7 +145,7 @@ class FakeProducer(AsyncConfluentFastProducer):
     async def publish_batch(self, cmd: "KafkaPublishCommand") -> None:
         """Publish a batch of messages to the Kafka broker."""
         for handler in _find_handler(
-            cast("Iterable[LogicSubscriber[Any]]", self.broker.subscribers),
+            self._routes.index.match(cmd.destination),
             cmd.destination,
             cmd.partition,
         ):
@@ -180,7 +184,7 @@ class FakeProducer(AsyncConfluentFastProducer):
         )
 
         for handler in _find_handler(
-            cast("Iterable[LogicSubscriber[Any]]", self.broker.subscribers),
+            self._routes.index.match(cmd.destination),
             cmd.destination,
             cmd.partition,
         ):
@@ -309,6 +313,18 @@ def _fake_connection(*args: Any, **kwargs: Any) -> AsyncMock:
     return mock
 
 
+def _build_routes(
+    subscribers: Sequence["SubscriberUsecase[Any]"],
+) -> RoutingIndex["LogicSubscriber[Any]"]:
+    index: RoutingIndex[LogicSubscriber[Any]] = RoutingIndex()
+
+    for handler in cast("Sequence[LogicSubscriber[Any]]", subscribers):
+        for topic in {*handler.topics, *(p.topic for p in handler.partitions)}:
+            index.add(topic, handler)
+
+    return index
+
+
 def _find_handler(
     subscribers: Iterable["LogicSubscriber[Any]"],
     topic: str,
@@ -210,6 +210,9 @@ class KafkaBroker(
         enable_idempotence: bool = False,
         transactional_id: str | None = None,
         transaction_timeout_ms: int = 60 * 1000,
+        # RPC args
+        rpc_reply_topic: str | None = None,
+        rpc_replication_factor: int = 1,
         # broker base args
         graceful_timeout: float | None = 15.0,
         decoder: Optional["CustomCallable"] = None,
@@ -227,6 +230,8 @@ class KafkaBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue_size: int | None = None,
+        log_sample_rate: float = 1.0,
         # FastDepends args
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
@@ -306,6 +311,11 @@ class KafkaBroker(
                 Transactional id for the producer.
             transaction_timeout_ms (int):
                 Transaction timeout in milliseconds.
+            rpc_reply_topic (Optional[str]):
+                Existing topic to consume `request` responses from. It can be shared between processes and is never deleted.
+                If not set, a temporary reply topic is created on the first request and deleted on disconnect.
+            rpc_replication_factor (int):
+                Replication factor of the temporary reply topic.
             graceful_timeout (Optional[float]):
                 Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
             decoder (Optional[CustomCallable]):
@@ -334,6 +344,10 @@ class KafkaBroker(
                 User specified logger to pass into Context and log service messages.
             log_level (int):
                 Service messages log level.
+            log_queue_size (Optional[int]):
+                Size of the queue to write service messages from a background thread. Messages are written synchronously if not set.
+            log_sample_rate (float):
+                Share of consumed messages to write `Received` and `Processed` lines for.
             apply_types (bool):
                 Whether to use FastDepends or not.
             serializer (Optional[SerializerProto]):
@@ -402,6 +416,8 @@ class KafkaBroker(
                 producer=AioKafkaFastProducerImpl(
                     parser=parser,
                     decoder=decoder,
+                    reply_topic=rpc_reply_topic,
+                    reply_topic_replication_factor=rpc_replication_factor,
                 ),
                 # both args,
                 broker_decoder=decoder,
@@ -410,6 +426,8 @@ class KafkaBroker(
                 logger=make_kafka_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    queue_size=log_queue_size,
+                    sample_rate=log_sample_rate,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
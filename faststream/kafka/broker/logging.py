@@ -1,6 +1,5 @@
 import logging
-from functools import partial
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from faststream._internal.logger import DefaultLoggerStorage, make_logger_state
 from faststream._internal.logger.logging import get_broker_logger
@@ -8,6 +7,7 @@ from faststream._internal.logger.logging import get_broker_logger
 if TYPE_CHECKING:
     from faststream._internal.basic_types import LoggerProto
     from faststream._internal.context import ContextRepo
+    from faststream._internal.logger import LoggerState
 
 
 class KafkaParamsStorage(DefaultLoggerStorage):
@@ -67,7 +67,16 @@ class KafkaParamsStorage(DefaultLoggerStorage):
         return lg
 
 
-make_kafka_logger_state = partial(
-    make_logger_state,
-    default_storage_cls=KafkaParamsStorage,
-)
+def make_kafka_logger_state(
+    logger: Optional["LoggerProto"],
+    log_level: int,
+    queue_size: int | None = None,
+    sample_rate: float = 1.0,
+) -> "LoggerState":
+    return make_logger_state(
+        logger=logger,
+        log_level=log_level,
+        default_storage_cls=KafkaParamsStorage,
+        queue_size=queue_size,
+        sample_rate=sample_rate,
+    )
@@ -40,6 +40,7 @@ if TYPE_CHECKING:
     )
     from faststream.kafka.subscriber.usecase import (
         BatchSubscriber,
+        ConcurrentBetweenKeysSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
         DefaultSubscriber,
@@ -91,6 +92,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -113,8 +115,12 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: None = None,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -158,6 +164,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -180,8 +187,12 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: None = None,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -225,6 +236,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -247,8 +259,12 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int = ...,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -292,6 +308,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -314,8 +331,12 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int = ...,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -359,6 +380,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -381,8 +403,12 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -392,6 +418,7 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentBetweenKeysSubscriber",
     ]: ...
 
     @override
@@ -431,6 +458,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -453,8 +481,12 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -464,6 +496,7 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentBetweenKeysSubscriber",
     ]:
         """Create a subscriber for Kafka topics.
 
@@ -612,6 +645,9 @@ class KafkaRegistrator(
                 with any records that are available currently in the buffer,
                 else returns empty.
             max_records: Number of messages to consume as one batch.
+            batch_latency_ms: Target batch processing time in milliseconds.
+                If set, batch size adapts between 1 and `max_records` to
+                keep each batch processing time close to this value.
             listener:
                 Optionally include listener
                 callback, which will be called before and after each rebalance
@@ -643,9 +679,21 @@ class KafkaRegistrator(
             decoder: Function to decode FastStream msg bytes body to python objects.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             max_workers: Number of workers to process messages concurrently.
+            ordered_by_key:
+                Whether to process messages with different keys concurrently
+                by `max_workers` workers of a single consumer keeping the order
+                of messages with the same key.
+            commit_batch_size:
+                Number of processed messages to commit their offsets at once.
+                Offsets are committed only up to the first unprocessed message
+                of a partition. Works with manual acknowledgement policies only.
+            commit_interval_ms:
+                Milliseconds between commits of processed messages offsets
+                if `commit_batch_size` is greater than 1.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             title: Specification subscriber object title.
             description: Specification subscriber object description. " "Uses decorated docstring as default.
             include_in_schema: Whetever to include operation in Specification schema or not.
@@ -657,8 +705,10 @@ class KafkaRegistrator(
             *topics,
             batch=batch,
             max_workers=workers,
+            ordered_by_key=ordered_by_key,
             batch_timeout_ms=batch_timeout_ms,
             max_records=max_records,
+            batch_latency_ms=batch_latency_ms,
             group_id=group_id,
             listener=listener,
             pattern=pattern,
@@ -687,8 +737,11 @@ class KafkaRegistrator(
             ack_policy=ack_policy,
             no_ack=no_ack,
             auto_commit=auto_commit,
+            commit_batch_size=commit_batch_size,
+            commit_interval_ms=commit_interval_ms,
             # subscriber args
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             config=cast("KafkaBrokerConfig", self.config),
             # Specification
             title_=title,
@@ -709,6 +762,8 @@ class KafkaRegistrator(
             return cast("BatchSubscriber", subscriber)
 
         if workers > 1:
+            if ordered_by_key:
+                return cast("ConcurrentBetweenKeysSubscriber", subscriber)
             if auto_commit:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
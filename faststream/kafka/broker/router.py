@@ -154,6 +154,7 @@ class KafkaRoute(SubscriberRoute):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Iterable["TopicPartition"] | None = (),
@@ -177,11 +178,15 @@ class KafkaRoute(SubscriberRoute):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI args
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int | None = None,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
     ) -> None:
         """Initialize KafkaRoute.
 
@@ -333,6 +338,9 @@ class KafkaRoute(SubscriberRoute):
                 with any records that are available currently in the buffer,
                 else returns empty.
             max_records: Number of messages to consume as one batch.
+            batch_latency_ms: Target batch processing time in milliseconds.
+                If set, batch size adapts between 1 and `max_records` to
+                keep each batch processing time close to this value.
             listener:
                 Optionally include listener
                 callback, which will be called before and after each rebalance
@@ -364,18 +372,33 @@ class KafkaRoute(SubscriberRoute):
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: AckPolicy = EMPTY,
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             title: AsyncAPI subscriber object title.
             description:
                 AsyncAPI subscriber object description.
                 Uses decorated docstring as default.
             include_in_schema: Whetever to include operation in AsyncAPI schema or not.
             max_workers: Number of workers to process messages concurrently.
+            ordered_by_key:
+                Whether to process messages with different keys concurrently
+                by `max_workers` workers of a single consumer keeping the order
+                of messages with the same key.
+            commit_batch_size:
+                Number of processed messages to commit their offsets at once.
+                Offsets are committed only up to the first unprocessed message
+                of a partition. Works with manual acknowledgement policies only.
+            commit_interval_ms:
+                Milliseconds between commits of processed messages offsets
+                if `commit_batch_size` is greater than 1.
         """
         super().__init__(
             call,
             *topics,
             publishers=publishers,
             max_workers=max_workers,
+            ordered_by_key=ordered_by_key,
+            commit_batch_size=commit_batch_size,
+            commit_interval_ms=commit_interval_ms,
             group_id=group_id,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
@@ -397,6 +420,7 @@ class KafkaRoute(SubscriberRoute):
             exclude_internal_topics=exclude_internal_topics,
             isolation_level=isolation_level,
             max_records=max_records,
+            batch_latency_ms=batch_latency_ms,
             batch_timeout_ms=batch_timeout_ms,
             batch=batch,
             listener=listener,
@@ -408,6 +432,7 @@ class KafkaRoute(SubscriberRoute):
             decoder=decoder,
             middlewares=middlewares,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             ack_policy=ack_policy,
             no_ack=no_ack,
             # AsyncAPI args
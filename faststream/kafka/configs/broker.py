@@ -38,9 +38,6 @@ class KafkaBrokerConfig(BrokerConfig):
         return self._admin_client
 
     async def connect(self, **connection_kwargs: Any) -> "None":
-        producer = aiokafka.AIOKafkaProducer(**connection_kwargs)
-        await self.producer.connect(producer, serializer=self.fd_config._serializer)
-
         admin_options, _ = filter_by_dict(
             AdminClientConnectionParams,
             connection_kwargs,
@@ -55,9 +52,18 @@ class KafkaBrokerConfig(BrokerConfig):
         )
         self.builder = partial(aiokafka.AIOKafkaConsumer, **consumer_options)
 
+        producer = aiokafka.AIOKafkaProducer(**connection_kwargs)
+        await self.producer.connect(
+            producer,
+            serializer=self.fd_config._serializer,
+            builder=self.builder,
+            admin_client=self._admin_client,
+        )
+
     async def disconnect(self) -> "None":
+        # RPC reply topic is deleted by the admin client, so close it last
+        await self.producer.disconnect()
+
         if self._admin_client is not None:
             await self._admin_client.close()
             self._admin_client = None
-
-        await self.producer.disconnect()
@@ -54,6 +54,7 @@ if TYPE_CHECKING:
     )
     from faststream.kafka.subscriber.usecase import (
         BatchSubscriber,
+        ConcurrentBetweenKeysSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
         DefaultSubscriber,
@@ -100,6 +101,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         enable_idempotence: bool = False,
         transactional_id: str | None = None,
         transaction_timeout_ms: int = 60 * 1000,
+        # RPC args
+        rpc_reply_topic: str | None = None,
+        rpc_replication_factor: int = 1,
         # broker base args
         graceful_timeout: float | None = 15.0,
         decoder: Optional["CustomCallable"] = None,
@@ -116,6 +120,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue_size: int | None = None,
+        log_sample_rate: float = 1.0,
         # StreamRouter options
         setup_state: bool = True,
         schema_url: str | None = "/asyncapi",
@@ -248,12 +254,17 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             specification: Specification factory to use.
             transactional_id: Transactional ID to use.
             transaction_timeout_ms: Transaction timeout in milliseconds.
+            rpc_reply_topic: Existing topic to consume `request` responses from.
+                A temporary reply topic is created on the first request if not set.
+            rpc_replication_factor: Replication factor of the temporary reply topic.
             loop: Event loop to use.
             sasl_kerberos_service_name: SASL Kerberos service name.
             sasl_kerberos_domain_name: SASL Kerberos domain name.
             # logging args
             logger: User specified logger to pass into Context and log service messages.
             log_level: Service messages log level.
+            log_queue_size: Size of the queue to write service messages from a background thread. Messages are written synchronously if not set.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for.
             # StreamRouter options
             setup_state:  Whether to add broker to app scope in lifespan.
                 You should disable this option at old ASGI servers.
@@ -348,6 +359,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             enable_idempotence=enable_idempotence,
             transactional_id=transactional_id,
             transaction_timeout_ms=transaction_timeout_ms,
+            # RPC args
+            rpc_reply_topic=rpc_reply_topic,
+            rpc_replication_factor=rpc_replication_factor,
             # broker args
             graceful_timeout=graceful_timeout,
             decoder=decoder,
@@ -359,6 +373,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             # Logging args
             logger=logger,
             log_level=log_level,
+            log_queue_size=log_queue_size,
+            log_sample_rate=log_sample_rate,
             # Specification args
             security=security,
             protocol=protocol,
@@ -424,6 +440,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -446,8 +463,12 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: None = None,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -499,6 +520,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -521,8 +543,12 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: None = None,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -574,6 +600,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -596,8 +623,12 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: int = ...,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -649,6 +680,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -671,8 +703,12 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: int = ...,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -724,6 +760,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -746,8 +783,12 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -765,6 +806,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentBetweenKeysSubscriber",
     ]: ...
 
     @override
@@ -804,6 +846,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         ] = "read_uncommitted",
         batch_timeout_ms: int = 200,
         max_records: int | None = None,
+        batch_latency_ms: int | None = None,
         listener: Optional["ConsumerRebalanceListener"] = None,
         pattern: str | None = None,
         partitions: Collection["TopicPartition"] = (),
@@ -826,8 +869,12 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordered_by_key: bool = False,
+        commit_batch_size: int = 1,
+        commit_interval_ms: int = 1000,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # Specification args
         title: str | None = None,
         description: str | None = None,
@@ -845,6 +892,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentBetweenKeysSubscriber",
     ]:
         """Create a subscriber for Kafka topics.
 
@@ -993,6 +1041,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
                 with any records that are available currently in the buffer,
                 else returns empty.
             max_records: Number of messages to consume as one batch.
+            batch_latency_ms: Target batch processing time in milliseconds.
+                If set, batch size adapts between 1 and `max_records` to
+                keep each batch processing time close to this value.
             listener:
                 Optionally include listener
                 callback, which will be called before and after each rebalance
@@ -1024,9 +1075,21 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             decoder: Function to decode FastStream msg bytes body to python objects.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             max_workers: Number of workers to process messages concurrently.
+            ordered_by_key:
+                Whether to process messages with different keys concurrently
+                by `max_workers` workers of a single consumer keeping the order
+                of messages with the same key.
+            commit_batch_size:
+                Number of processed messages to commit their offsets at once.
+                Offsets are committed only up to the first unprocessed message
+                of a partition. Works with manual acknowledgement policies only.
+            commit_interval_ms:
+                Milliseconds between commits of processed messages offsets
+                if `commit_batch_size` is greater than 1.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             title: Specification subscriber object title.
             description: Specification subscriber object description. " "Uses decorated docstring as default.
             include_in_schema: Whetever to include operation in Specification schema or not.
@@ -1095,6 +1158,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             *topics,
             group_id=group_id,
             max_workers=max_workers,
+            ordered_by_key=ordered_by_key,
+            commit_batch_size=commit_batch_size,
+            commit_interval_ms=commit_interval_ms,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
             fetch_max_wait_ms=fetch_max_wait_ms,
@@ -1116,6 +1182,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             isolation_level=isolation_level,
             batch=batch,
             max_records=max_records,
+            batch_latency_ms=batch_latency_ms,
             batch_timeout_ms=batch_timeout_ms,
             listener=listener,
             pattern=pattern,
@@ -1128,6 +1195,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             ack_policy=ack_policy,
             no_ack=no_ack,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             title=title,
             description=description,
             include_in_schema=include_in_schema,
@@ -1147,6 +1215,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             return cast("BatchSubscriber", subscriber)
 
         if workers > 1:
+            if ordered_by_key:
+                return cast("ConcurrentBetweenKeysSubscriber", subscriber)
             if auto_commit:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
@@ -0,0 +1,137 @@
+from collections import deque
+from typing import TYPE_CHECKING
+
+import anyio
+from aiokafka import TopicPartition
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaConsumer, ConsumerRecord
+
+
+class _PartitionOffsets:
+    """Offsets of one partition records in the order they were consumed."""
+
+    __slots__ = ("done", "pending", "watermark")
+
+    def __init__(self) -> None:
+        self.pending: deque[int] = deque()
+        self.done: set[int] = set()
+        self.watermark: int | None = None
+
+    def add(self, offset: int) -> None:
+        self.pending.append(offset)
+
+    def complete(self, offset: int) -> bool:
+        """Mark offset as processed.
+
+        Returns whether the committable watermark was moved.
+        """
+        if self.pending and self.pending[0] <= offset <= self.pending[-1]:
+            self.done.add(offset)
+
+        moved = False
+        while self.pending and self.pending[0] in self.done:
+            completed = self.pending.popleft()
+            self.done.discard(completed)
+            self.watermark = completed + 1
+            moved = True
+
+        return moved
+
+    def reset(self, offset: int) -> None:
+        """Forget all records from offset, they will be consumed again."""
+        while self.pending and self.pending[-1] >= offset:
+            self.done.discard(self.pending.pop())
+
+
+class OffsetTracker:
+    """Tracks records processed out of order to commit only completed offsets.
+
+    Committed offset of a partition never moves past a record that
+    is still in processing, even if the next records are already processed.
+    Commit is sent once `commit_batch_size` records are processed, the rest
+    offsets should be committed by explicit `commit()` call.
+    """
+
+    def __init__(
+        self,
+        consumer: "AIOKafkaConsumer",
+        *,
+        commit_batch_size: int = 1,
+    ) -> None:
+        self.consumer = consumer
+        self.commit_batch_size = commit_batch_size
+
+        self._partitions: dict[TopicPartition, _PartitionOffsets] = {}
+        self._completed = 0
+        self._commit_lock = anyio.Lock()
+
+    def track(self, record: "ConsumerRecord") -> "TrackedConsumer":
+        tp = TopicPartition(record.topic, record.partition)
+
+        if (offsets := self._partitions.get(tp)) is None:
+            offsets = self._partitions[tp] = _PartitionOffsets()
+
+        offsets.add(record.offset)
+
+        return TrackedConsumer(self, tp, record.offset)
+
+    async def complete(self, partition: TopicPartition, offset: int) -> None:
+        if (offsets := self._partitions.get(partition)) is None:
+            return
+
+        self._completed += 1
+
+        if offsets.complete(offset) and self._completed >= self.commit_batch_size:
+            await self.commit()
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        if (offsets := self._partitions.get(partition)) is not None:
+            offsets.reset(offset)
+
+        self.consumer.seek(partition, offset)
+
+    async def commit(self) -> None:
+        # commit calls are serialized to never move offset back
+        async with self._commit_lock:
+            self._completed = 0
+
+            assignment = self.consumer.assignment()
+
+            for tp in tuple(self._partitions):
+                # partition was revoked and can't be committed anymore
+                if tp not in assignment:
+                    del self._partitions[tp]
+
+            if offsets := {
+                tp: p.watermark
+                for tp, p in self._partitions.items()
+                if p.watermark is not None
+            }:
+                await self.consumer.commit(offsets)
+
+                for tp, watermark in offsets.items():
+                    if self._partitions[tp].watermark == watermark:
+                        self._partitions[tp].watermark = None
+
+
+class TrackedConsumer:
+    """Consumer proxy to acknowledge a tracked record."""
+
+    __slots__ = ("offset", "partition", "tracker")
+
+    def __init__(
+        self,
+        tracker: OffsetTracker,
+        partition: TopicPartition,
+        offset: int,
+    ) -> None:
+        self.tracker = tracker
+        self.partition = partition
+        self.offset = offset
+
+    async def commit(self) -> None:
+        await self.tracker.complete(self.partition, self.offset)
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        self.tracker.seek(partition, offset)
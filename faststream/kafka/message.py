@@ -6,6 +6,7 @@ from aiokafka import (
     TopicPartition as AIOKafkaTopicPartition,
 )
 
+from faststream.kafka.helpers.offsets import TrackedConsumer
 from faststream.message import AckStatus, StreamMessage
 
 
@@ -56,6 +57,8 @@ class KafkaMessage(
     This class extends `StreamMessage` and is specialized for handling Kafka ConsumerRecord objects.
     """
 
+    __slots__ = ("consumer",)
+
     def __init__(self, *args: Any, consumer: ConsumerProtocol, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.consumer = consumer
@@ -63,6 +66,8 @@ class KafkaMessage(
 
 
 class KafkaAckableMessage(KafkaMessage):
+    __slots__ = ()
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.committed = None
@@ -90,3 +95,10 @@ class KafkaAckableMessage(KafkaMessage):
                 offset=raw_message.offset,
             )
         await super().nack()
+
+    async def reject(self) -> None:
+        """Reject the Kafka message without redelivery."""
+        if not self.committed and isinstance(self.consumer, TrackedConsumer):
+            # skipped record shouldn't block commits of the next offsets
+            await self.consumer.commit()
+        await super().reject()
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from collections.abc import Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from faststream.kafka.message import (
     FAKE_CONSUMER,
@@ -6,7 +8,7 @@ from faststream.kafka.message import (
     KafkaMessage,
     KafkaRawMessage,
 )
-from faststream.message import decode_message
+from faststream.message import decode_batch_bodies, decode_message
 
 if TYPE_CHECKING:
     from re import Pattern
@@ -71,22 +73,18 @@ class AioKafkaBatchParser(AioKafkaParser):
         message: tuple["ConsumerRecord", ...],
     ) -> "StreamMessage[tuple[ConsumerRecord, ...]]":
         """Parses a batch of messages from a Kafka consumer."""
-        body: list[Any] = []
-        batch_headers: list[dict[str, str]] = []
+        body: list[Any] = [m.value or b"" for m in message]
 
         first = message[0]
         last = message[-1]
 
-        for m in message:
-            body.append(m.value or b"")
-            batch_headers.append({i: j.decode() for i, j in m.headers})
-
-        headers = next(iter(batch_headers), {})
+        headers = {i: j.decode() for i, j in first.headers}
 
         return self.msg_class(
             body=body,
             headers=headers,
-            batch_headers=batch_headers,
+            # decode other records headers only if they are requested
+            batch_headers=partial(_decode_batch_headers, message, headers),
             reply_to=headers.get("reply_to", ""),
             content_type=headers.get("content-type"),
             message_id=f"{first.offset}-{last.offset}-{first.timestamp}",
@@ -101,7 +99,21 @@ class AioKafkaBatchParser(AioKafkaParser):
         msg: "StreamMessage[tuple[ConsumerRecord, ...]]",
     ) -> "DecodedMessage":
         """Decode a batch of messages."""
-        # super() should be here due python can't find it in comprehension
-        super_obj = cast("AioKafkaParser", super())
+        return decode_batch_bodies(
+            [m.value or b"" for m in msg.raw_message],
+            [_get_content_type(m.headers) for m in msg.raw_message],
+        )
+
+
+def _decode_batch_headers(
+    message: tuple["ConsumerRecord", ...],
+    first_headers: dict[str, str],
+) -> list[dict[str, str]]:
+    return [first_headers, *({i: j.decode() for i, j in m.headers} for m in message[1:])]
+
 
-        return [decode_message(await super_obj.parse_message(m)) for m in msg.raw_message]
+def _get_content_type(headers: Sequence[tuple[str, bytes]]) -> str | None:
+    for key, value in headers:
+        if key == "content-type":
+            return value.decode()
+    return None
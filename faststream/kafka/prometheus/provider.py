@@ -51,9 +51,13 @@ class BatchKafkaMetricsSettingsProvider(
         }
 
 
+_PROVIDER = KafkaMetricsSettingsProvider()
+_BATCH_PROVIDER = BatchKafkaMetricsSettingsProvider()
+
+
 def settings_provider_factory(
     msg: Union["ConsumerRecord", Sequence["ConsumerRecord"], None],
 ) -> KafkaMetricsSettingsProvider | BatchKafkaMetricsSettingsProvider:
     if isinstance(msg, Sequence):
-        return BatchKafkaMetricsSettingsProvider()
-    return KafkaMetricsSettingsProvider()
+        return _BATCH_PROVIDER
+    return _PROVIDER
@@ -1,34 +1,86 @@
+import asyncio
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Optional, Union
-
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, Any, Optional, Protocol, Union
+
+import anyio
+from aiokafka import TopicPartition
+from aiokafka.admin import NewTopic
+from aiokafka.errors import ConsumerStoppedError, KafkaError
 from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
+from faststream._internal.logger import logger
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException
+from faststream._internal.utils.nuid import NUID
+from faststream.exceptions import FeatureNotSupportedException, IncorrectState
 from faststream.kafka.exceptions import BatchBufferOverflowException
 from faststream.kafka.message import KafkaMessage
 from faststream.kafka.parser import AioKafkaParser
 from faststream.kafka.response import KafkaPublishCommand
-from faststream.message import encode_message
+from faststream.message import encode_message, gen_cor_id
 
 from .state import EmptyProducerState, ProducerState, RealProducer
 
 if TYPE_CHECKING:
-    import asyncio
-
-    from aiokafka import AIOKafkaProducer
+    from aiokafka import AIOKafkaConsumer, AIOKafkaProducer, ConsumerRecord
+    from aiokafka.admin.client import AIOKafkaAdminClient
     from aiokafka.structs import RecordMetadata
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.types import CustomCallable
 
 
+class RPCState(Protocol):
+    @property
+    def rpc(self) -> "_RPCConsumer": ...
+
+    async def disconnect(self) -> None: ...
+
+
+class RPCUnset:
+    __slots__ = ()
+
+    @property
+    def rpc(self) -> "_RPCConsumer":
+        msg = "You should call `producer.connect()` method at first."
+        raise IncorrectState(msg)
+
+    async def disconnect(self) -> None:
+        pass
+
+
+class RealRPC:
+    __slots__ = ("rpc",)
+
+    def __init__(
+        self,
+        builder: Callable[..., "AIOKafkaConsumer"],
+        admin_client: "AIOKafkaAdminClient",
+        *,
+        reply_topic: str | None,
+        replication_factor: int,
+    ) -> None:
+        self.rpc = _RPCConsumer(
+            builder,
+            admin_client,
+            reply_topic=reply_topic,
+            replication_factor=replication_factor,
+        )
+
+    async def disconnect(self) -> None:
+        await self.rpc.disconnect()
+
+
 class AioKafkaFastProducer(ProducerProto[KafkaPublishCommand]):
     async def connect(
         self,
         producer: "AIOKafkaProducer",
         serializer: Optional["SerializerProto"],
+        *,
+        builder: Callable[..., "AIOKafkaConsumer"],
+        admin_client: "AIOKafkaAdminClient",
     ) -> None: ...
 
     async def disconnect(self) -> None: ...
@@ -67,10 +119,17 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
         self,
         parser: Optional["CustomCallable"],
         decoder: Optional["CustomCallable"],
+        *,
+        reply_topic: str | None = None,
+        reply_topic_replication_factor: int = 1,
     ) -> None:
         self._producer: ProducerState = EmptyProducerState()
+        self.__rpc: RPCState = RPCUnset()
         self.serializer: SerializerProto | None = None
 
+        self._reply_topic = reply_topic
+        self._reply_topic_replication_factor = reply_topic_replication_factor
+
         # NOTE: register default parser to be compatible with request
         default = AioKafkaParser(msg_class=KafkaMessage, regex=None)
         self._parser = ParserComposition(parser, default.parse_message)
@@ -80,12 +139,24 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
         self,
         producer: "AIOKafkaProducer",
         serializer: Optional["SerializerProto"],
+        *,
+        builder: Callable[..., "AIOKafkaConsumer"],
+        admin_client: "AIOKafkaAdminClient",
     ) -> None:
         self.serializer = serializer
         await producer.start()
         self._producer = RealProducer(producer)
+        self.__rpc = RealRPC(
+            builder,
+            admin_client,
+            reply_topic=self._reply_topic,
+            replication_factor=self._reply_topic_replication_factor,
+        )
 
     async def disconnect(self) -> None:
+        await self.__rpc.disconnect()
+        self.__rpc = RPCUnset()
+
         await self._producer.stop()
         self._producer = EmptyProducerState()
 
@@ -125,6 +196,20 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
             return await send_future
         return send_future
 
+    @override
+    async def request(self, cmd: "KafkaPublishCommand") -> "ConsumerRecord":
+        rpc = self.__rpc.rpc
+        await rpc.start()
+
+        cmd.correlation_id = cmd.correlation_id or gen_cor_id()
+        cmd.reply_to = rpc.topic
+        cmd.no_confirm = False
+
+        with rpc.wait_reply(cmd.correlation_id) as response:
+            with anyio.fail_after(cmd.timeout):
+                await self.publish(cmd)
+                return await response
+
     @override
     async def publish_batch(
         self,
@@ -170,6 +255,9 @@ class FakeAioKafkaFastProducer(AioKafkaFastProducer):
         self,
         producer: "AIOKafkaProducer",
         serializer: Optional["SerializerProto"],
+        *,
+        builder: Callable[..., "AIOKafkaConsumer"],
+        admin_client: "AIOKafkaAdminClient",
     ) -> None:
         raise NotImplementedError
 
@@ -197,3 +285,144 @@ class FakeAioKafkaFastProducer(AioKafkaFastProducer):
         cmd: "KafkaPublishCommand",
     ) -> Union["asyncio.Future[RecordMetadata]", "RecordMetadata"]:
         raise NotImplementedError
+
+
+class _RPCConsumer:
+    """A long-living consumer of the reply topic shared by all RPC requests.
+
+    Without an explicit reply topic, the topic is created for the producer on
+    the first request and deleted on disconnect. A pre-provisioned topic can be
+    shared between processes, so it is read from the end and is never deleted.
+    Responses are routed to waiting requests by `correlation_id`.
+    """
+
+    def __init__(
+        self,
+        builder: Callable[..., "AIOKafkaConsumer"],
+        admin_client: "AIOKafkaAdminClient",
+        *,
+        reply_topic: str | None = None,
+        replication_factor: int = 1,
+    ) -> None:
+        self.topic = reply_topic or f"faststream-reply-{NUID().next().decode()}"
+        self.temporary = reply_topic is None
+
+        self._builder = builder
+        self._admin_client = admin_client
+        self._replication_factor = replication_factor
+
+        self.lock = anyio.Lock()
+        self.consumer: AIOKafkaConsumer | None = None
+        self.responses: dict[str, asyncio.Future[ConsumerRecord]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self.consumer is not None:
+            return
+
+        async with self.lock:
+            if self.consumer is None:
+                if self.temporary:
+                    await self._admin_client.create_topics([
+                        NewTopic(
+                            self.topic,
+                            num_partitions=1,
+                            replication_factor=self._replication_factor,
+                        ),
+                    ])
+
+                # the temporary topic is brand new, so nothing is skipped by reading it from start
+                consumer = self._builder(
+                    group_id=None,
+                    enable_auto_commit=False,
+                    auto_offset_reset="earliest",
+                )
+                await consumer.start()
+
+                try:
+                    await self._assign(consumer)
+                except BaseException:
+                    await consumer.stop()
+                    raise
+
+                self._task = asyncio.create_task(self._consume(consumer))
+                self.consumer = consumer
+
+    async def _assign(self, consumer: "AIOKafkaConsumer") -> None:
+        if self.temporary:
+            consumer.assign([TopicPartition(self.topic, 0)])
+            return
+
+        # responses can be published to any partition of a shared topic
+        await consumer.topics()
+        if not (partitions := consumer.partitions_for_topic(self.topic)):
+            msg = f"RPC reply topic `{self.topic}` does not exist."
+            raise IncorrectState(msg)
+
+        consumer.assign([TopicPartition(self.topic, p) for p in partitions])
+        await consumer.seek_to_end()
+
+    async def disconnect(self) -> None:
+        for future in self.responses.values():
+            if not future.done():
+                future.cancel()
+
+        self.responses.clear()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self.consumer is not None:
+            await self.consumer.stop()
+            self.consumer = None
+
+            if self.temporary:
+                with suppress(KafkaError):
+                    await self._admin_client.delete_topics([self.topic])
+
+    @contextmanager
+    def wait_reply(
+        self,
+        correlation_id: str,
+    ) -> Iterator["asyncio.Future[ConsumerRecord]"]:
+        if correlation_id in self.responses:
+            msg = f"RPC request with `correlation_id={correlation_id}` is already waiting for response."
+            raise IncorrectState(msg)
+
+        future = self.responses[correlation_id] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+        try:
+            yield future
+        finally:
+            self.responses.pop(correlation_id, None)
+
+    async def _consume(self, consumer: "AIOKafkaConsumer") -> None:
+        while True:
+            try:
+                record = await consumer.getone()
+            except ConsumerStoppedError:
+                return
+            except KafkaError:
+                await anyio.sleep(5)
+                continue
+
+            self._on_response(record)
+
+    def _on_response(self, record: "ConsumerRecord") -> None:
+        correlation_id = next(
+            (v.decode() for k, v in record.headers if k == "correlation_id"),
+            "",
+        )
+
+        if (future := self.responses.get(correlation_id)) is None:
+            # a late response to a timed out request or a response with
+            # overridden `correlation_id`, it can't be matched safely
+            logger.debug(
+                f"Drop RPC response with unknown `correlation_id={correlation_id}`",
+            )
+
+        elif not future.done():
+            future.set_result(record)
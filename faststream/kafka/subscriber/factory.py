@@ -11,6 +11,7 @@ from .config import KafkaSubscriberConfig, KafkaSubscriberSpecificationConfig
 from .specification import KafkaSubscriberSpecification
 from .usecase import (
     BatchSubscriber,
+    ConcurrentBetweenKeysSubscriber,
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
     DefaultSubscriber,
@@ -28,6 +29,7 @@ def create_subscriber(
     batch: bool,
     batch_timeout_ms: int,
     max_records: int | None,
+    batch_latency_ms: int | None,
     # Kafka information
     group_id: str | None,
     listener: Optional["ConsumerRebalanceListener"],
@@ -35,11 +37,15 @@ def create_subscriber(
     connection_args: dict[str, Any],
     partitions: Collection["TopicPartition"],
     auto_commit: bool,
+    commit_batch_size: int,
+    commit_interval_ms: int,
     # Subscriber args
     ack_policy: "AckPolicy",
     max_workers: int,
+    ordered_by_key: bool,
     no_ack: bool,
     no_reply: bool,
+    log_sample_rate: float | None,
     config: "KafkaBrokerConfig",
     # Specification args
     title_: str | None,
@@ -50,6 +56,7 @@ def create_subscriber(
     "BatchSubscriber",
     "ConcurrentDefaultSubscriber",
     "ConcurrentBetweenPartitionsSubscriber",
+    "ConcurrentBetweenKeysSubscriber",
 ]:
     _validate_input_for_misconfigure(
         *topics,
@@ -59,6 +66,11 @@ def create_subscriber(
         no_ack=no_ack,
         auto_commit=auto_commit,
         max_workers=max_workers,
+        ordered_by_key=ordered_by_key,
+        batch=batch,
+        max_records=max_records,
+        batch_latency_ms=batch_latency_ms,
+        commit_batch_size=commit_batch_size,
     )
 
     subscriber_config = KafkaSubscriberConfig(
@@ -68,7 +80,10 @@ def create_subscriber(
         group_id=group_id,
         listener=listener,
         pattern=pattern,
+        commit_batch_size=commit_batch_size,
+        commit_interval_ms=commit_interval_ms,
         no_reply=no_reply,
+        log_sample_rate=log_sample_rate,
         _outer_config=config,
         _ack_policy=ack_policy,
         # deprecated options to remove in 0.7.0
@@ -97,9 +112,18 @@ def create_subscriber(
             calls,
             batch_timeout_ms=batch_timeout_ms,
             max_records=max_records,
+            batch_latency_ms=batch_latency_ms,
         )
 
     if max_workers > 1:
+        if ordered_by_key:
+            return ConcurrentBetweenKeysSubscriber(
+                subscriber_config,
+                specification,
+                calls,
+                max_workers=max_workers,
+            )
+
         if subscriber_config.ack_first:
             return ConcurrentDefaultSubscriber(
                 subscriber_config,
@@ -119,12 +143,17 @@ def create_subscriber(
     return DefaultSubscriber(subscriber_config, specification, calls)
 
 
-def _validate_input_for_misconfigure(
+def _validate_input_for_misconfigure(  # noqa: PLR0915
     *topics: str,
     ack_policy: "AckPolicy",
     auto_commit: bool,
     no_ack: bool,
     max_workers: int,
+    ordered_by_key: bool,
+    batch: bool,
+    max_records: int | None,
+    batch_latency_ms: int | None,
+    commit_batch_size: int,
     pattern: str | None,
     partitions: Iterable["TopicPartition"],
 ) -> None:
@@ -157,7 +186,41 @@ def _validate_input_for_misconfigure(
     if ack_policy is EMPTY:
         ack_policy = AckPolicy.ACK_FIRST
 
-    if max_workers > 1 and ack_policy is not AckPolicy.ACK_FIRST:
+    if commit_batch_size < 1:
+        msg = "`commit_batch_size` should be a positive number."
+        raise SetupError(msg)
+
+    if commit_batch_size > 1:
+        if ack_policy is AckPolicy.ACK_FIRST:
+            msg = "`commit_batch_size` can't be used with `AckPolicy.ACK_FIRST`, offsets are committed automatically."
+            raise SetupError(msg)
+
+        if batch:
+            msg = "`commit_batch_size` is not supported by batch subscriber."
+            raise SetupError(msg)
+
+    if batch_latency_ms is not None:
+        if not batch:
+            msg = "`batch_latency_ms` can be used with batch subscriber only."
+            raise SetupError(msg)
+
+        if not max_records:
+            msg = "`batch_latency_ms` requires `max_records` to limit the batch size."
+            raise SetupError(msg)
+
+        if batch_latency_ms <= 0:
+            msg = "`batch_latency_ms` should be a positive number."
+            raise SetupError(msg)
+
+    if ordered_by_key and batch:
+        msg = "You can't use `ordered_by_key` with batch subscriber."
+        raise SetupError(msg)
+
+    if ordered_by_key and max_workers <= 1:
+        msg = "`ordered_by_key` requires `max_workers` > 1 to process keys concurrently."
+        raise SetupError(msg)
+
+    if max_workers > 1 and not ordered_by_key and ack_policy is not AckPolicy.ACK_FIRST:
         if len(topics) > 1:
             msg = "You must use a single topic with concurrent manual commit mode."
             raise SetupError(msg)
@@ -1,26 +1,34 @@
+import asyncio
 import logging
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Callable, Sequence
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Optional, cast
+from zlib import crc32
 
 import anyio
 from aiokafka import ConsumerRecord, TopicPartition
 from aiokafka.errors import ConsumerStoppedError, KafkaError, UnsupportedCodecError
 from typing_extensions import override
 
+from faststream._internal.endpoint.subscriber.batching import AdaptiveBatchSize
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin, TasksMixin
 from faststream._internal.endpoint.subscriber.usecase import SubscriberUsecase
 from faststream._internal.endpoint.utils import process_msg
 from faststream._internal.types import MsgType
 from faststream._internal.utils.path import compile_path
 from faststream.kafka.helpers import make_logging_listener
+from faststream.kafka.helpers.offsets import OffsetTracker
 from faststream.kafka.message import KafkaAckableMessage, KafkaMessage, KafkaRawMessage
 from faststream.kafka.parser import AioKafkaBatchParser, AioKafkaParser
 from faststream.kafka.publisher.fake import KafkaFakePublisher
 
 if TYPE_CHECKING:
     from aiokafka import AIOKafkaConsumer
+    from anyio.streams.memory import (
+        MemoryObjectReceiveStream,
+        MemoryObjectSendStream,
+    )
 
     from faststream._internal.endpoint.publisher import PublisherProto
     from faststream._internal.endpoint.subscriber import SubscriberSpecification
@@ -57,6 +65,10 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
         self._listener = config.listener
         self._connection_args = config.connection_args
 
+        self._commit_batch_size = config.commit_batch_size
+        self._commit_interval = config.commit_interval_ms / 1000
+        self._offset_trackers: dict[AIOKafkaConsumer, OffsetTracker] = {}
+
         self.consumer = None
 
     @property
@@ -124,10 +136,43 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
     async def stop(self) -> None:
         await super().stop()
 
+        await self._commit_offsets()
+
         if self.consumer is not None:
             await self.consumer.stop()
             self.consumer = None
 
+    def _get_offset_tracker(self, consumer: "AIOKafkaConsumer") -> OffsetTracker:
+        if (tracker := self._offset_trackers.get(consumer)) is None:
+            tracker = self._offset_trackers[consumer] = OffsetTracker(
+                consumer,
+                commit_batch_size=self._commit_batch_size,
+            )
+
+            if self._commit_batch_size > 1:
+                self.add_task(self._run_commit_loop(tracker))
+
+        return tracker
+
+    async def _run_commit_loop(self, tracker: OffsetTracker) -> None:
+        while self.running:
+            await anyio.sleep(self._commit_interval)
+
+            try:
+                await tracker.commit()
+            except KafkaError as e:
+                self._log(logging.ERROR, "Failed to commit offsets", exc_info=e)
+
+    async def _commit_offsets(self) -> None:
+        """Commit offsets of all processed messages before consumers stop."""
+        for tracker in self._offset_trackers.values():
+            try:
+                await tracker.commit()
+            except KafkaError as e:  # noqa: PERF203
+                self._log(logging.ERROR, "Failed to commit offsets", exc_info=e)
+
+        self._offset_trackers.clear()
+
     @override
     async def get_one(
         self,
@@ -287,9 +332,15 @@ class DefaultSubscriber(LogicSubscriber["ConsumerRecord"]):
         config.decoder = self.parser.decode_message
         super().__init__(config, specification, calls)
 
+        # sequential processing commits consumer position by default
+        self._track_offsets = not config.ack_first and config.commit_batch_size > 1
+
     async def get_msg(self, consumer: "AIOKafkaConsumer") -> "ConsumerRecord":
         assert consumer, "You should setup subscriber at first."
-        return await consumer.getone()
+        message = await consumer.getone()
+        if self._track_offsets:
+            message.consumer = self._get_offset_tracker(consumer).track(message)
+        return message
 
     def get_log_context(
         self,
@@ -315,6 +366,7 @@ class BatchSubscriber(LogicSubscriber[tuple["ConsumerRecord", ...]]):
         calls: "CallsCollection[tuple[ConsumerRecord, ...]]",
         batch_timeout_ms: int,
         max_records: int | None,
+        batch_latency_ms: int | None = None,
     ) -> None:
         if config.pattern:
             reg, pattern = compile_path(
@@ -338,15 +390,28 @@ class BatchSubscriber(LogicSubscriber[tuple["ConsumerRecord", ...]]):
         self.batch_timeout_ms = batch_timeout_ms
         self.max_records = max_records
 
+        self.adaptive_batch_size: AdaptiveBatchSize | None = None
+        if batch_latency_ms is not None:
+            assert max_records
+            self.adaptive_batch_size = AdaptiveBatchSize(
+                batch_latency_ms / 1000,
+                max_size=max_records,
+            )
+
     async def get_msg(
         self,
         consumer: "AIOKafkaConsumer",
     ) -> tuple["ConsumerRecord", ...]:
         assert consumer, "You should setup subscriber at first."
 
+        if self.adaptive_batch_size is not None:
+            max_records: int | None = self.adaptive_batch_size.size
+        else:
+            max_records = self.max_records
+
         messages = await consumer.getmany(
             timeout_ms=self.batch_timeout_ms,
-            max_records=self.max_records,
+            max_records=max_records,
         )
 
         if not messages:  # pragma: no cover
@@ -355,6 +420,14 @@ class BatchSubscriber(LogicSubscriber[tuple["ConsumerRecord", ...]]):
 
         return tuple(chain(*messages.values()))
 
+    async def consume_one(self, msg: tuple["ConsumerRecord", ...]) -> None:
+        if self.adaptive_batch_size is None:
+            await self.consume(msg)
+            return
+
+        with self.adaptive_batch_size.measure(len(msg)):
+            await self.consume(msg)
+
     def get_log_context(
         self,
         message: Optional["StreamMessage[tuple[ConsumerRecord, ...]]"],
@@ -442,6 +515,8 @@ class ConcurrentBetweenPartitionsSubscriber(DefaultSubscriber):
                 self.add_task(self._run_consume_loop(c))
 
     async def stop(self) -> None:
+        await self._commit_offsets()
+
         if self.consumer_subgroup:
             async with anyio.create_task_group() as tg:
                 for consumer in self.consumer_subgroup:
@@ -454,5 +529,92 @@ class ConcurrentBetweenPartitionsSubscriber(DefaultSubscriber):
     async def get_msg(self, consumer: "AIOKafkaConsumer") -> "KafkaRawMessage":
         assert consumer, "You should setup subscriber at first."
         message = await consumer.getone()
-        message.consumer = consumer
+        message.consumer = (
+            self._get_offset_tracker(consumer).track(message)
+            if self._track_offsets
+            else consumer
+        )
         return cast("KafkaRawMessage", message)
+
+
+class ConcurrentBetweenKeysSubscriber(DefaultSubscriber):
+    """Processes messages with different keys concurrently on a single consumer.
+
+    Messages with the same key are processed by the same worker in order.
+    Offsets are committed only up to the first unprocessed message of a partition.
+    """
+
+    worker_buffer_size = 16
+
+    def __init__(
+        self,
+        config: "KafkaSubscriberConfig",
+        specification: "SubscriberSpecification[Any, Any]",
+        calls: "CallsCollection[ConsumerRecord]",
+        max_workers: int,
+    ) -> None:
+        super().__init__(config, specification, calls)
+
+        self.max_workers = max_workers
+        self._track_offsets = not config.ack_first
+
+        self._send_streams: list[MemoryObjectSendStream[ConsumerRecord]] = []
+        self._workers: list[asyncio.Task[None]] = []
+        self._next_worker = 0
+
+    async def start(self) -> None:
+        await super().start()
+
+        if self.calls:
+            for _ in range(self.max_workers):
+                send_stream, receive_stream = anyio.create_memory_object_stream[
+                    ConsumerRecord
+                ](max_buffer_size=self.worker_buffer_size)
+                self._send_streams.append(send_stream)
+                self._workers.append(
+                    asyncio.create_task(self._serve_worker(receive_stream)),
+                )
+
+    async def stop(self) -> None:
+        # stop fetching at first to not send messages to closed workers streams
+        self.running = False
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks.clear()
+
+        # workers process already buffered messages and exit
+        for stream in self._send_streams:
+            stream.close()
+        self._send_streams = []
+
+        with anyio.move_on_after(self._outer_config.graceful_timeout):
+            await asyncio.gather(*self._workers, return_exceptions=True)
+
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+        await super().stop()
+
+    async def consume_one(self, msg: "ConsumerRecord") -> None:
+        await self._send_streams[self._worker_index(msg)].send(msg)
+
+    def _worker_index(self, msg: "ConsumerRecord") -> int:
+        if (key := msg.key) is None:
+            # keyless messages have no order to keep
+            self._next_worker = (self._next_worker + 1) % self.max_workers
+            return self._next_worker
+
+        if isinstance(key, bytes):
+            return crc32(key) % self.max_workers
+
+        return hash(key) % self.max_workers
+
+    async def _serve_worker(
+        self,
+        receive_stream: "MemoryObjectReceiveStream[ConsumerRecord]",
+    ) -> None:
+        async with receive_stream:
+            async for msg in receive_stream:
+                await self.consume(msg)
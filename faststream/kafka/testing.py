@@ -1,5 +1,5 @@
 import re
-from collections.abc import Callable, Generator, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from contextlib import ExitStack, contextmanager
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional, cast
@@ -11,6 +11,7 @@ from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.testing.broker import TestBroker, change_producer
+from faststream._internal.testing.routing import RoutingIndex, RoutingTable
 from faststream.exceptions import SubscriberNotFound
 from faststream.kafka import TopicPartition
 from faststream.kafka.broker import KafkaBroker
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.endpoint.subscriber import SubscriberUsecase
     from faststream.kafka.publisher.usecase import LogicPublisher
     from faststream.kafka.response import KafkaPublishCommand
     from faststream.kafka.subscriber.usecase import LogicSubscriber
@@ -121,6 +123,8 @@ class FakeProducer(AioKafkaFastProducer):
         self._parser = ParserComposition(broker._parser, default.parse_message)
         self._decoder = ParserComposition(broker._decoder, default.decode_message)
 
+        self._routes = RoutingTable(broker, _build_routes)
+
     def __bool__(self) -> bool:
         return True
 
@@ -144,7 +148,7 @@ class FakeProducer(AioKafkaFastProducer):
         )
 
         for handler in _find_handler(
-            cast("list[LogicSubscriber[Any]]", self.broker.subscribers),
+            self._routes.index.match(cmd.destination),
             cmd.destination,
             cmd.partition,
         ):
@@ -166,7 +170,7 @@ class FakeProducer(AioKafkaFastProducer):
         )
 
         for handler in _find_handler(
-            cast("list[LogicSubscriber[Any]]", self.broker.subscribers),
+            self._routes.index.match(cmd.destination),
             cmd.destination,
             cmd.partition,
         ):
@@ -188,7 +192,7 @@ class FakeProducer(AioKafkaFastProducer):
     ) -> None:
         """Publish a batch of messages to the Kafka broker."""
         for handler in _find_handler(
-            cast("list[LogicSubscriber[Any]]", self.broker.subscribers),
+            self._routes.index.match(cmd.destination),
             cmd.destination,
             cmd.partition,
         ):
@@ -278,6 +282,21 @@ def _fake_connection(*args: Any, **kwargs: Any) -> AsyncMock:
     return mock
 
 
+def _build_routes(
+    subscribers: Sequence["SubscriberUsecase[Any]"],
+) -> RoutingIndex["LogicSubscriber[Any]"]:
+    index: RoutingIndex[LogicSubscriber[Any]] = RoutingIndex()
+
+    for handler in cast("Sequence[LogicSubscriber[Any]]", subscribers):
+        for topic in {*handler.topics, *(p.topic for p in handler.partitions)}:
+            index.add(topic, handler)
+
+        if handler.pattern:
+            index.add_regex(re.compile(handler.pattern), handler)
+
+    return index
+
+
 def _find_handler(
     subscribers: Iterable["LogicSubscriber[Any]"],
     topic: str,
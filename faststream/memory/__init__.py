@@ -0,0 +1,16 @@
+from faststream._internal.testing.app import TestApp
+
+from .annotations import MemoryMessage
+from .broker import MemoryBroker, MemoryPublisher, MemoryRoute, MemoryRouter
+from .response import MemoryPublishCommand, MemoryResponse
+
+__all__ = (
+    "MemoryBroker",
+    "MemoryMessage",
+    "MemoryPublishCommand",
+    "MemoryPublisher",
+    "MemoryResponse",
+    "MemoryRoute",
+    "MemoryRouter",
+    "TestApp",
+)
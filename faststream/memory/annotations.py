@@ -0,0 +1,18 @@
+from typing import Annotated
+
+from faststream._internal.context import Context
+from faststream.annotations import ContextRepo, Logger
+from faststream.memory.broker.broker import MemoryBroker as MB
+from faststream.memory.message import MemoryMessage as MM
+from faststream.params import NoCast
+
+__all__ = (
+    "ContextRepo",
+    "Logger",
+    "MemoryBroker",
+    "MemoryMessage",
+    "NoCast",
+)
+
+MemoryMessage = Annotated[MM, Context("message")]
+MemoryBroker = Annotated[MB, Context("broker")]
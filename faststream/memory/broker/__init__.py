@@ -0,0 +1,9 @@
+from .broker import MemoryBroker
+from .router import MemoryPublisher, MemoryRoute, MemoryRouter
+
+__all__ = (
+    "MemoryBroker",
+    "MemoryPublisher",
+    "MemoryRoute",
+    "MemoryRouter",
+)
@@ -0,0 +1,302 @@
+import logging
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Annotated, Any, Optional, Union
+
+from typing_extensions import Doc, override
+
+from faststream._internal.broker import BrokerUsecase
+from faststream._internal.constants import EMPTY
+from faststream._internal.di import FastDependsConfig
+from faststream.memory.configs import ConnectionState, MemoryBrokerConfig
+from faststream.memory.message import MemoryRawMessage
+from faststream.memory.publisher.producer import MemoryProducer
+from faststream.memory.response import MemoryPublishCommand
+from faststream.message import gen_cor_id
+from faststream.response.publish_type import PublishType
+from faststream.specification.schema import BrokerSpec
+
+from .logging import make_memory_logger_state
+from .registrator import MemoryRegistrator
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from fast_depends.dependencies import Dependant
+    from fast_depends.library.serializer import SerializerProto
+
+    from faststream._internal.basic_types import LoggerProto, SendableMessage
+    from faststream._internal.broker.registrator import Registrator
+    from faststream._internal.types import BrokerMiddleware, CustomCallable
+    from faststream.memory.message import MemoryMessage
+    from faststream.specification.schema.extra import Tag, TagDict
+
+
+class MemoryBroker(
+    MemoryRegistrator,
+    BrokerUsecase[MemoryRawMessage, ConnectionState],
+):
+    """In-process broker.
+
+    Delivers messages through bounded in-memory queues to subscribers of the
+    same process using the regular consume loop, so it suits single-node
+    pipelines and handlers benchmarks without any network hops.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue_size: Annotated[
+            int,
+            Doc(
+                "Maximum number of messages in a consumers group queue. "
+                "Publishers wait for a free slot if the queue is full.",
+            ),
+        ] = 1000,
+        # broker args
+        graceful_timeout: Annotated[
+            float | None,
+            Doc(
+                "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.",
+            ),
+        ] = 15.0,
+        decoder: Annotated[
+            Optional["CustomCallable"],
+            Doc("Custom decoder object."),
+        ] = None,
+        parser: Annotated[
+            Optional["CustomCallable"],
+            Doc("Custom parser object."),
+        ] = None,
+        dependencies: Annotated[
+            Iterable["Dependant"],
+            Doc("Dependencies to apply to all broker subscribers."),
+        ] = (),
+        middlewares: Annotated[
+            Sequence["BrokerMiddleware[Any, Any]"],
+            Doc("Middlewares to apply to all broker publishers/subscribers."),
+        ] = (),
+        routers: Annotated[
+            Sequence["Registrator[MemoryRawMessage]"],
+            Doc("Routers to apply to broker."),
+        ] = (),
+        # AsyncAPI args
+        specification_url: Annotated[
+            str,
+            Doc("AsyncAPI hardcoded server addresses."),
+        ] = "memory://localhost",
+        protocol: Annotated[
+            str | None,
+            Doc("AsyncAPI server protocol."),
+        ] = "memory",
+        protocol_version: Annotated[
+            str | None,
+            Doc("AsyncAPI server protocol version."),
+        ] = "custom",
+        description: Annotated[
+            str | None,
+            Doc("AsyncAPI server description."),
+        ] = None,
+        tags: Annotated[
+            Iterable[Union["Tag", "TagDict"]],
+            Doc("AsyncAPI server tags."),
+        ] = (),
+        # logging args
+        logger: Annotated[
+            Optional["LoggerProto"],
+            Doc("User specified logger to pass into Context and log service messages."),
+        ] = EMPTY,
+        log_level: Annotated[
+            int,
+            Doc("Service messages log level."),
+        ] = logging.INFO,
+        log_queue_size: Annotated[
+            int | None,
+            Doc(
+                "Size of the queue to write service messages from a background thread. "
+                "Messages are written synchronously if not set.",
+            ),
+        ] = None,
+        log_sample_rate: Annotated[
+            float,
+            Doc(
+                "Share of consumed messages to write `Received` and `Processed` lines for."
+            ),
+        ] = 1.0,
+        # FastDepends args
+        apply_types: Annotated[
+            bool,
+            Doc("Whether to use FastDepends or not."),
+        ] = True,
+        serializer: Optional["SerializerProto"] = EMPTY,
+    ) -> None:
+        connection_state = ConnectionState(max_queue_size)
+
+        super().__init__(
+            routers=routers,
+            config=MemoryBrokerConfig(
+                connection=connection_state,
+                producer=MemoryProducer(
+                    connection=connection_state,
+                    parser=parser,
+                    decoder=decoder,
+                    serializer=serializer,
+                ),
+                # both args
+                broker_middlewares=middlewares,
+                broker_parser=parser,
+                broker_decoder=decoder,
+                logger=make_memory_logger_state(
+                    logger=logger,
+                    log_level=log_level,
+                    queue_size=log_queue_size,
+                    sample_rate=log_sample_rate,
+                ),
+                fd_config=FastDependsConfig(
+                    use_fastdepends=apply_types,
+                    serializer=serializer,
+                ),
+                # subscriber args
+                broker_dependencies=dependencies,
+                graceful_timeout=graceful_timeout,
+                extra_context={
+                    "broker": self,
+                },
+            ),
+            specification=BrokerSpec(
+                description=description,
+                url=[specification_url],
+                protocol=protocol,
+                protocol_version=protocol_version,
+                security=None,
+                tags=tags,
+            ),
+        )
+
+    @override
+    async def _connect(self) -> ConnectionState:
+        await self.config.connect()
+        return self.config.broker_config.connection
+
+    async def stop(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: Optional["TracebackType"] = None,
+    ) -> None:
+        await super().stop(exc_type, exc_val, exc_tb)
+        await self.config.disconnect()
+        self._connection = None
+
+    async def start(self) -> None:
+        await self.connect()
+        await super().start()
+
+    @override
+    async def publish(
+        self,
+        message: "SendableMessage" = None,
+        topic: str = "",
+        *,
+        reply_to: str = "",
+        headers: dict[str, Any] | None = None,
+        correlation_id: str | None = None,
+    ) -> int:
+        """Publish message directly.
+
+        This method allows you to publish a message in a non-AsyncAPI-documented way.
+        It can be used in other frameworks or to publish messages at specific intervals.
+
+        Args:
+            message:
+                Message body to send.
+            topic:
+                Topic name to send message.
+            reply_to:
+                Reply message destination topic name.
+            headers:
+                Message headers to store metainformation.
+            correlation_id:
+                Manual message correlation_id setter. correlation_id is a useful option to trace messages.
+
+        Returns:
+            int: The number of consumers groups received the message.
+        """
+        cmd = MemoryPublishCommand(
+            message,
+            topic=topic,
+            reply_to=reply_to,
+            headers=headers,
+            correlation_id=correlation_id or gen_cor_id(),
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        result: int = await super()._basic_publish(
+            cmd,
+            producer=self.config.producer,
+        )
+        return result
+
+    @override
+    async def request(  # type: ignore[override]
+        self,
+        message: "SendableMessage",
+        topic: str,
+        *,
+        correlation_id: str | None = None,
+        headers: dict[str, Any] | None = None,
+        timeout: float | None = 30.0,
+    ) -> "MemoryMessage":
+        cmd = MemoryPublishCommand(
+            message,
+            topic=topic,
+            headers=headers,
+            correlation_id=correlation_id or gen_cor_id(),
+            timeout=timeout,
+            _publish_type=PublishType.REQUEST,
+        )
+
+        msg: MemoryMessage = await super()._basic_request(
+            cmd,
+            producer=self.config.producer,
+        )
+        return msg
+
+    @override
+    async def publish_batch(  # type: ignore[override]
+        self,
+        *messages: "SendableMessage",
+        topic: str,
+        reply_to: str = "",
+        headers: dict[str, Any] | None = None,
+        correlation_id: str | None = None,
+    ) -> int:
+        """Publish multiple messages to the topic one by one.
+
+        Args:
+            *messages: Messages bodies to send.
+            topic: Topic name to send messages.
+            reply_to: Reply message destination topic name.
+            headers: Message headers to store metainformation.
+            correlation_id: Manual message **correlation_id** setter. **correlation_id** is a useful option to trace messages.
+
+        Returns:
+            int: The number of delivered messages copies.
+        """
+        cmd = MemoryPublishCommand(
+            *messages,
+            topic=topic,
+            reply_to=reply_to,
+            headers=headers,
+            correlation_id=correlation_id or gen_cor_id(),
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        result: int = await self._basic_publish_batch(
+            cmd,
+            producer=self.config.producer,
+        )
+        return result
+
+    @override
+    async def ping(self, timeout: float | None = None) -> bool:
+        return bool(self._connection)
@@ -0,0 +1,181 @@
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Annotated, Any, Optional, cast
+
+from typing_extensions import deprecated, override
+
+from faststream._internal.broker.registrator import Registrator
+from faststream._internal.constants import EMPTY
+from faststream.exceptions import SetupError
+from faststream.memory.configs import MemoryBrokerConfig
+from faststream.memory.message import MemoryRawMessage
+from faststream.memory.publisher.factory import create_publisher
+from faststream.memory.subscriber.factory import create_subscriber
+from faststream.middlewares import AckPolicy
+
+if TYPE_CHECKING:
+    from fast_depends.dependencies import Dependant
+
+    from faststream._internal.types import (
+        BrokerMiddleware,
+        CustomCallable,
+        PublisherMiddleware,
+        SubscriberMiddleware,
+    )
+    from faststream.memory.publisher.usecase import MemoryPublisher
+    from faststream.memory.subscriber.usecase import MemorySubscriber
+
+
+class MemoryRegistrator(Registrator[MemoryRawMessage, MemoryBrokerConfig]):
+    """Includable to MemoryBroker router."""
+
+    @override
+    def subscriber(  # type: ignore[override]
+        self,
+        topic: str,
+        *,
+        group: str | None = None,
+        max_workers: int | None = None,
+        # broker arguments
+        dependencies: Iterable["Dependant"] = (),
+        parser: Optional["CustomCallable"] = None,
+        decoder: Optional["CustomCallable"] = None,
+        middlewares: Annotated[
+            Sequence["SubscriberMiddleware[Any]"],
+            deprecated(
+                "This option was deprecated in 0.6.0. Use router-level middlewares instead."
+                "Scheduled to remove in 0.7.0",
+            ),
+        ] = (),
+        ack_policy: AckPolicy = EMPTY,
+        no_reply: bool = False,
+        log_sample_rate: float | None = None,
+        # AsyncAPI information
+        title: str | None = None,
+        description: str | None = None,
+        include_in_schema: bool = True,
+    ) -> "MemorySubscriber":
+        """Subscribe a handler to a memory broker topic.
+
+        Args:
+            topic: Topic name to consume messages from.
+            group: Consumers group name. Subscribers of the same group share
+                topic messages, each group gets all of them.
+            max_workers: Number of workers to process messages concurrently.
+            dependencies: Dependencies list (`[Depends(),]`) to apply to the subscriber.
+            parser: Parser to map original **MemoryRawMessage** to FastStream one.
+            decoder: Function to decode FastStream msg bytes body to python objects.
+            middlewares: Subscriber middlewares to wrap incoming message processing.
+            ack_policy: Acknowledgement policy for message processing.
+                Nacked messages are redelivered to the group queue.
+            no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
+            title: AsyncAPI subscriber object title.
+            description: AsyncAPI subscriber object description. Uses decorated docstring as default.
+            include_in_schema: Whether to include operation in AsyncAPI schema or not.
+
+        Returns:
+            SubscriberType: The subscriber object.
+        """
+        subscriber = create_subscriber(
+            topic=topic,
+            group=group,
+            # subscriber args
+            max_workers=max_workers or 1,
+            ack_policy=ack_policy,
+            no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
+            config=cast("MemoryBrokerConfig", self.config),
+            # AsyncAPI
+            title_=title,
+            description_=description,
+            include_in_schema=include_in_schema,
+        )
+
+        super().subscriber(subscriber)
+
+        return subscriber.add_call(
+            parser_=parser or self._parser,
+            decoder_=decoder or self._decoder,
+            dependencies_=dependencies,
+            middlewares_=middlewares,
+        )
+
+    @override
+    def publisher(  # type: ignore[override]
+        self,
+        topic: str,
+        *,
+        headers: dict[str, Any] | None = None,
+        reply_to: str = "",
+        middlewares: Annotated[
+            Sequence["PublisherMiddleware"],
+            deprecated(
+                "This option was deprecated in 0.6.0. Use router-level middlewares instead."
+                "Scheduled to remove in 0.7.0",
+            ),
+        ] = (),
+        # AsyncAPI information
+        title: str | None = None,
+        description: str | None = None,
+        schema: Any | None = None,
+        include_in_schema: bool = True,
+    ) -> "MemoryPublisher":
+        """Creates long-living and AsyncAPI-documented publisher object.
+
+        You can use it as a handler decorator (handler should be decorated by `@broker.subscriber(...)` too) - `@broker.publisher(...)`.
+        In such case publisher will publish your handler return value.
+
+        Or you can create a publisher object to call it lately - `broker.publisher(...).publish(...)`.
+
+        Args:
+            topic: Topic name to send messages.
+            headers: Message headers to store meta-information. Can be overridden
+                by `publish.headers` if specified.
+            reply_to: Reply message destination topic name.
+            middlewares: Publisher middlewares to wrap outgoing messages.
+            title: AsyncAPI publisher object title.
+            description: AsyncAPI publisher object description.
+            schema: AsyncAPI publishing message type. Should be any python-native
+                object annotation or `pydantic.BaseModel`.
+            include_in_schema: Whether to include operation in AsyncAPI schema or not.
+        """
+        publisher = create_publisher(
+            topic=topic,
+            headers=headers,
+            reply_to=reply_to,
+            # Specific
+            config=cast("MemoryBrokerConfig", self.config),
+            middlewares=middlewares,
+            # AsyncAPI
+            title_=title,
+            description_=description,
+            schema_=schema,
+            include_in_schema=include_in_schema,
+        )
+        super().publisher(publisher)
+        return publisher
+
+    @override
+    def include_router(
+        self,
+        router: "MemoryRegistrator",  # type: ignore[override]
+        *,
+        prefix: str = "",
+        dependencies: Iterable["Dependant"] = (),
+        middlewares: Sequence["BrokerMiddleware[Any, Any]"] = (),
+        include_in_schema: bool | None = None,
+    ) -> None:
+        if not isinstance(router, MemoryRegistrator):
+            msg = (
+                f"Router must be an instance of MemoryRegistrator, "
+                f"got {type(router).__name__} instead"
+            )
+            raise SetupError(msg)
+
+        super().include_router(
+            router,
+            prefix=prefix,
+            dependencies=dependencies,
+            middlewares=middlewares,
+            include_in_schema=include_in_schema,
+        )
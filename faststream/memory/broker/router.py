@@ -0,0 +1,251 @@
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Annotated, Any, Optional
+
+from typing_extensions import Doc, deprecated
+
+from faststream._internal.broker.router import (
+    ArgsContainer,
+    BrokerRouter,
+    SubscriberRoute,
+)
+from faststream._internal.constants import EMPTY
+from faststream.memory.configs import MemoryRouterConfig
+from faststream.memory.message import MemoryRawMessage
+from faststream.middlewares import AckPolicy
+
+from .registrator import MemoryRegistrator
+
+if TYPE_CHECKING:
+    from fast_depends.dependencies import Dependant
+
+    from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.broker.registrator import Registrator
+    from faststream._internal.types import (
+        BrokerMiddleware,
+        CustomCallable,
+        PublisherMiddleware,
+        SubscriberMiddleware,
+    )
+
+
+class MemoryPublisher(ArgsContainer):
+    """Delayed MemoryPublisher registration object.
+
+    Just a copy of MemoryRegistrator.publisher(...) arguments.
+    """
+
+    def __init__(
+        self,
+        topic: Annotated[
+            str,
+            Doc("Topic name to send messages."),
+        ],
+        *,
+        headers: Annotated[
+            dict[str, Any] | None,
+            Doc(
+                "Message headers to store metainformation. "
+                "Can be overridden by `publish.headers` if specified.",
+            ),
+        ] = None,
+        reply_to: Annotated[
+            str,
+            Doc("Reply message destination topic name."),
+        ] = "",
+        middlewares: Annotated[
+            Sequence["PublisherMiddleware"],
+            deprecated(
+                "This option was deprecated in 0.6.0. Use router-level middlewares instead."
+                "Scheduled to remove in 0.7.0",
+            ),
+            Doc("Publisher middlewares to wrap outgoing messages."),
+        ] = (),
+        # AsyncAPI information
+        title: Annotated[
+            str | None,
+            Doc("AsyncAPI publisher object title."),
+        ] = None,
+        description: Annotated[
+            str | None,
+            Doc("AsyncAPI publisher object description."),
+        ] = None,
+        schema: Annotated[
+            Any | None,
+            Doc(
+                "AsyncAPI publishing message type. "
+                "Should be any python-native object annotation or `pydantic.BaseModel`.",
+            ),
+        ] = None,
+        include_in_schema: Annotated[
+            bool,
+            Doc("Whetever to include operation in AsyncAPI schema or not."),
+        ] = True,
+    ) -> None:
+        super().__init__(
+            topic,
+            headers=headers,
+            reply_to=reply_to,
+            middlewares=middlewares,
+            title=title,
+            description=description,
+            schema=schema,
+            include_in_schema=include_in_schema,
+        )
+
+
+class MemoryRoute(SubscriberRoute):
+    """Class to store delayed MemoryBroker subscriber registration."""
+
+    def __init__(
+        self,
+        call: Annotated[
+            Callable[..., "SendableMessage"]
+            | Callable[..., Awaitable["SendableMessage"]],
+            Doc(
+                "Message handler function "
+                "to wrap the same with `@broker.subscriber(...)` way.",
+            ),
+        ],
+        topic: Annotated[
+            str,
+            Doc("Topic name to consume messages from."),
+        ],
+        *,
+        publishers: Annotated[
+            Iterable[MemoryPublisher],
+            Doc("Memory publishers to broadcast the handler result."),
+        ] = (),
+        group: Annotated[
+            str | None,
+            Doc(
+                "Consumers group name. Subscribers of the same group share "
+                "topic messages, each group gets all of them.",
+            ),
+        ] = None,
+        max_workers: Annotated[
+            int | None,
+            Doc("Number of workers to process messages concurrently."),
+        ] = None,
+        # broker arguments
+        dependencies: Annotated[
+            Iterable["Dependant"],
+            Doc("Dependencies list (`[Dependant(),]`) to apply to the subscriber."),
+        ] = (),
+        parser: Annotated[
+            Optional["CustomCallable"],
+            Doc("Parser to map original **MemoryRawMessage** to FastStream one."),
+        ] = None,
+        decoder: Annotated[
+            Optional["CustomCallable"],
+            Doc("Function to decode FastStream msg bytes body to python objects."),
+        ] = None,
+        middlewares: Annotated[
+            Sequence["SubscriberMiddleware[Any]"],
+            deprecated(
+                "This option was deprecated in 0.6.0. Use router-level middlewares instead."
+                "Scheduled to remove in 0.7.0",
+            ),
+            Doc("Subscriber middlewares to wrap incoming message processing."),
+        ] = (),
+        ack_policy: AckPolicy = EMPTY,
+        no_reply: Annotated[
+            bool,
+            Doc(
+                "Whether to disable **FastStream** RPC and Reply To auto responses or not.",
+            ),
+        ] = False,
+        log_sample_rate: Annotated[
+            float | None,
+            Doc(
+                "Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.",
+            ),
+        ] = None,
+        # AsyncAPI information
+        title: Annotated[
+            str | None,
+            Doc("AsyncAPI subscriber object title."),
+        ] = None,
+        description: Annotated[
+            str | None,
+            Doc(
+                "AsyncAPI subscriber object description. "
+                "Uses decorated docstring as default.",
+            ),
+        ] = None,
+        include_in_schema: Annotated[
+            bool,
+            Doc("Whetever to include operation in AsyncAPI schema or not."),
+        ] = True,
+    ) -> None:
+        super().__init__(
+            call,
+            topic,
+            publishers=publishers,
+            group=group,
+            max_workers=max_workers,
+            dependencies=dependencies,
+            parser=parser,
+            decoder=decoder,
+            middlewares=middlewares,
+            ack_policy=ack_policy,
+            no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
+            title=title,
+            description=description,
+            include_in_schema=include_in_schema,
+        )
+
+
+class MemoryRouter(MemoryRegistrator, BrokerRouter[MemoryRawMessage]):
+    """Includable to MemoryBroker router."""
+
+    def __init__(
+        self,
+        prefix: Annotated[
+            str,
+            Doc("String prefix to add to all subscribers topics."),
+        ] = "",
+        handlers: Annotated[
+            Iterable[MemoryRoute],
+            Doc("Route object to include."),
+        ] = (),
+        *,
+        dependencies: Annotated[
+            Iterable["Dependant"],
+            Doc(
+                "Dependencies list (`[Dependant(),]`) to apply to all routers' publishers/subscribers.",
+            ),
+        ] = (),
+        middlewares: Annotated[
+            Sequence["BrokerMiddleware[Any, Any]"],
+            Doc("Router middlewares to apply to all routers' publishers/subscribers."),
+        ] = (),
+        routers: Annotated[
+            Sequence["Registrator[MemoryRawMessage]"],
+            Doc("Routers to apply to broker."),
+        ] = (),
+        parser: Annotated[
+            Optional["CustomCallable"],
+            Doc("Parser to map original **MemoryRawMessage** to FastStream one."),
+        ] = None,
+        decoder: Annotated[
+            Optional["CustomCallable"],
+            Doc("Function to decode FastStream msg bytes body to python objects."),
+        ] = None,
+        include_in_schema: Annotated[
+            bool | None,
+            Doc("Whetever to include operation in AsyncAPI schema or not."),
+        ] = None,
+    ) -> None:
+        super().__init__(
+            handlers=handlers,
+            config=MemoryRouterConfig(
+                prefix=prefix,
+                broker_dependencies=dependencies,
+                broker_middlewares=middlewares,
+                broker_parser=parser,
+                broker_decoder=decoder,
+                include_in_schema=include_in_schema,
+            ),
+            routers=routers,
+        )
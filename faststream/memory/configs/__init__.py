@@ -0,0 +1,10 @@
+from .broker import MemoryBrokerConfig, MemoryRouterConfig
+from .state import ConnectionState, MemoryQueue, MemoryTopic
+
+__all__ = (
+    "ConnectionState",
+    "MemoryBrokerConfig",
+    "MemoryQueue",
+    "MemoryRouterConfig",
+    "MemoryTopic",
+)
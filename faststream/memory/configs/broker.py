@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from faststream._internal.configs import BrokerConfig
+from faststream.exceptions import IncorrectState
+
+if TYPE_CHECKING:
+    from faststream.memory.publisher.producer import MemoryProducer
+
+    from .state import ConnectionState
+
+
+@dataclass(kw_only=True)
+class MemoryBrokerConfig(BrokerConfig):
+    producer: "MemoryProducer"
+    connection: "ConnectionState"
+
+    async def connect(self) -> None:
+        self.producer.connect(self.fd_config._serializer)
+        await self.connection.connect()
+
+    async def disconnect(self) -> None:
+        await self.connection.disconnect()
+
+
+@dataclass(kw_only=True)
+class MemoryRouterConfig(BrokerConfig):
+    @property
+    def connection(self) -> "ConnectionState":
+        raise IncorrectState
@@ -0,0 +1,133 @@
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from faststream.exceptions import IncorrectState
+
+if TYPE_CHECKING:
+    from faststream.memory.message import MemoryRawMessage
+
+
+class MemoryQueue:
+    """Bounded FIFO queue of a topic consumers group.
+
+    `put` waits for a free slot, so slow consumers backpressure publishers.
+    Redelivered messages are placed at the queue head regardless of the bound
+    to not block consumers on their own queue.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+
+        self._messages: deque[MemoryRawMessage] = deque()
+
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)
+        self._not_full = asyncio.Condition(lock)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    async def put(self, message: "MemoryRawMessage") -> None:
+        async with self._not_full:
+            try:
+                while len(self._messages) >= self.max_size:
+                    await self._not_full.wait()
+            except asyncio.CancelledError:
+                # pass the wakeup to the next waiting publisher
+                if len(self._messages) < self.max_size:
+                    self._not_full.notify()
+                raise
+
+            message.queue = self
+            self._messages.append(message)
+            self._not_empty.notify()
+
+    async def requeue(self, message: "MemoryRawMessage") -> None:
+        async with self._not_empty:
+            self._messages.appendleft(message)
+            self._not_empty.notify()
+
+    async def get(self) -> "MemoryRawMessage":
+        async with self._not_empty:
+            try:
+                while not self._messages:
+                    await self._not_empty.wait()
+            except asyncio.CancelledError:
+                # pass the wakeup to the next waiting consumer
+                if self._messages:
+                    self._not_empty.notify()
+                raise
+
+            message = self._messages.popleft()
+            self._not_full.notify()
+            return message
+
+
+class MemoryTopic:
+    """Topic fans out each message to all its consumers groups."""
+
+    def __init__(self, name: str, max_size: int) -> None:
+        self.name = name
+        self.max_size = max_size
+
+        self.groups: dict[str, MemoryQueue] = {}
+        # number of started subscribers of each group
+        self._members: dict[str, int] = {}
+
+    def subscribe(self, group: str) -> MemoryQueue:
+        if (queue := self.groups.get(group)) is None:
+            queue = self.groups[group] = MemoryQueue(self.max_size)
+        self._members[group] = self._members.get(group, 0) + 1
+        return queue
+
+    def unsubscribe(self, group: str) -> None:
+        """Drops the group queue when its last subscriber stops."""
+        if (members := self._members.get(group, 0) - 1) > 0:
+            self._members[group] = members
+            return
+
+        self._members.pop(group, None)
+        self.groups.pop(group, None)
+
+
+class ConnectionState:
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+
+        self._connected = False
+        self._topics: dict[str, MemoryTopic] = {}
+        self._responses: dict[str, asyncio.Future[Any]] = {}
+
+    @property
+    def topics(self) -> dict[str, MemoryTopic]:
+        if not self._connected:
+            msg = "Connection is not available yet. Please, connect the broker first."
+            raise IncorrectState(msg)
+
+        return self._topics
+
+    @property
+    def responses(self) -> dict[str, "asyncio.Future[MemoryRawMessage]"]:
+        return self._responses
+
+    def __bool__(self) -> bool:
+        return self._connected
+
+    def topic(self, name: str) -> MemoryTopic:
+        if (topic := self.topics.get(name)) is None:
+            topic = self._topics[name] = MemoryTopic(name, self.max_size)
+        return topic
+
+    async def connect(self) -> None:
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        self._connected = False
+        self._topics.clear()
+
+        for future in self._responses.values():
+            if not future.done():
+                future.cancel()
+
+        self._responses.clear()
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from faststream.message import StreamMessage
+
+if TYPE_CHECKING:
+    from faststream.memory.configs.state import MemoryQueue
+
+
+@dataclass(slots=True)
+class MemoryRawMessage:
+    """A message stored in the memory broker queues."""
+
+    topic: str
+    data: bytes
+    headers: dict[str, Any]
+    message_id: str
+    correlation_id: str
+    reply_to: str = ""
+    deliveries: int = 1
+
+    queue: "MemoryQueue | None" = field(default=None, repr=False, compare=False)
+
+
+class MemoryMessage(StreamMessage[MemoryRawMessage]):
+    """A class to represent a memory broker message."""
+
+    __slots__ = ()
+
+    async def nack(self) -> None:
+        if self.committed is None and (queue := self.raw_message.queue) is not None:
+            self.raw_message.deliveries += 1
+            await queue.requeue(self.raw_message)
+        await super().nack()
@@ -0,0 +1,35 @@
+from typing import TYPE_CHECKING
+
+from faststream.memory.message import MemoryMessage
+from faststream.message import decode_message
+
+if TYPE_CHECKING:
+    from faststream._internal.basic_types import DecodedMessage
+    from faststream.memory.message import MemoryRawMessage
+    from faststream.message import StreamMessage
+
+
+class MemoryParser:
+    """A class to parse memory broker messages."""
+
+    @staticmethod
+    async def parse_message(
+        message: "MemoryRawMessage",
+    ) -> "StreamMessage[MemoryRawMessage]":
+        headers = message.headers
+
+        return MemoryMessage(
+            raw_message=message,
+            body=message.data,
+            headers=headers,
+            reply_to=message.reply_to,
+            content_type=headers.get("content-type"),
+            message_id=message.message_id,
+            correlation_id=message.correlation_id,
+        )
+
+    @staticmethod
+    async def decode_message(
+        msg: "StreamMessage[MemoryRawMessage]",
+    ) -> "DecodedMessage":
+        return decode_message(msg)
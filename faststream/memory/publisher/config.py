@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Any
+
+from faststream._internal.configs import (
+    PublisherSpecificationConfig,
+    PublisherUsecaseConfig,
+)
+from faststream.memory.configs import MemoryBrokerConfig
+
+
+class MemoryPublisherSpecificationConfig(PublisherSpecificationConfig):
+    pass
+
+
+@dataclass(kw_only=True)
+class MemoryPublisherConfig(PublisherUsecaseConfig):
+    _outer_config: MemoryBrokerConfig
+
+    topic: str
+    reply_to: str
+    headers: dict[str, Any] | None
@@ -0,0 +1,45 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from .config import MemoryPublisherConfig, MemoryPublisherSpecificationConfig
+from .specification import MemoryPublisherSpecification
+from .usecase import MemoryPublisher
+
+if TYPE_CHECKING:
+    from faststream._internal.types import PublisherMiddleware
+    from faststream.memory.configs import MemoryBrokerConfig
+
+
+def create_publisher(
+    *,
+    topic: str,
+    headers: dict[str, Any] | None,
+    reply_to: str,
+    config: "MemoryBrokerConfig",
+    middlewares: Sequence["PublisherMiddleware"],
+    # AsyncAPI args
+    title_: str | None,
+    description_: str | None,
+    schema_: Any | None,
+    include_in_schema: bool,
+) -> MemoryPublisher:
+    publisher_config = MemoryPublisherConfig(
+        topic=topic,
+        reply_to=reply_to,
+        headers=headers,
+        middlewares=middlewares,
+        _outer_config=config,
+    )
+
+    specification = MemoryPublisherSpecification(
+        config,
+        MemoryPublisherSpecificationConfig(
+            schema_=schema_,
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        ),
+        topic=topic,
+    )
+
+    return MemoryPublisher(publisher_config, specification)
@@ -0,0 +1,122 @@
+import asyncio
+from dataclasses import replace
+from typing import TYPE_CHECKING, Optional
+
+import anyio
+from typing_extensions import override
+
+from faststream._internal.endpoint.utils import ParserComposition
+from faststream._internal.producer import ProducerProto
+from faststream._internal.utils.nuid import NUID
+from faststream.memory.message import MemoryRawMessage
+from faststream.memory.parser import MemoryParser
+from faststream.memory.response import MemoryPublishCommand
+from faststream.message import encode_message, gen_cor_id
+
+if TYPE_CHECKING:
+    from fast_depends.library.serializer import SerializerProto
+
+    from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.types import CustomCallable
+    from faststream.memory.configs import ConnectionState
+
+
+class MemoryProducer(ProducerProto[MemoryPublishCommand]):
+    """A class to represent a memory broker producer."""
+
+    _decoder: "ParserComposition"
+    _parser: "ParserComposition"
+
+    def __init__(
+        self,
+        connection: "ConnectionState",
+        parser: Optional["CustomCallable"],
+        decoder: Optional["CustomCallable"],
+        serializer: Optional["SerializerProto"] = None,
+    ) -> None:
+        self._connection = connection
+
+        default = MemoryParser()
+        self._parser = ParserComposition(parser, default.parse_message)
+        self._decoder = ParserComposition(decoder, default.decode_message)
+        self.serializer = serializer
+
+        self._inbox_prefix = f"faststream.inbox.{NUID().next().decode()}"
+        self._nuid = NUID()
+
+    def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
+        self.serializer = serializer
+
+    @override
+    async def publish(self, cmd: "MemoryPublishCommand") -> int:
+        return await self._publish(
+            self._make_message(cmd.body, cmd, reply_to=cmd.reply_to),
+        )
+
+    @override
+    async def request(self, cmd: "MemoryPublishCommand") -> "MemoryRawMessage":
+        reply_to = f"{self._inbox_prefix}.{self._nuid.next().decode()}"
+
+        responses = self._connection.responses
+        future: asyncio.Future[MemoryRawMessage] = (
+            asyncio.get_running_loop().create_future()
+        )
+        responses[reply_to] = future
+
+        try:
+            with anyio.fail_after(cmd.timeout):
+                await self._publish(
+                    self._make_message(cmd.body, cmd, reply_to=reply_to),
+                )
+                return await future
+
+        finally:
+            responses.pop(reply_to, None)
+
+    @override
+    async def publish_batch(self, cmd: "MemoryPublishCommand") -> int:
+        delivered = 0
+        for body in cmd.batch_bodies:
+            delivered += await self._publish(
+                self._make_message(body, cmd, reply_to=cmd.reply_to),
+            )
+        return delivered
+
+    def _make_message(
+        self,
+        body: "SendableMessage",
+        cmd: "MemoryPublishCommand",
+        *,
+        reply_to: str,
+    ) -> MemoryRawMessage:
+        data, content_type = encode_message(body, self.serializer)
+
+        headers = cmd.headers
+        if content_type:
+            headers = {"content-type": content_type, **headers}
+
+        correlation_id = cmd.correlation_id or gen_cor_id()
+
+        return MemoryRawMessage(
+            topic=cmd.destination,
+            data=data,
+            headers=headers,
+            message_id=gen_cor_id(),
+            correlation_id=correlation_id,
+            reply_to=reply_to,
+        )
+
+    async def _publish(self, message: MemoryRawMessage) -> int:
+        if (future := self._connection.responses.pop(message.topic, None)) is not None:
+            if not future.done():
+                future.set_result(message)
+            return 1
+
+        topic = self._connection.topic(message.topic)
+
+        # each consumers group should get its own message copy to track deliveries
+        groups = tuple(topic.groups.values())
+        for queue in groups:
+            await queue.put(replace(message, headers=message.headers.copy()))
+
+        return len(groups)
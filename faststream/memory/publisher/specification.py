@@ -0,0 +1,47 @@
+from faststream._internal.endpoint.publisher import PublisherSpecification
+from faststream.memory.configs import MemoryBrokerConfig
+from faststream.specification.asyncapi.utils import resolve_payloads
+from faststream.specification.schema import Message, Operation, PublisherSpec
+
+from .config import MemoryPublisherSpecificationConfig
+
+
+class MemoryPublisherSpecification(
+    PublisherSpecification[MemoryBrokerConfig, MemoryPublisherSpecificationConfig],
+):
+    def __init__(
+        self,
+        _outer_config: MemoryBrokerConfig,
+        specification_config: MemoryPublisherSpecificationConfig,
+        topic: str,
+    ) -> None:
+        super().__init__(_outer_config, specification_config)
+        self.topic = topic
+
+    @property
+    def topic_name(self) -> str:
+        return f"{self._outer_config.prefix}{self.topic}"
+
+    @property
+    def name(self) -> str:
+        if self.config.title_:
+            return self.config.title_
+
+        return f"{self.topic_name}:Publisher"
+
+    def get_schema(self) -> dict[str, PublisherSpec]:
+        payloads = self.get_payloads()
+
+        return {
+            self.name: PublisherSpec(
+                description=self.config.description_,
+                operation=Operation(
+                    message=Message(
+                        title=f"{self.name}:Message",
+                        payload=resolve_payloads(payloads, "Publisher"),
+                    ),
+                    bindings=None,
+                ),
+                bindings=None,
+            ),
+        }
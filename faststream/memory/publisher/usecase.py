@@ -0,0 +1,111 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Union
+
+from typing_extensions import override
+
+from faststream._internal.endpoint.publisher import (
+    PublisherSpecification,
+    PublisherUsecase,
+)
+from faststream.memory.response import MemoryPublishCommand
+from faststream.message import gen_cor_id
+from faststream.response.publish_type import PublishType
+
+if TYPE_CHECKING:
+    from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.types import PublisherMiddleware
+    from faststream.memory.message import MemoryMessage
+    from faststream.response import PublishCommand
+
+    from .config import MemoryPublisherConfig
+
+
+class MemoryPublisher(PublisherUsecase):
+    """A class to represent a memory broker publisher."""
+
+    def __init__(
+        self,
+        config: "MemoryPublisherConfig",
+        specification: "PublisherSpecification[Any, Any]",
+    ) -> None:
+        super().__init__(config, specification)
+
+        self.config = config
+
+        self._topic = config.topic
+        self.reply_to = config.reply_to
+        self.headers = config.headers or {}
+
+    @property
+    def topic(self) -> str:
+        return f"{self._outer_config.prefix}{self._topic}"
+
+    @override
+    async def publish(
+        self,
+        message: "SendableMessage" = None,
+        topic: str | None = None,
+        reply_to: str = "",
+        headers: dict[str, Any] | None = None,
+        correlation_id: str | None = None,
+    ) -> int:
+        cmd = MemoryPublishCommand(
+            message,
+            topic=topic or self.topic,
+            reply_to=reply_to or self.reply_to,
+            headers=self.headers | (headers or {}),
+            correlation_id=correlation_id or gen_cor_id(),
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        result: int = await self._basic_publish(
+            cmd,
+            producer=self._outer_config.producer,
+            _extra_middlewares=(),
+        )
+        return result
+
+    @override
+    async def _publish(
+        self,
+        cmd: Union["PublishCommand", "MemoryPublishCommand"],
+        *,
+        _extra_middlewares: Iterable["PublisherMiddleware"],
+    ) -> None:
+        """This method should be called in subscriber flow only."""
+        cmd = MemoryPublishCommand.from_cmd(cmd)
+
+        cmd.destination = self.topic
+        cmd.add_headers(self.headers, override=False)
+        cmd.reply_to = cmd.reply_to or self.reply_to
+
+        await self._basic_publish(
+            cmd,
+            producer=self._outer_config.producer,
+            _extra_middlewares=_extra_middlewares,
+        )
+
+    @override
+    async def request(
+        self,
+        message: "SendableMessage" = None,
+        topic: str | None = None,
+        *,
+        correlation_id: str | None = None,
+        headers: dict[str, Any] | None = None,
+        timeout: float | None = 30.0,
+    ) -> "MemoryMessage":
+        cmd = MemoryPublishCommand(
+            message,
+            topic=topic or self.topic,
+            headers=self.headers | (headers or {}),
+            correlation_id=correlation_id or gen_cor_id(),
+            timeout=timeout,
+            _publish_type=PublishType.REQUEST,
+        )
+
+        msg: MemoryMessage = await self._basic_request(
+            cmd,
+            producer=self._outer_config.producer,
+        )
+        return msg
@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING, Any, Union
+
+from typing_extensions import override
+
+from faststream.response.publish_type import PublishType
+from faststream.response.response import BatchPublishCommand, PublishCommand, Response
+
+if TYPE_CHECKING:
+    from faststream._internal.basic_types import SendableMessage
+
+
+class MemoryResponse(Response):
+    @override
+    def as_publish_command(self) -> "MemoryPublishCommand":
+        return MemoryPublishCommand(
+            self.body,
+            headers=self.headers,
+            correlation_id=self.correlation_id,
+            _publish_type=PublishType.PUBLISH,
+            topic="",
+        )
+
+
+class MemoryPublishCommand(BatchPublishCommand):
+    def __init__(
+        self,
+        message: "SendableMessage",
+        /,
+        *messages: "SendableMessage",
+        topic: str,
+        _publish_type: PublishType,
+        correlation_id: str | None = None,
+        headers: dict[str, Any] | None = None,
+        reply_to: str = "",
+        timeout: float | None = 30.0,
+    ) -> None:
+        super().__init__(
+            message,
+            *messages,
+            destination=topic,
+            correlation_id=correlation_id,
+            headers=headers,
+            reply_to=reply_to,
+            _publish_type=_publish_type,
+        )
+
+        # request option
+        self.timeout = timeout
+
+    @classmethod
+    def from_cmd(
+        cls,
+        cmd: Union["PublishCommand", "MemoryPublishCommand"],
+        *,
+        batch: bool = False,
+    ) -> "MemoryPublishCommand":
+        if isinstance(cmd, MemoryPublishCommand):
+            # NOTE: Should return a copy probably.
+            return cmd
+
+        body, extra_bodies = cls._parse_bodies(cmd.body, batch=batch)
+
+        return cls(
+            body,
+            *extra_bodies,
+            topic=cmd.destination,
+            correlation_id=cmd.correlation_id,
+            headers=cmd.headers,
+            reply_to=cmd.reply_to,
+            _publish_type=cmd.publish_type,
+        )
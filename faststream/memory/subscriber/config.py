@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from faststream._internal.configs import (
+    SubscriberSpecificationConfig,
+    SubscriberUsecaseConfig,
+)
+from faststream._internal.constants import EMPTY
+from faststream.memory.configs import MemoryBrokerConfig
+from faststream.middlewares.acknowledgement.config import AckPolicy
+
+
+class MemorySubscriberSpecificationConfig(SubscriberSpecificationConfig):
+    pass
+
+
+@dataclass(kw_only=True)
+class MemorySubscriberConfig(SubscriberUsecaseConfig):
+    _outer_config: MemoryBrokerConfig
+
+    topic: str
+    group: str | None = None
+
+    @property
+    def ack_policy(self) -> AckPolicy:
+        if self._ack_policy is EMPTY:
+            return AckPolicy.REJECT_ON_ERROR
+
+        return self._ack_policy
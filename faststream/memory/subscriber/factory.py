@@ -0,0 +1,64 @@
+from typing import TYPE_CHECKING, Any
+
+from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+from faststream.exceptions import SetupError
+
+from .config import MemorySubscriberConfig, MemorySubscriberSpecificationConfig
+from .specification import MemorySubscriberSpecification
+from .usecase import MemoryConcurrentSubscriber, MemorySubscriber
+
+if TYPE_CHECKING:
+    from faststream.memory.configs import MemoryBrokerConfig
+    from faststream.middlewares import AckPolicy
+
+
+def create_subscriber(
+    *,
+    topic: str,
+    group: str | None,
+    # Subscriber args
+    ack_policy: "AckPolicy",
+    no_reply: bool,
+    log_sample_rate: float | None,
+    config: "MemoryBrokerConfig",
+    max_workers: int = 1,
+    # AsyncAPI args
+    title_: str | None = None,
+    description_: str | None = None,
+    include_in_schema: bool = True,
+) -> MemorySubscriber:
+    if max_workers < 1:
+        msg = "`max_workers` should be a positive number."
+        raise SetupError(msg)
+
+    subscriber_config = MemorySubscriberConfig(
+        topic=topic,
+        group=group,
+        no_reply=no_reply,
+        log_sample_rate=log_sample_rate,
+        _outer_config=config,
+        _ack_policy=ack_policy,
+    )
+
+    calls = CallsCollection[Any]()
+
+    specification = MemorySubscriberSpecification(
+        config,
+        MemorySubscriberSpecificationConfig(
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        ),
+        calls,
+        topic=topic,
+    )
+
+    if max_workers > 1:
+        return MemoryConcurrentSubscriber(
+            subscriber_config,
+            specification,
+            calls,
+            max_workers=max_workers,
+        )
+
+    return MemorySubscriber(subscriber_config, specification, calls)
@@ -0,0 +1,55 @@
+from typing import TYPE_CHECKING, Any
+
+from faststream._internal.endpoint.subscriber import SubscriberSpecification
+from faststream.memory.configs import MemoryBrokerConfig
+from faststream.specification.asyncapi.utils import resolve_payloads
+from faststream.specification.schema import Message, Operation, SubscriberSpec
+
+from .config import MemorySubscriberSpecificationConfig
+
+if TYPE_CHECKING:
+    from faststream._internal.endpoint.subscriber.call_item import (
+        CallsCollection,
+    )
+
+
+class MemorySubscriberSpecification(
+    SubscriberSpecification[MemoryBrokerConfig, MemorySubscriberSpecificationConfig],
+):
+    def __init__(
+        self,
+        _outer_config: MemoryBrokerConfig,
+        specification_config: MemorySubscriberSpecificationConfig,
+        calls: "CallsCollection[Any]",
+        topic: str,
+    ) -> None:
+        super().__init__(_outer_config, specification_config, calls)
+        self.topic = topic
+
+    @property
+    def topic_name(self) -> str:
+        return f"{self._outer_config.prefix}{self.topic}"
+
+    @property
+    def name(self) -> str:
+        if self.config.title_:
+            return self.config.title_
+
+        return f"{self.topic_name}:{self.call_name}"
+
+    def get_schema(self) -> dict[str, SubscriberSpec]:
+        payloads = self.get_payloads()
+
+        return {
+            self.name: SubscriberSpec(
+                description=self.description,
+                operation=Operation(
+                    message=Message(
+                        title=f"{self.name}:Message",
+                        payload=resolve_payloads(payloads),
+                    ),
+                    bindings=None,
+                ),
+                bindings=None,
+            ),
+        }
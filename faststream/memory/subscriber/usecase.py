@@ -0,0 +1,173 @@
+from collections.abc import AsyncIterator, Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+import anyio
+from typing_extensions import override
+
+from faststream._internal.endpoint.subscriber import SubscriberUsecase
+from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin, TasksMixin
+from faststream._internal.endpoint.utils import process_msg
+from faststream.memory.message import MemoryRawMessage
+from faststream.memory.parser import MemoryParser
+from faststream.memory.publisher.fake import MemoryFakePublisher
+from faststream.message import gen_cor_id
+
+if TYPE_CHECKING:
+    from faststream._internal.endpoint.publisher import PublisherProto
+    from faststream._internal.endpoint.subscriber.call_item import (
+        CallsCollection,
+    )
+    from faststream.memory.configs import MemoryBrokerConfig, MemoryQueue
+    from faststream.memory.message import MemoryMessage
+    from faststream.message import StreamMessage as BrokerStreamMessage
+
+    from .config import MemorySubscriberConfig
+    from .specification import MemorySubscriberSpecification
+
+
+class MemorySubscriber(TasksMixin, SubscriberUsecase[MemoryRawMessage]):
+    """A class to represent a memory broker subscriber.
+
+    Subscribers with the same `group` compete for messages of the shared group
+    queue, subscribers without a group get all topic messages.
+    """
+
+    _outer_config: "MemoryBrokerConfig"
+
+    def __init__(
+        self,
+        config: "MemorySubscriberConfig",
+        specification: "MemorySubscriberSpecification",
+        calls: "CallsCollection[Any]",
+    ) -> None:
+        parser = MemoryParser()
+        config.parser = parser.parse_message
+        config.decoder = parser.decode_message
+        super().__init__(config, specification, calls)
+
+        self._topic = config.topic
+        self.group = config.group
+
+        # not grouped subscriber has its own exclusive queue
+        self._queue_name = config.group or gen_cor_id()
+        self._queue: MemoryQueue | None = None
+
+    @property
+    def topic(self) -> str:
+        return f"{self._outer_config.prefix}{self._topic}"
+
+    @property
+    def queue(self) -> "MemoryQueue":
+        assert self._queue is not None, "You should start subscriber at first."
+        return self._queue
+
+    @override
+    async def start(self) -> None:
+        if self.tasks:
+            return
+
+        await super().start()
+
+        self._queue = self._outer_config.connection.topic(self.topic).subscribe(
+            self._queue_name,
+        )
+
+        self._post_start()
+
+        if self.calls:
+            self.add_task(self._consume(self._queue))
+
+    @override
+    async def stop(self) -> None:
+        await super().stop()
+
+        if self._queue is not None:
+            if self._outer_config.connection:
+                self._outer_config.connection.topic(self.topic).unsubscribe(
+                    self._queue_name,
+                )
+
+            self._queue = None
+
+    async def _consume(self, queue: "MemoryQueue") -> None:
+        while self.running:
+            msg = await queue.get()
+            await self.consume_one(msg)
+
+    async def consume_one(self, msg: MemoryRawMessage) -> None:
+        await self.consume(msg)
+
+    @override
+    async def get_one(
+        self,
+        *,
+        timeout: float = 5.0,
+    ) -> "MemoryMessage | None":
+        assert not self.calls, (
+            "You can't use `get_one` method if subscriber has registered handlers."
+        )
+
+        raw_message = None
+        with anyio.move_on_after(timeout):
+            raw_message = await self.queue.get()
+
+        if raw_message is None:
+            return None
+
+        return await self._process_raw(raw_message)
+
+    @override
+    async def __aiter__(self) -> AsyncIterator["MemoryMessage"]:  # type: ignore[override]
+        assert not self.calls, (
+            "You can't use iterator if subscriber has registered handlers."
+        )
+
+        while True:
+            raw_message = await self.queue.get()
+            yield await self._process_raw(raw_message)
+
+    async def _process_raw(self, raw_message: MemoryRawMessage) -> "MemoryMessage":
+        context = self._outer_config.fd_config.context
+
+        msg: MemoryMessage = await process_msg(  # type: ignore[assignment]
+            msg=raw_message,
+            middlewares=(
+                m(raw_message, context=context) for m in self._broker_middlewares
+            ),
+            parser=self._parser,
+            decoder=self._decoder,
+        )
+        return msg
+
+    def _make_response_publisher(
+        self,
+        message: "BrokerStreamMessage[MemoryRawMessage]",
+    ) -> Sequence["PublisherProto"]:
+        return (
+            MemoryFakePublisher(
+                self._outer_config.producer,
+                topic=message.reply_to,
+            ),
+        )
+
+    def get_log_context(
+        self,
+        message: Optional["BrokerStreamMessage[Any]"],
+    ) -> dict[str, str]:
+        return {
+            "topic": self.topic,
+            "group_id": self.group or "",
+            "message_id": getattr(message, "message_id", ""),
+        }
+
+
+class MemoryConcurrentSubscriber(
+    ConcurrentMixin[MemoryRawMessage],
+    MemorySubscriber,
+):
+    async def start(self) -> None:
+        await super().start()
+        self.start_consume_task()
+
+    async def consume_one(self, msg: MemoryRawMessage) -> None:
+        await self._put_msg(msg)
@@ -1,12 +1,20 @@
 from .message import AckStatus, StreamMessage
 from .source_type import SourceType
-from .utils import decode_message, encode_message, gen_cor_id
+from .utils import (
+    decode_batch_bodies,
+    decode_message,
+    encode_message,
+    gen_cor_id,
+    loads_json_batch,
+)
 
 __all__ = (
     "AckStatus",
     "SourceType",
     "StreamMessage",
+    "decode_batch_bodies",
     "decode_message",
     "encode_message",
     "gen_cor_id",
+    "loads_json_batch",
 )
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
@@ -24,7 +25,31 @@ class AckStatus(str, Enum):
 
 
 class StreamMessage(Generic[MsgType]):
-    """Generic class to represent a stream message."""
+    """Generic class to represent a stream message.
+
+    Empty headers and path, batch headers and the correlation and message ids
+    are built on the first access to make the messages parsing cheaper.
+    """
+
+    # `__dict__` allows integrations and middlewares to store extra attributes,
+    # the dict is allocated only for such messages
+    __slots__ = (
+        "__decoded_caches",
+        "__decoder",
+        "__dict__",
+        "_batch_headers",
+        "_correlation_id",
+        "_headers",
+        "_message_id",
+        "_path",
+        "body",
+        "committed",
+        "content_type",
+        "processed",
+        "raw_message",
+        "reply_to",
+        "source_type",
+    )
 
     def __init__(
         self,
@@ -33,7 +58,9 @@ class StreamMessage(Generic[MsgType]):
         *,
         headers: dict[str, Any] | None = None,
         reply_to: str = "",
-        batch_headers: list[dict[str, Any]] | None = None,
+        batch_headers: list[dict[str, Any]]
+        | Callable[[], list[dict[str, Any]]]
+        | None = None,
         path: dict[str, Any] | None = None,
         content_type: str | None = None,
         correlation_id: str | None = None,
@@ -46,11 +73,11 @@ class StreamMessage(Generic[MsgType]):
         self.content_type = content_type
         self.source_type = source_type
 
-        self.headers = headers or {}
-        self.batch_headers = batch_headers or []
-        self.path = path or {}
-        self.correlation_id = correlation_id or str(uuid4())
-        self.message_id = message_id or self.correlation_id
+        self._headers = headers or None
+        self._batch_headers = batch_headers or None
+        self._path = path or None
+        self._correlation_id = correlation_id or None
+        self._message_id = message_id or None
 
         self.committed: AckStatus | None = None
         self.processed = False
@@ -62,6 +89,58 @@ class StreamMessage(Generic[MsgType]):
             Any,
         ] = {}  # Cache values between filters and tests
 
+    @property
+    def headers(self) -> dict[str, Any]:
+        if self._headers is None:
+            self._headers = {}
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: dict[str, Any]) -> None:
+        self._headers = value
+
+    @property
+    def batch_headers(self) -> list[dict[str, Any]]:
+        if self._batch_headers is None:
+            self._batch_headers = []
+        elif callable(self._batch_headers):
+            self._batch_headers = self._batch_headers()
+        return self._batch_headers
+
+    @batch_headers.setter
+    def batch_headers(self, value: list[dict[str, Any]]) -> None:
+        self._batch_headers = value
+
+    @property
+    def path(self) -> dict[str, Any]:
+        if self._path is None:
+            self._path = {}
+        return self._path
+
+    @path.setter
+    def path(self, value: dict[str, Any]) -> None:
+        self._path = value
+
+    @property
+    def correlation_id(self) -> str:
+        if self._correlation_id is None:
+            self._correlation_id = str(uuid4())
+        return self._correlation_id
+
+    @correlation_id.setter
+    def correlation_id(self, value: str) -> None:
+        self._correlation_id = value
+
+    @property
+    def message_id(self) -> str:
+        if self._message_id is None:
+            self._message_id = self.correlation_id
+        return self._message_id
+
+    @message_id.setter
+    def message_id(self, value: str) -> None:
+        self._message_id = value
+
     def set_decoder(self, decoder: "AsyncCallable") -> None:
         self.__decoder = decoder
 
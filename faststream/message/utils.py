@@ -1,10 +1,11 @@
 import json
 from collections.abc import Sequence
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from itertools import starmap
+from typing import TYPE_CHECKING, Any, Optional, Union
 from uuid import uuid4
 
-from faststream._internal._compat import json_dumps, json_loads
+from faststream._internal._compat import json_dumps, json_loads, msgspec
 from faststream._internal.constants import ContentTypes
 
 if TYPE_CHECKING:
@@ -15,6 +16,11 @@ if TYPE_CHECKING:
     from .message import StreamMessage
 
 
+if msgspec is not None:
+    _split_json_array = msgspec.json.Decoder(list[msgspec.Raw])
+    _json_decoder = msgspec.json.Decoder()
+
+
 def gen_cor_id() -> str:
     """Generate random string to use as ID."""
     return str(uuid4())
@@ -23,10 +29,64 @@ def gen_cor_id() -> str:
 def decode_message(message: "StreamMessage[Any]") -> "DecodedMessage":
     """Decodes a message."""
     body: Any = getattr(message, "body", message)
+    return _decode_body(body, getattr(message, "content_type", None))
+
+
+def decode_batch_bodies(
+    bodies: Sequence[bytes],
+    content_types: Sequence[str | None],
+) -> list["DecodedMessage"]:
+    """Decodes a batch of messages bodies.
+
+    JSON bodies are parsed as a single array by `msgspec`
+    if their boundaries can be validated.
+    """
+    json_type = ContentTypes.JSON.value
+    if all(ct == json_type for ct in content_types) and (
+        (decoded := loads_json_batch(bodies)) is not None
+    ):
+        return decoded
+
+    return list(starmap(_decode_body, zip(bodies, content_types, strict=True)))
+
+
+def loads_json_batch(bodies: Sequence[bytes]) -> list[Any] | None:
+    """Parses JSON documents sequence as a single array by `msgspec`.
+
+    Returns `None` if some of the documents are not valid JSON by themselves
+    or there is no `msgspec` installed to check it.
+    """
+    if not bodies:
+        return []
+
+    if msgspec is None:
+        return None
+
+    data = b"[" + b",".join(bodies) + b"]"
+
+    try:
+        raw_documents = _split_json_array.decode(data)
+    except msgspec.DecodeError:
+        return None
+
+    # invalid documents like `1,2` or `[3` + `4]` can be joined to a valid array,
+    # so each array item should be exactly the related document
+    if len(raw_documents) != len(bodies) or any(
+        bytes(raw) != body.strip()
+        for raw, body in zip(raw_documents, bodies, strict=True)
+    ):
+        return None
+
+    # decode the already split documents instead of parsing the array again
+    decode = _json_decoder.decode
+    return [decode(raw) for raw in raw_documents]
+
+
+def _decode_body(body: Any, content_type: str | None) -> "DecodedMessage":
     m: DecodedMessage = body
 
-    if content_type := getattr(message, "content_type", False):
-        content_type = ContentTypes(cast("str", content_type))
+    if content_type:
+        content_type = ContentTypes(content_type)
 
         if content_type is ContentTypes.TEXT:
             m = body.decode()
@@ -1,3 +1,4 @@
+from random import random
 from typing import TYPE_CHECKING, Any, Optional
 
 from faststream._internal.middlewares import BaseMiddleware
@@ -14,9 +15,15 @@ if TYPE_CHECKING:
 
 
 class CriticalLogMiddleware:
-    def __init__(self, logger: "LoggerState") -> None:
+    def __init__(
+        self,
+        logger: "LoggerState",
+        sample_rate: float | None = None,
+    ) -> None:
         """Initialize the class."""
         self.logger = logger
+        # subscriber override of the broker `log_sample_rate`
+        self.sample_rate = sample_rate
 
     def __call__(
         self,
@@ -27,6 +34,9 @@ class CriticalLogMiddleware:
     ) -> "_LoggingMiddleware":
         return _LoggingMiddleware(
             logger=self.logger,
+            sample_rate=(
+                self.logger.sample_rate if self.sample_rate is None else self.sample_rate
+            ),
             msg=msg,
             context=context,
         )
@@ -41,10 +51,13 @@ class _LoggingMiddleware(BaseMiddleware):
         logger: "LoggerState",
         context: "ContextRepo",
         msg: Any | None,
+        sample_rate: float = 1.0,
     ) -> None:
         super().__init__(msg, context=context)
         self.logger = logger
+        self.sample_rate = sample_rate
         self.source_type = SourceType.CONSUME
+        self.sampled = True
 
     async def consume_scope(
         self,
@@ -53,7 +66,10 @@ class _LoggingMiddleware(BaseMiddleware):
     ) -> Any:
         source_type = self.source_type = msg.source_type
 
-        if source_type is not SourceType.RESPONSE:
+        if (sample_rate := self.sample_rate) < 1:
+            self.sampled = random() < sample_rate  # noqa: S311
+
+        if self.sampled and source_type is not SourceType.RESPONSE:
             self.logger.log(
                 "Received",
                 extra=self.context.get_local("log_context", {}),
@@ -86,7 +102,8 @@ class _LoggingMiddleware(BaseMiddleware):
                         extra=c,
                     )
 
-            self.logger.log(message="Processed", extra=c)
+            if self.sampled:
+                self.logger.log(message="Processed", extra=c)
 
         await super().__aexit__(exc_type, exc_val, exc_tb)
 
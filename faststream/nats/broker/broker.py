@@ -411,6 +411,19 @@ class NatsBroker(
             int,
             Doc("Service messages log level."),
         ] = logging.INFO,
+        log_queue_size: Annotated[
+            int | None,
+            Doc(
+                "Size of the queue to write service messages from a background thread. "
+                "Messages are written synchronously if not set.",
+            ),
+        ] = None,
+        log_sample_rate: Annotated[
+            float,
+            Doc(
+                "Share of consumed messages to write `Received` and `Processed` lines for."
+            ),
+        ] = 1.0,
         # FastDepends args
         apply_types: Annotated[
             bool,
@@ -487,6 +500,8 @@ class NatsBroker(
                 logger=make_nats_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    queue_size=log_queue_size,
+                    sample_rate=log_sample_rate,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
@@ -683,6 +698,94 @@ class NatsBroker(
             result = await super()._basic_publish(cmd, producer=self.config.producer)
         return result
 
+    @overload  # type: ignore[override]
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: None = None,
+        timeout: float | None = None,
+    ) -> None: ...
+
+    @overload
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+    ) -> list["PubAck"]: ...
+
+    @override
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+    ) -> list["PubAck"] | None:
+        """Publish multiple messages to the same subject at once.
+
+        Regular NATS messages are written to the connection buffer and flushed once.
+        JetStream messages are published concurrently (up to 256 awaiting PubAcks at once),
+        so their order in the stream can differ from the batch order.
+
+        Args:
+            *messages:
+                Messages bodies to send.
+            subject:
+                NATS subject to send messages.
+            headers:
+                Messages headers to store metainformation.
+                **content-type** and **correlation_id** will be set automatically by framework anyway.
+            reply_to:
+                NATS subject name to send response.
+            correlation_id:
+                Manual messages **correlation_id** setter.
+                **correlation_id** is a useful option to trace messages.
+            stream:
+                This option validates that the target subject is in presented stream.
+                Can be omitted without any effect if you doesn't want PubAck frames.
+            timeout:
+                Timeout to send messages to NATS.
+
+        Returns:
+            `None` if you publishes regular messages.
+            List of `faststream.nats.PubAck` if you publishes messages to stream.
+        """
+        cmd = NatsPublishCommand(
+            *messages,
+            correlation_id=correlation_id or gen_cor_id(),
+            subject=subject,
+            headers=headers,
+            reply_to=reply_to,
+            stream=stream,
+            timeout=timeout or 0.5,
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        result: list[PubAck] | None
+        if stream:
+            result = await self._basic_publish_batch(
+                cmd,
+                producer=self.config.js_producer,
+            )
+        else:
+            result = await self._basic_publish_batch(
+                cmd,
+                producer=self.config.producer,
+            )
+        return result
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -99,6 +99,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -157,6 +158,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: int = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -215,6 +217,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -273,6 +276,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: int = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -331,6 +335,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -389,6 +394,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: int = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -447,6 +453,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -505,6 +512,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -563,6 +571,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -621,6 +630,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: int | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -679,6 +689,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         max_workers: int | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -724,6 +735,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Whether to `ack` message at start of consuming or not.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             title: AsyncAPI subscriber object title.
             description: AsyncAPI subscriber object description. Uses decorated docstring as default.
             include_in_schema: Whetever to include operation in AsyncAPI schema or not.
@@ -758,6 +770,7 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
             ack_policy=ack_policy,
             no_ack=no_ack,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             broker_config=cast("NatsBrokerConfig", self.config),
             # AsyncAPI
             title_=title,
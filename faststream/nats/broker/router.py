@@ -278,6 +278,12 @@ class NatsRoute(SubscriberRoute):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not.",
             ),
         ] = False,
+        log_sample_rate: Annotated[
+            float | None,
+            Doc(
+                "Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.",
+            ),
+        ] = None,
         # AsyncAPI information
         title: Annotated[
             str | None,
@@ -324,6 +330,7 @@ class NatsRoute(SubscriberRoute):
             ack_policy=ack_policy,
             no_ack=no_ack,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             title=title,
             description=description,
             include_in_schema=include_in_schema,
@@ -142,6 +142,8 @@ class NatsRouter(StreamRouter["Msg"]):
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue_size: int | None = None,
+        log_sample_rate: float = 1.0,
         # StreamRouter options
         setup_state: bool = True,
         schema_url: str | None = "/asyncapi",
@@ -227,6 +229,8 @@ class NatsRouter(StreamRouter["Msg"]):
             specification_tags: AsyncAPI server tags.
             logger: User specified logger to pass into Context and log service messages.
             log_level: Service messages log level.
+            log_queue_size: Size of the queue to write service messages from a background thread. Messages are written synchronously if not set.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for.
             setup_state: Whether to add broker to app scope in lifespan.
                 You should disable this option at old ASGI servers.
             schema_url: AsyncAPI schema url. You should set this option to `None` to disable AsyncAPI routes at all.
@@ -340,6 +344,8 @@ class NatsRouter(StreamRouter["Msg"]):
             description=description,
             logger=logger,
             log_level=log_level,
+            log_queue_size=log_queue_size,
+            log_sample_rate=log_sample_rate,
             specification_tags=specification_tags,
             schema_url=schema_url,
             setup_state=setup_state,
@@ -416,6 +422,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -482,6 +489,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: int = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -548,6 +556,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -614,6 +623,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: int = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -680,6 +690,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -746,6 +757,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: int = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -812,6 +824,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -878,6 +891,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -944,6 +958,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -1010,6 +1025,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: int | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -1076,6 +1092,7 @@ class NatsRouter(StreamRouter["Msg"]):
         max_workers: int | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -1127,6 +1144,7 @@ class NatsRouter(StreamRouter["Msg"]):
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Whether to `ack` message at start of consuming or not.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             title: AsyncAPI subscriber object title.
             description: AsyncAPI subscriber object description. Uses decorated docstring as default.
             include_in_schema: Whetever to include operation in AsyncAPI schema or not.
@@ -1222,6 +1240,7 @@ class NatsRouter(StreamRouter["Msg"]):
                 ack_policy=ack_policy,
                 no_ack=no_ack,
                 no_reply=no_reply,
+                log_sample_rate=log_sample_rate,
                 title=title,
                 description=description,
                 include_in_schema=include_in_schema,
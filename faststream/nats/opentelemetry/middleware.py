@@ -13,11 +13,15 @@ class NatsTelemetryMiddleware(TelemetryMiddleware[NatsPublishCommand]):
         tracer_provider: TracerProvider | None = None,
         meter_provider: MeterProvider | None = None,
         meter: Meter | None = None,
+        sample_ratio: float | None = None,
+        unsampled_metrics: bool = True,
     ) -> None:
         super().__init__(
             settings_provider_factory=telemetry_attributes_provider_factory,
             tracer_provider=tracer_provider,
             meter_provider=meter_provider,
             meter=meter,
+            sample_ratio=sample_ratio,
+            unsampled_metrics=unsampled_metrics,
             include_messages_counters=True,
         )
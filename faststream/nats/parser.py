@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any
 
 from faststream.message import (
     StreamMessage,
+    decode_batch_bodies,
     decode_message,
 )
 from faststream.nats.message import (
@@ -145,16 +146,10 @@ class BatchParser(JsParser):
         self,
         msg: "StreamMessage[list[Msg]]",
     ) -> list["DecodedMessage"]:
-        data: list[DecodedMessage] = []
-
-        path: dict[str, Any] | None = None
-        for m in msg.raw_message:
-            one_msg = await self.parse_message(m, path=path)
-            path = one_msg.path
-
-            data.append(decode_message(one_msg))
-
-        return data
+        return decode_batch_bodies(
+            [m.data for m in msg.raw_message],
+            [(m.header or {}).get("content-type") for m in msg.raw_message],
+        )
 
 
 class KvParser(NatsBaseParser):
@@ -51,12 +51,16 @@ class BatchNatsMetricsSettingsProvider(BaseNatsMetricsSettingsProvider[list["Msg
         }
 
 
+_PROVIDER = NatsMetricsSettingsProvider()
+_BATCH_PROVIDER = BatchNatsMetricsSettingsProvider()
+
+
 def settings_provider_factory(
     msg: Union["Msg", Sequence["Msg"], None],
 ) -> NatsMetricsSettingsProvider | BatchNatsMetricsSettingsProvider | None:
     if isinstance(msg, Sequence):
-        return BatchNatsMetricsSettingsProvider()
+        return _BATCH_PROVIDER
     if isinstance(msg, Msg) or msg is None:
-        return NatsMetricsSettingsProvider()
+        return _PROVIDER
     # KeyValue and Object Storage watch cases
     return None
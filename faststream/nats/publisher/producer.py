@@ -1,4 +1,5 @@
 import asyncio
+import math
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -8,7 +9,6 @@ from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException
 from faststream.message import encode_message
 from faststream.nats.helpers.state import (
     ConnectedState,
@@ -46,9 +46,11 @@ class NatsFastProducer(ProducerProto[NatsPublishCommand]):
     @abstractmethod
     async def request(self, cmd: "NatsPublishCommand") -> "Msg": ...
 
-    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
-        msg = "NATS doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+    @abstractmethod
+    async def publish_batch(
+        self,
+        cmd: "NatsPublishCommand",
+    ) -> list["PubAck"] | None: ...
 
 
 class NatsFastProducerImpl(NatsFastProducer):
@@ -97,6 +99,24 @@ class NatsFastProducerImpl(NatsFastProducer):
             headers=headers_to_send,
         )
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
+        connection = self.__state.connection
+        headers = cmd.headers_to_publish()
+
+        # messages are buffered by the client and sent by a single flush
+        for body in cmd.batch_bodies:
+            payload, content_type = encode_message(body, self.serializer)
+
+            await connection.publish(
+                subject=cmd.destination,
+                payload=payload,
+                reply=cmd.reply_to,
+                headers={"content-type": content_type or "", **headers},
+            )
+
+        await connection.flush(timeout=math.ceil(cmd.timeout))
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "Msg":
         payload, content_type = encode_message(cmd.body, self.serializer)
@@ -120,6 +140,9 @@ class NatsJSFastProducer(NatsFastProducer):
     _decoder: "AsyncCallable"
     _parser: "AsyncCallable"
 
+    # limit of batch messages waiting for their PubAcks at the same time
+    max_pending_acks = 256
+
     def __init__(
         self,
         *,
@@ -162,6 +185,28 @@ class NatsJSFastProducer(NatsFastProducer):
             timeout=cmd.timeout,
         )
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> list["PubAck"]:
+        connection = self.__state.connection
+        headers = cmd.headers_to_publish(js=True)
+        limit = asyncio.Semaphore(self.max_pending_acks)
+
+        async def publish(body: Any) -> "PubAck":
+            payload, content_type = encode_message(body, self.serializer)
+
+            async with limit:
+                return await connection.publish(
+                    subject=cmd.destination,
+                    payload=payload,
+                    headers={"content-type": content_type or "", **headers},
+                    stream=cmd.stream,
+                    timeout=cmd.timeout,
+                )
+
+        # wait for PubAcks concurrently instead of one by one, so the stream
+        # order of messages is not guaranteed, but PubAcks keep the batch order
+        return await asyncio.gather(*map(publish, cmd.batch_bodies))
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "Msg":
         payload, content_type = encode_message(cmd.body, self.serializer)
@@ -221,5 +266,4 @@ class FakeNatsFastProducer(NatsFastProducer):
 
     @override
     async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
-        msg = "NATS doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+        raise NotImplementedError
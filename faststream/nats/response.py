@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Union
 from typing_extensions import override
 
 from faststream.response.publish_type import PublishType
-from faststream.response.response import PublishCommand, Response
+from faststream.response.response import BatchPublishCommand, PublishCommand, Response
 
 if TYPE_CHECKING:
     from faststream._internal.basic_types import SendableMessage
@@ -38,11 +38,11 @@ class NatsResponse(Response):
         )
 
 
-class NatsPublishCommand(PublishCommand):
+class NatsPublishCommand(BatchPublishCommand):
     def __init__(
         self,
         message: "SendableMessage",
-        *,
+        *messages: "SendableMessage",
         subject: str = "",
         correlation_id: str | None = None,
         headers: dict[str, str] | None = None,
@@ -52,7 +52,8 @@ class NatsPublishCommand(PublishCommand):
         _publish_type: PublishType,
     ) -> None:
         super().__init__(
-            body=message,
+            message,
+            *messages,
             destination=subject,
             correlation_id=correlation_id,
             headers=headers,
@@ -78,13 +79,18 @@ class NatsPublishCommand(PublishCommand):
     def from_cmd(
         cls,
         cmd: Union["PublishCommand", "NatsPublishCommand"],
+        *,
+        batch: bool = False,
     ) -> "NatsPublishCommand":
         if isinstance(cmd, NatsPublishCommand):
             # NOTE: Should return a copy probably.
             return cmd
 
+        body, extra_bodies = cls._parse_bodies(cmd.body, batch=batch)
+
         return cls(
-            message=cmd.body,
+            body,
+            *extra_bodies,
             subject=cmd.destination,
             correlation_id=cmd.correlation_id,
             headers=cmd.headers,
@@ -9,11 +9,21 @@ class PullSub:
         timeout (:obj:`float`, optional): Wait this time for required batch size will be accumulated in stream
             in seconds (default is `5.0`).
         batch (bool): Whether to propagate consuming batch as iterable object to your handler (default is `False`).
+        prefetch (int): How many batches can be fetched in advance while the current one is processing.
+            `0` means the next batch is fetched only after the current one was processed (default is `0`).
+        max_prefetch_bytes (:obj:`int`, optional): Payload size limit of fetched but not processed yet messages.
+            Next fetch is delayed until this limit is released (default is `None`).
+        batch_latency (:obj:`float`, optional): Target batch processing time in seconds. If set, batch subscriber
+            fetch size adapts between `1` and `batch_size` to keep each batch processing time close to it
+            (default is `None`).
     """
 
     __slots__ = (
         "batch",
+        "batch_latency",
         "batch_size",
+        "max_prefetch_bytes",
+        "prefetch",
         "timeout",
     )
 
@@ -22,10 +32,16 @@ class PullSub:
         batch_size: int = 1,
         timeout: float | None = 5.0,
         batch: bool = False,
+        prefetch: int = 0,
+        max_prefetch_bytes: int | None = None,
+        batch_latency: float | None = None,
     ) -> None:
         self.batch_size = batch_size
         self.batch = batch
         self.timeout = timeout
+        self.prefetch = prefetch
+        self.max_prefetch_bytes = max_prefetch_bytes
+        self.batch_latency = batch_latency
 
     @overload
     @classmethod
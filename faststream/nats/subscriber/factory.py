@@ -74,6 +74,7 @@ def create_subscriber(
     ack_policy: "AckPolicy",
     no_ack: bool,
     no_reply: bool,
+    log_sample_rate: float | None,
     broker_config: "NatsBrokerConfig",
     # Specification information
     title_: str | None,
@@ -159,6 +160,7 @@ def create_subscriber(
         sub_config=config,
         extra_options=extra_options,
         no_reply=no_reply,
+        log_sample_rate=log_sample_rate,
         _outer_config=broker_config,
         _ack_first=ack_first,
         _ack_policy=ack_policy,
@@ -356,6 +358,19 @@ def _validate_input_for_misconfigure(  # noqa: PLR0915
         msg = "JetStream Pull Subscriber can only be used with the `stream` option."
         raise SetupError(msg)
 
+    if pull_sub and pull_sub.prefetch < 0:
+        msg = "`PullSub.prefetch` option should be a non-negative number."
+        raise SetupError(msg)
+
+    if pull_sub and pull_sub.batch_latency is not None:
+        if not pull_sub.batch:
+            msg = "`PullSub.batch_latency` option can be used with `batch=True` only."
+            raise SetupError(msg)
+
+        if pull_sub.batch_latency <= 0:
+            msg = "`PullSub.batch_latency` option should be a positive number."
+            raise SetupError(msg)
+
     if not subject and not config:
         msg = "You must provide either the `subject` or `config` option."
         raise SetupError(msg)
@@ -6,6 +6,7 @@ import anyio
 from nats.errors import ConnectionClosedError, TimeoutError
 from typing_extensions import override
 
+from faststream._internal.endpoint.subscriber.batching import AdaptiveBatchSize
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin, TasksMixin
 from faststream._internal.endpoint.utils import process_msg
 from faststream.nats.parser import (
@@ -27,8 +28,82 @@ if TYPE_CHECKING:
     from faststream.nats.subscriber.config import NatsSubscriberConfig
 
 
+class _PrefetchMixin(TasksMixin):
+    """Fetches the next pull batches while the current one is processing."""
+
+    subscription: Optional["JetStreamContext.PullSubscription"]
+    pull_sub: "PullSub"
+    adaptive_batch_size: AdaptiveBatchSize | None = None
+
+    async def _fetch(self) -> list["Msg"]:
+        assert self.subscription, "You should call `create_subscription` at first."
+
+        if self.adaptive_batch_size is not None:
+            batch_size = self.adaptive_batch_size.size
+        else:
+            batch_size = self.pull_sub.batch_size
+
+        with suppress(TimeoutError, ConnectionClosedError):
+            return await self.subscription.fetch(
+                batch=batch_size,
+                timeout=self.pull_sub.timeout,
+            )
+
+        return []
+
+    async def _consume_batches(
+        self,
+        handler: Callable[[list["Msg"]], Awaitable[None]],
+    ) -> None:
+        """Process fetched batches until subscriber is running."""
+        if not self.pull_sub.prefetch:
+            while self.running:  # pragma: no branch
+                if messages := await self._fetch():
+                    await handler(messages)
+            return
+
+        send_stream, receive_stream = anyio.create_memory_object_stream[list["Msg"]](
+            max_buffer_size=self.pull_sub.prefetch,
+        )
+        buffer_released = anyio.Condition()
+        buffered_bytes = 0
+
+        def has_capacity() -> bool:
+            max_bytes = self.pull_sub.max_prefetch_bytes
+            return max_bytes is None or buffered_bytes < max_bytes
+
+        async def prefetch() -> None:
+            nonlocal buffered_bytes
+
+            async with send_stream:
+                while self.running:  # pragma: no branch
+                    async with buffer_released:
+                        while not has_capacity():
+                            await buffer_released.wait()
+
+                    if messages := await self._fetch():
+                        buffered_bytes += _batch_size(messages)
+                        await send_stream.send(messages)
+
+        # prefetch errors cancel the processing and vice versa
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(prefetch)
+
+            async with receive_stream:
+                async for messages in receive_stream:
+                    await handler(messages)
+
+                    buffered_bytes -= _batch_size(messages)
+                    async with buffer_released:
+                        buffer_released.notify()
+
+
+def _batch_size(messages: list["Msg"]) -> int:
+    return sum(len(m.data) for m in messages)
+
+
 class PullStreamSubscriber(
-    TasksMixin,
+    _PrefetchMixin,
     StreamSubscriber,
 ):
     subscription: Optional["JetStreamContext.PullSubscription"]
@@ -72,20 +147,13 @@ class PullStreamSubscriber(
         cb: Callable[["Msg"], Awaitable["SendableMessage"]],
     ) -> None:
         """Endless task consuming messages using NATS Pull subscriber."""
-        assert self.subscription
 
-        while self.running:  # pragma: no branch
-            messages = []
-            with suppress(TimeoutError, ConnectionClosedError):
-                messages = await self.subscription.fetch(
-                    batch=self.pull_sub.batch_size,
-                    timeout=self.pull_sub.timeout,
-                )
+        async def handle(messages: list["Msg"]) -> None:
+            async with anyio.create_task_group() as tg:
+                for msg in messages:
+                    tg.start_soon(cb, msg)
 
-            if messages:
-                async with anyio.create_task_group() as tg:
-                    for msg in messages:
-                        tg.start_soon(cb, msg)
+        await self._consume_batches(handle)
 
 
 class ConcurrentPullStreamSubscriber(ConcurrentMixin["Msg"], PullStreamSubscriber):
@@ -106,7 +174,7 @@ class ConcurrentPullStreamSubscriber(ConcurrentMixin["Msg"], PullStreamSubscribe
 
 
 class BatchPullStreamSubscriber(
-    TasksMixin,
+    _PrefetchMixin,
     DefaultSubscriber[list["Msg"]],
 ):
     """Batch-message consumer class."""
@@ -131,6 +199,12 @@ class BatchPullStreamSubscriber(
         self.stream = stream
         self.pull_sub = pull_sub
 
+        if pull_sub.batch_latency is not None:
+            self.adaptive_batch_size = AdaptiveBatchSize(
+                pull_sub.batch_latency,
+                max_size=pull_sub.batch_size,
+            )
+
     @override
     async def get_one(
         self,
@@ -219,14 +293,12 @@ class BatchPullStreamSubscriber(
 
     async def _consume_pull(self) -> None:
         """Endless task consuming messages using NATS Pull subscriber."""
-        assert self.subscription, "You should call `create_subscription` at first."
+        await self._consume_batches(self._consume_batch)
 
-        while self.running:  # pragma: no branch
-            with suppress(TimeoutError, ConnectionClosedError):
-                messages = await self.subscription.fetch(
-                    batch=self.pull_sub.batch_size,
-                    timeout=self.pull_sub.timeout,
-                )
+    async def _consume_batch(self, messages: list["Msg"]) -> None:
+        if self.adaptive_batch_size is None:
+            await self.consume(messages)
+            return
 
-                if messages:
-                    await self.consume(messages)
+        with self.adaptive_batch_size.measure(len(messages)):
+            await self.consume(messages)
@@ -1,4 +1,4 @@
-from collections.abc import Generator, Iterable, Iterator
+from collections.abc import Generator, Iterable, Iterator, Sequence
 from contextlib import ExitStack, contextmanager
 from typing import TYPE_CHECKING, Any, Optional, cast
 from unittest.mock import AsyncMock
@@ -9,6 +9,7 @@ from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.testing.broker import TestBroker
+from faststream._internal.testing.routing import RoutingIndex, RoutingTable
 from faststream.exceptions import SubscriberNotFound
 from faststream.message import encode_message, gen_cor_id
 from faststream.nats.broker import NatsBroker
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
 
     from faststream._internal.basic_types import SendableMessage
     from faststream._internal.configs.broker import ConfigComposition
+    from faststream._internal.endpoint.subscriber import SubscriberUsecase
     from faststream.nats.configs import NatsBrokerConfig
     from faststream.nats.publisher.usecase import LogicPublisher
     from faststream.nats.response import NatsPublishCommand
@@ -103,6 +105,8 @@ class FakeProducer(NatsFastProducer):
         self._parser = ParserComposition(broker._parser, default.parse_message)
         self._decoder = ParserComposition(broker._decoder, default.decode_message)
 
+        self._routes = RoutingTable(broker, _build_routes)
+
     @override
     async def publish(self, cmd: "NatsPublishCommand") -> None:
         incoming = build_message(
@@ -115,7 +119,7 @@ class FakeProducer(NatsFastProducer):
         )
 
         for handler in _find_handler(
-            cast("list[LogicSubscriber[Any]]", self.broker.subscribers),
+            self._routes.index.match(cmd.destination),
             cmd.destination,
             cmd.stream,
         ):
@@ -128,6 +132,32 @@ class FakeProducer(NatsFastProducer):
 
             await self._execute_handler(msg, cmd.destination, handler)
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
+        incoming = [
+            build_message(
+                message=body,
+                subject=cmd.destination,
+                headers=cmd.headers,
+                correlation_id=cmd.correlation_id,
+                reply_to=cmd.reply_to,
+                serializer=self.broker.config.fd_config._serializer,
+            )
+            for body in cmd.batch_bodies
+        ]
+
+        for handler in _find_handler(
+            self._routes.index.match(cmd.destination),
+            cmd.destination,
+            cmd.stream,
+        ):
+            if (pull := getattr(handler, "pull_sub", None)) and pull.batch:
+                await self._execute_handler(incoming, cmd.destination, handler)
+
+            else:
+                for msg in incoming:
+                    await self._execute_handler(msg, cmd.destination, handler)
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "PatchedMessage":
         incoming = build_message(
@@ -139,7 +169,7 @@ class FakeProducer(NatsFastProducer):
         )
 
         for handler in _find_handler(
-            cast("list[LogicSubscriber[Any]]", self.broker.subscribers),
+            self._routes.index.match(cmd.destination),
             cmd.destination,
             cmd.stream,
         ):
@@ -172,6 +202,20 @@ class FakeProducer(NatsFastProducer):
         )
 
 
+def _build_routes(
+    subscribers: Sequence["SubscriberUsecase[Any]"],
+) -> RoutingIndex["LogicSubscriber[Any]"]:
+    index: RoutingIndex[LogicSubscriber[Any]] = RoutingIndex(single="*", multi=">")
+
+    for handler in cast("Sequence[LogicSubscriber[Any]]", subscribers):
+        index.add_pattern(handler.clear_subject, handler)
+
+        for filter_subject in handler.filter_subjects or ():
+            index.add_pattern(filter_subject, handler)
+
+    return index
+
+
 def _find_handler(
     subscribers: Iterable["LogicSubscriber[Any]"],
     subject: str,
@@ -2,13 +2,20 @@ import time
 from collections import defaultdict
 from collections.abc import Callable
 from copy import copy
+from random import getrandbits, random
 from typing import TYPE_CHECKING, Any, Generic, Optional, cast
 
 from opentelemetry import baggage, context, metrics, trace
 from opentelemetry.baggage.propagation import W3CBaggagePropagator
 from opentelemetry.context import Context
 from opentelemetry.semconv.trace import SpanAttributes
-from opentelemetry.trace import Link, Span
+from opentelemetry.trace import (
+    Link,
+    NonRecordingSpan,
+    Span,
+    SpanContext,
+    TraceFlags,
+)
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from faststream._internal.middlewares import BaseMiddleware
@@ -46,8 +53,10 @@ class TelemetryMiddleware(Generic[PublishCommandType]):
     __slots__ = (
         "_meter",
         "_metrics",
+        "_sample_ratio",
         "_settings_provider_factory",
         "_tracer",
+        "_unsampled_metrics",
     )
 
     def __init__(
@@ -61,12 +70,17 @@ class TelemetryMiddleware(Generic[PublishCommandType]):
         meter_provider: Optional["MeterProvider"] = None,
         meter: Optional["Meter"] = None,
         include_messages_counters: bool = False,
+        sample_ratio: float | None = None,
+        unsampled_metrics: bool = True,
     ) -> None:
         self._tracer = _get_tracer(tracer_provider)
         self._meter = _get_meter(meter_provider, meter)
         self._metrics = _MetricsContainer(self._meter, include_messages_counters)
         self._settings_provider_factory = settings_provider_factory
 
+        self._sample_ratio = sample_ratio
+        self._unsampled_metrics = unsampled_metrics
+
     def __call__(
         self,
         msg: Any | None,
@@ -80,6 +94,8 @@ class TelemetryMiddleware(Generic[PublishCommandType]):
             metrics_container=self._metrics,
             settings_provider_factory=self._settings_provider_factory,
             context=context,
+            sample_ratio=self._sample_ratio,
+            unsampled_metrics=self._unsampled_metrics,
         )
 
 
@@ -168,11 +184,15 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
         ],
         metrics_container: _MetricsContainer,
         context: "ContextRepo",
+        sample_ratio: float | None = None,
+        unsampled_metrics: bool = True,
     ) -> None:
         super().__init__(msg, context=context)
 
         self._tracer = tracer
         self._metrics = metrics_container
+        self._sample_ratio = sample_ratio
+        self._unsampled_metrics = unsampled_metrics
         self._current_span: Span | None = None
         self._origin_context: Context | None = None
         self._scope_tokens: list[tuple[str, Token[Any]]] = []
@@ -188,12 +208,25 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
 
         headers = msg.headers
         current_context = context.get_current()
-        destination_name = provider.get_publish_destination_name(msg)
 
         current_baggage: Baggage | None = self.context.get_local("baggage")
         if current_baggage:
             headers.update(current_baggage.to_headers())
 
+        if self._current_span is None and not self._is_sampled(current_context):
+            _TRACE_PROPAGATOR.inject(
+                headers,
+                context=_set_unsampled_span(current_context),
+            )
+            result = await self._publish_unsampled(call_next, msg, provider)
+
+            for key, token in self._scope_tokens:
+                self.context.reset_local(key, token)
+
+            return result
+
+        destination_name = provider.get_publish_destination_name(msg)
+
         trace_attributes = provider.get_publish_attrs_from_cmd(msg)
         metrics_attributes = {
             SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
@@ -270,6 +303,11 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
             links = None
             current_context = _TRACE_PROPAGATOR.extract(msg.headers)
 
+        if not self._is_sampled(current_context):
+            return await self._consume_unsampled(
+                call_next, msg, provider, current_context
+            )
+
         destination_name = provider.get_consume_destination_name(msg)
         trace_attributes = provider.get_consume_attrs_from_message(msg)
         metrics_attributes = {
@@ -334,6 +372,103 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
 
         return result
 
+    def _is_sampled(self, parent_context: Context) -> bool:
+        if self._sample_ratio is None:
+            return True
+
+        span_context = trace.get_current_span(parent_context).get_span_context()
+        if span_context.is_valid:
+            return span_context.trace_flags.sampled
+
+        return random() < self._sample_ratio  # noqa: S311
+
+    async def _publish_unsampled(
+        self,
+        call_next: "AsyncFunc",
+        msg: "PublishCommandType",
+        provider: "TelemetrySettingsProvider[Any, PublishCommandType]",
+    ) -> Any:
+        if not self._unsampled_metrics:
+            return await call_next(msg)
+
+        metrics_attributes = {
+            SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
+            SpanAttributes.MESSAGING_DESTINATION_NAME: provider.get_publish_destination_name(
+                msg
+            ),
+        }
+
+        start_time = time.perf_counter()
+
+        try:
+            return await call_next(msg)
+
+        except Exception as e:
+            metrics_attributes[ERROR_TYPE] = type(e).__name__
+            raise
+
+        finally:
+            duration = time.perf_counter() - start_time
+            self._metrics.observe_publish(
+                metrics_attributes,
+                duration,
+                len(msg.batch_bodies),
+            )
+
+    async def _consume_unsampled(
+        self,
+        call_next: "AsyncFuncAny",
+        msg: "StreamMessage[Any]",
+        provider: "TelemetrySettingsProvider[Any, PublishCommandType]",
+        parent_context: Context,
+    ) -> Any:
+        # keep the unsampled decision for messages published by the handler
+        current_context = _set_unsampled_span(parent_context)
+
+        self._scope_tokens.append((
+            "span",
+            self.context.set_local("span", trace.get_current_span(current_context)),
+        ))
+        self._scope_tokens.append(
+            (
+                "baggage",
+                self.context.set_local("baggage", Baggage.from_msg(msg)),
+            ),
+        )
+
+        token = context.attach(current_context)
+
+        if not self._unsampled_metrics:
+            try:
+                return await call_next(msg)
+            finally:
+                context.detach(token)
+
+        metrics_attributes = {
+            SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
+            MESSAGING_DESTINATION_PUBLISH_NAME: provider.get_consume_destination_name(
+                msg
+            ),
+        }
+
+        start_time = time.perf_counter()
+
+        try:
+            return await call_next(msg)
+
+        except Exception as e:
+            metrics_attributes[ERROR_TYPE] = type(e).__name__
+            raise
+
+        finally:
+            context.detach(token)
+            duration = time.perf_counter() - start_time
+            self._metrics.observe_consume(
+                metrics_attributes,
+                duration,
+                len(msg.batch_headers) or 1,
+            )
+
     async def after_processed(
         self,
         exc_type: type[BaseException] | None = None,
@@ -367,6 +502,22 @@ def _get_tracer(tracer_provider: Optional["TracerProvider"] = None) -> "Tracer":
     )
 
 
+def _set_unsampled_span(parent_context: Context) -> Context:
+    """Return the context with a valid span to propagate the unsampled decision."""
+    if trace.get_current_span(parent_context).get_span_context().is_valid:
+        return parent_context
+
+    span = NonRecordingSpan(
+        SpanContext(
+            trace_id=getrandbits(128),
+            span_id=getrandbits(64),
+            is_remote=False,
+            trace_flags=TraceFlags(TraceFlags.DEFAULT),
+        ),
+    )
+    return trace.set_span_in_context(span, parent_context)
+
+
 def _create_span_name(destination: str, action: str) -> str:
     return f"{destination} {action}"
 
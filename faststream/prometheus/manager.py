@@ -1,21 +1,38 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
 from .container import MetricsContainer
 from .types import ProcessingStatus, PublishingStatus
 
+if TYPE_CHECKING:
+    from prometheus_client.metrics import MetricWrapperBase
+
 
 class MetricsManager:
-    __slots__ = ("_app_name", "_container")
+    __slots__ = ("_app_name", "_container", "_labels")
 
     def __init__(
-        self, container: MetricsContainer, *, app_name: str = "faststream"
+        self,
+        container: MetricsContainer,
+        *,
+        app_name: str = "faststream",
+        labels_cache_size: int = 4096,
     ) -> None:
         self._container = container
         self._app_name = app_name
 
+        # labeled metric children are resolved once per labels set
+        # instead of the registry lookup under lock for each message
+        self._labels = lru_cache(maxsize=labels_cache_size)(self._resolve_labels)
+
+    def _resolve_labels(self, metric: "MetricWrapperBase", *labelvalues: str) -> Any:
+        return metric.labels(self._app_name, *labelvalues)
+
     def add_received_message(self, broker: str, handler: str, amount: int = 1) -> None:
-        self._container.received_messages_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
+        self._labels(
+            self._container.received_messages_total,
+            broker,
+            handler,
         ).inc(amount)
 
     def observe_received_messages_size(
@@ -24,10 +41,10 @@ class MetricsManager:
         handler: str,
         size: int,
     ) -> None:
-        self._container.received_messages_size_bytes.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
+        self._labels(
+            self._container.received_messages_size_bytes,
+            broker,
+            handler,
         ).observe(size)
 
     def add_received_message_in_process(
@@ -36,10 +53,10 @@ class MetricsManager:
         handler: str,
         amount: int = 1,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
+        self._labels(
+            self._container.received_messages_in_process,
+            broker,
+            handler,
         ).inc(amount)
 
     def remove_received_message_in_process(
@@ -48,10 +65,10 @@ class MetricsManager:
         handler: str,
         amount: int = 1,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
+        self._labels(
+            self._container.received_messages_in_process,
+            broker,
+            handler,
         ).dec(amount)
 
     def add_received_processed_message(
@@ -61,11 +78,11 @@ class MetricsManager:
         status: ProcessingStatus,
         amount: int = 1,
     ) -> None:
-        self._container.received_processed_messages_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-            status=status.value,
+        self._labels(
+            self._container.received_processed_messages_total,
+            broker,
+            handler,
+            status.value,
         ).inc(amount)
 
     def observe_received_processed_message_duration(
@@ -74,10 +91,10 @@ class MetricsManager:
         broker: str,
         handler: str,
     ) -> None:
-        self._container.received_processed_messages_duration_seconds.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
+        self._labels(
+            self._container.received_processed_messages_duration_seconds,
+            broker,
+            handler,
         ).observe(duration)
 
     def add_received_processed_message_exception(
@@ -86,11 +103,11 @@ class MetricsManager:
         handler: str,
         exception_type: str,
     ) -> None:
-        self._container.received_processed_messages_exceptions_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-            exception_type=exception_type,
+        self._labels(
+            self._container.received_processed_messages_exceptions_total,
+            broker,
+            handler,
+            exception_type,
         ).inc()
 
     def add_published_message(
@@ -100,11 +117,11 @@ class MetricsManager:
         status: PublishingStatus,
         amount: int = 1,
     ) -> None:
-        self._container.published_messages_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            destination=destination,
-            status=status.value,
+        self._labels(
+            self._container.published_messages_total,
+            broker,
+            destination,
+            status.value,
         ).inc(amount)
 
     def observe_published_message_duration(
@@ -113,10 +130,10 @@ class MetricsManager:
         broker: str,
         destination: str,
     ) -> None:
-        self._container.published_messages_duration_seconds.labels(
-            app_name=self._app_name,
-            broker=broker,
-            destination=destination,
+        self._labels(
+            self._container.published_messages_duration_seconds,
+            broker,
+            destination,
         ).observe(duration)
 
     def add_published_message_exception(
@@ -125,9 +142,9 @@ class MetricsManager:
         destination: str,
         exception_type: str,
     ) -> None:
-        self._container.published_messages_exceptions_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            destination=destination,
-            exception_type=exception_type,
+        self._labels(
+            self._container.published_messages_exceptions_total,
+            broker,
+            destination,
+            exception_type,
         ).inc()
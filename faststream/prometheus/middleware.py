@@ -39,6 +39,7 @@ class PrometheusMiddleware(Generic[PublishCommandType, AnyMsg]):
         app_name: str = EMPTY,
         metrics_prefix: str = "faststream",
         received_messages_size_buckets: Sequence[float] | None = None,
+        labels_cache_size: int = 4096,
     ) -> None:
         if app_name is EMPTY:
             app_name = metrics_prefix
@@ -52,6 +53,7 @@ class PrometheusMiddleware(Generic[PublishCommandType, AnyMsg]):
         self._metrics_manager = MetricsManager(
             self._metrics_container,
             app_name=app_name,
+            labels_cache_size=labels_cache_size,
         )
 
     def __call__(
@@ -61,7 +63,7 @@ class PrometheusMiddleware(Generic[PublishCommandType, AnyMsg]):
         *,
         context: "ContextRepo",
     ) -> "BasePrometheusMiddleware[PublishCommandType]":
-        return BasePrometheusMiddleware[PublishCommandType](
+        return BasePrometheusMiddleware(
             msg,
             metrics_manager=self._metrics_manager,
             settings_provider_factory=self._settings_provider_factory,
@@ -104,6 +104,8 @@ class RabbitBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue_size: int | None = None,
+        log_sample_rate: float = 1.0,
         # FastDepends args
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
@@ -136,6 +138,8 @@ class RabbitBroker(
             tags: AsyncAPI server tags.
             logger: User-specified logger to pass into Context and log service messages.
             log_level: Service messages log level.
+            log_queue_size: Size of the queue to write service messages from a background thread. Messages are written synchronously if not set.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for.
             apply_types: Whether to use FastDepends or not.
             serializer: FastDepends-compatible serializer to validate incoming messages.
         """
@@ -192,6 +196,8 @@ class RabbitBroker(
                 logger=make_rabbit_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    queue_size=log_queue_size,
+                    sample_rate=log_sample_rate,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
@@ -375,6 +381,103 @@ class RabbitBroker(
         )
         return result
 
+    @override
+    async def publish_batch(
+        self,
+        *messages: "AioPikaSendableMessage",
+        queue: Union["RabbitQueue", str] = "",
+        exchange: Union["RabbitExchange", str, None] = None,
+        routing_key: str = "",
+        # publish options
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: "TimeoutType" = None,
+        persist: bool = False,
+        reply_to: str | None = None,
+        correlation_id: str | None = None,
+        # message options
+        headers: Optional["HeadersType"] = None,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        expiration: Optional["DateType"] = None,
+        timestamp: Optional["DateType"] = None,
+        message_type: str | None = None,
+        user_id: str | None = None,
+        priority: int | None = None,
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"]]:
+        """Publish multiple messages with the same options at once.
+
+        All messages are sent to the channel without waiting for each other
+        and publisher confirmations are awaited together.
+
+        Args:
+            *messages:
+                Messages bodies to send.
+            queue:
+                Message routing key to publish with.
+            exchange:
+                Target exchange to publish messages to.
+            routing_key:
+                Message routing key to publish with. Overrides `queue` option if presented.
+            mandatory:
+                Client waits for confirmation that the message is placed to some queue. RabbitMQ returns message to client if there is no suitable queue.
+            immediate:
+                Client expects that there is consumer ready to take the message to work. RabbitMQ returns message to client if there is no suitable consumer.
+            timeout:
+                Send confirmation time from RabbitMQ.
+            persist:
+                Restore the messages on RabbitMQ reboot.
+            reply_to:
+                Reply message routing key to send with (always sending to default exchange).
+            correlation_id:
+                Manual messages **correlation_id** setter. **correlation_id** is a useful option to trace messages.
+            headers:
+                Messages headers to store metainformation.
+            content_type:
+                Messages **content-type** header. Used by application, not core RabbitMQ. Will be set automatically if not specified.
+            content_encoding:
+                Messages body content encoding, e.g. **gzip**.
+            expiration:
+                Messages expiration (lifetime) in seconds (or datetime or timedelta).
+            timestamp:
+                Messages publish timestamp. Generated automatically if not presented.
+            message_type:
+                Application-specific message type, e.g. **orders.created**.
+            user_id:
+                Publisher connection User ID, validated if set.
+            priority:
+                The messages priority (0 by default).
+
+        Returns:
+            A list of confirmation frames in the same order as messages.
+        """
+        cmd = RabbitPublishCommand(
+            *messages,
+            routing_key=routing_key or RabbitQueue.validate(queue).routing(),
+            exchange=RabbitExchange.validate(exchange),
+            correlation_id=correlation_id or gen_cor_id(),
+            app_id=self.config.app_id,
+            mandatory=mandatory,
+            immediate=immediate,
+            persist=persist,
+            reply_to=reply_to,
+            headers=headers,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            expiration=expiration,
+            message_type=message_type,
+            timestamp=timestamp,
+            user_id=user_id,
+            timeout=timeout,
+            priority=priority,
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        result: list[
+            aiormq.abc.ConfirmationFrameType | None
+        ] = await self._basic_publish_batch(cmd, producer=self._producer)
+        return result
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -63,6 +63,7 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             ),
         ] = (),
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -82,6 +83,7 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             decoder (Optional[CustomCallable], optional): Function to decode FastStream msg bytes body to python objects.
             middlewares (Sequence[SubscriberMiddleware[Any]], optional): Subscriber middlewares to wrap incoming message processing.
             no_reply (bool, optional): Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate (float | None, optional): Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             title (Optional[str], optional): AsyncAPI subscriber object title.
             description (Optional[str], optional): AsyncAPI subscriber object description. Uses decorated docstring as default.
             include_in_schema (bool, optional): Whether to include operation in AsyncAPI schema or not.
@@ -98,6 +100,7 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             ack_policy=ack_policy,
             no_ack=no_ack,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             # broker args
             config=cast("RabbitBrokerConfig", self.config),
             # specification args
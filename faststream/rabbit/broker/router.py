@@ -253,6 +253,12 @@ class RabbitRoute(SubscriberRoute):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not.",
             ),
         ] = False,
+        log_sample_rate: Annotated[
+            float | None,
+            Doc(
+                "Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.",
+            ),
+        ] = None,
         # AsyncAPI information
         title: Annotated[
             str | None,
@@ -283,6 +289,7 @@ class RabbitRoute(SubscriberRoute):
             ack_policy=ack_policy,
             no_ack=no_ack,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             title=title,
             description=description,
             include_in_schema=include_in_schema,
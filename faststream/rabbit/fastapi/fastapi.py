@@ -161,6 +161,19 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
             int,
             Doc("Service messages log level."),
         ] = logging.INFO,
+        log_queue_size: Annotated[
+            int | None,
+            Doc(
+                "Size of the queue to write service messages from a background thread. "
+                "Messages are written synchronously if not set.",
+            ),
+        ] = None,
+        log_sample_rate: Annotated[
+            float,
+            Doc(
+                "Share of consumed messages to write `Received` and `Processed` lines for."
+            ),
+        ] = 1.0,
         # StreamRouter options
         setup_state: Annotated[
             bool,
@@ -413,6 +426,8 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
             description=description,
             logger=logger,
             log_level=log_level,
+            log_queue_size=log_queue_size,
+            log_sample_rate=log_sample_rate,
             specification_tags=specification_tags,
             schema_url=schema_url,
             setup_state=setup_state,
@@ -466,6 +481,7 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -493,6 +509,7 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
                 ack_policy=ack_policy,
                 no_ack=no_ack,
                 no_reply=no_reply,
+                log_sample_rate=log_sample_rate,
                 title=title,
                 description=description,
                 include_in_schema=include_in_schema,
@@ -22,11 +22,15 @@ class RabbitPrometheusMiddleware(
         app_name: str = EMPTY,
         metrics_prefix: str = "faststream",
         received_messages_size_buckets: Sequence[float] | None = None,
+        labels_cache_size: int = 4096,
     ) -> None:
+        settings_provider = RabbitMetricsSettingsProvider()
+
         super().__init__(
-            settings_provider_factory=lambda _: RabbitMetricsSettingsProvider(),
+            settings_provider_factory=lambda _: settings_provider,
             registry=registry,
             app_name=app_name,
             metrics_prefix=metrics_prefix,
             received_messages_size_buckets=received_messages_size_buckets,
+            labels_cache_size=labels_cache_size,
         )
@@ -1,4 +1,7 @@
+import asyncio
 from abc import abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     Optional,
@@ -10,19 +13,18 @@ import anyio
 from typing_extensions import Unpack, override
 
 from faststream._internal.endpoint.utils import ParserComposition
+from faststream._internal.logger import logger
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException, IncorrectState
+from faststream.exceptions import IncorrectState
+from faststream.message import gen_cor_id
 from faststream.rabbit.parser import AioPikaParser
 from faststream.rabbit.response import RabbitPublishCommand
 from faststream.rabbit.schemas import RABBIT_REPLY, RabbitExchange
 
 if TYPE_CHECKING:
-    from types import TracebackType
-
     import aiormq
     from aio_pika import IncomingMessage, RobustQueue
     from aio_pika.abc import AbstractIncomingMessage, TimeoutType
-    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.types import (
@@ -32,28 +34,36 @@ if TYPE_CHECKING:
     from faststream.rabbit.helpers import RabbitDeclarer
     from faststream.rabbit.types import AioPikaSendableMessage
 
-    from .options import MessageOptions
+    from .options import MessageOptions, PublishOptions
 
 
-class LockState(Protocol):
+class RPCState(Protocol):
     @property
-    def lock(self) -> "anyio.Lock": ...
+    def rpc(self) -> "_RPCConsumer": ...
+
+    def disconnect(self) -> None: ...
 
 
-class LockUnset:
+class RPCUnset:
     __slots__ = ()
 
     @property
-    def lock(self) -> "anyio.Lock":
+    def rpc(self) -> "_RPCConsumer":
         msg = "You should call `producer.connect()` method at first."
         raise IncorrectState(msg)
 
+    def disconnect(self) -> None:
+        pass
+
 
-class RealLock:
-    __slots__ = ("lock",)
+class RealRPC:
+    __slots__ = ("rpc",)
 
     def __init__(self) -> None:
-        self.lock = anyio.Lock()
+        self.rpc = _RPCConsumer()
+
+    def disconnect(self) -> None:
+        self.rpc.disconnect()
 
 
 class AioPikaFastProducer(ProducerProto[RabbitPublishCommand]):
@@ -70,10 +80,11 @@ class AioPikaFastProducer(ProducerProto[RabbitPublishCommand]):
     @abstractmethod
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage": ...
 
-    @override
-    async def publish_batch(self, cmd: "RabbitPublishCommand") -> None:
-        msg = "RabbitMQ doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+    @abstractmethod
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"]] | None: ...
 
 
 class FakeAioPikaFastProducer(AioPikaFastProducer):
@@ -97,6 +108,13 @@ class FakeAioPikaFastProducer(AioPikaFastProducer):
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage":
         raise NotImplementedError
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"]]:
+        raise NotImplementedError
+
 
 class AioPikaFastProducerImpl(AioPikaFastProducer):
     """A class for fast producing messages using aio-pika."""
@@ -113,7 +131,7 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
     ) -> None:
         self.declarer = declarer
 
-        self.__lock: LockState = LockUnset()
+        self.__rpc: RPCState = RPCUnset()
         self.serializer: SerializerProto | None = None
 
         default_parser = AioPikaParser()
@@ -121,15 +139,16 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         self._decoder = ParserComposition(decoder, default_parser.decode_message)
 
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
-        """Lock initialization.
+        """RPC consumer initialization.
 
         Should be called in async context due `anyio.Lock` object can't be created outside event loop.
         """
         self.serializer = serializer
-        self.__lock = RealLock()
+        self.__rpc = RealRPC()
 
     def disconnect(self) -> None:
-        self.__lock = LockUnset()
+        self.__rpc.disconnect()
+        self.__rpc = RPCUnset()
 
     @override
     async def publish(
@@ -147,12 +166,50 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
             **cmd.message_options,
         )
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"]]:
+        exchange_obj = await self.declarer.declare_exchange(
+            exchange=cmd.exchange,
+            declare=False,
+        )
+
+        messages = [
+            AioPikaParser.encode_message(
+                message=body,
+                reply_to=cmd.reply_to,
+                headers=cmd.headers,
+                correlation_id=cmd.correlation_id,
+                serializer=self.serializer,
+                **cmd.message_options,
+            )
+            for body in cmd.batch_bodies
+        ]
+
+        options: PublishOptions = {**cmd.publish_options, "timeout": cmd.timeout}
+
+        # all messages are sent at once and their confirmations are awaited together
+        return await asyncio.gather(
+            *(
+                exchange_obj.publish(
+                    message=message,
+                    routing_key=cmd.destination,
+                    **options,
+                )
+                for message in messages
+            )
+        )
+
     @override
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage":
-        async with _RPCCallback(
-            self.__lock.lock,
-            await self.declarer.declare_queue(RABBIT_REPLY),
-        ) as response_queue:
+        rpc = self.__rpc.rpc
+        await rpc.start(self.declarer)
+
+        correlation_id = cmd.correlation_id or gen_cor_id()
+
+        with rpc.wait_reply(correlation_id) as response:
             with anyio.fail_after(cmd.timeout):
                 await self._publish(
                     message=cmd.body,
@@ -160,11 +217,11 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
                     routing_key=cmd.destination,
                     reply_to=RABBIT_REPLY.name,
                     headers=cmd.headers,
-                    correlation_id=cmd.correlation_id,
+                    correlation_id=correlation_id,
                     **cmd.publish_options,
                     **cmd.message_options,
                 )
-                return await response_queue.receive()
+                return await response
 
     async def _publish(
         self,
@@ -195,38 +252,62 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         )
 
 
-class _RPCCallback:
-    """A class provides an RPC lock."""
+class _RPCConsumer:
+    """A long-living direct reply-to consumer shared by all RPC requests.
 
-    def __init__(self, lock: "anyio.Lock", callback_queue: "RobustQueue") -> None:
-        self.lock = lock
-        self.queue = callback_queue
+    Responses are routed to waiting requests by `correlation_id`.
+    """
 
-    async def __aenter__(self) -> "MemoryObjectReceiveStream[IncomingMessage]":
-        send_response_stream: MemoryObjectSendStream[AbstractIncomingMessage]
-        receive_response_stream: MemoryObjectReceiveStream[AbstractIncomingMessage]
+    def __init__(self) -> None:
+        self.lock = anyio.Lock()
+        self.queue: RobustQueue | None = None
+        self.responses: dict[str, asyncio.Future[IncomingMessage]] = {}
 
-        (
-            send_response_stream,
-            receive_response_stream,
-        ) = anyio.create_memory_object_stream(max_buffer_size=1)
-        await self.lock.acquire()
+    async def start(self, declarer: "RabbitDeclarer") -> None:
+        if self.queue is not None:
+            return
 
-        self.consumer_tag = await self.queue.consume(
-            callback=send_response_stream.send,
-            no_ack=True,
-        )
+        async with self.lock:
+            if self.queue is None:
+                queue = await declarer.declare_queue(RABBIT_REPLY)
+                await queue.consume(callback=self._on_response, no_ack=True)
+                self.queue = queue
 
-        return cast(
-            "MemoryObjectReceiveStream[IncomingMessage]",
-            receive_response_stream,
-        )
+    def disconnect(self) -> None:
+        for future in self.responses.values():
+            if not future.done():
+                future.cancel()
 
-    async def __aexit__(
+        self.responses.clear()
+        self.queue = None
+
+    @contextmanager
+    def wait_reply(
         self,
-        exc_type: type[BaseException] | None = None,
-        exc_val: BaseException | None = None,
-        exc_tb: Optional["TracebackType"] = None,
-    ) -> None:
-        self.lock.release()
-        await self.queue.cancel(self.consumer_tag)
+        correlation_id: str,
+    ) -> Iterator["asyncio.Future[IncomingMessage]"]:
+        if correlation_id in self.responses:
+            msg = f"RPC request with `correlation_id={correlation_id}` is already waiting for response."
+            raise IncorrectState(msg)
+
+        future = self.responses[correlation_id] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+        try:
+            yield future
+        finally:
+            self.responses.pop(correlation_id, None)
+
+    async def _on_response(self, message: "AbstractIncomingMessage") -> None:
+        correlation_id = message.correlation_id or ""
+
+        if (future := self.responses.get(correlation_id)) is None:
+            # a late response to a timed out request or a response with
+            # overridden `correlation_id`, it can't be matched safely
+            logger.debug(
+                f"Drop RPC response with unknown `correlation_id={correlation_id}`",
+            )
+
+        elif not future.done():
+            future.set_result(cast("IncomingMessage", message))
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Union
 from typing_extensions import Unpack, override
 
 from faststream.rabbit.schemas.exchange import RabbitExchange
-from faststream.response import PublishCommand, Response
+from faststream.response import BatchPublishCommand, PublishCommand, Response
 from faststream.response.publish_type import PublishType
 
 if TYPE_CHECKING:
@@ -56,11 +56,11 @@ class RabbitResponse(Response):
         )
 
 
-class RabbitPublishCommand(PublishCommand):
+class RabbitPublishCommand(BatchPublishCommand):
     def __init__(
         self,
         message: "AioPikaSendableMessage",
-        *,
+        *messages: "AioPikaSendableMessage",
         _publish_type: PublishType,
         routing_key: str = "",
         exchange: RabbitExchange | None = None,
@@ -75,7 +75,8 @@ class RabbitPublishCommand(PublishCommand):
         correlation_id = message_options.pop("correlation_id", None)
 
         super().__init__(
-            body=message,
+            message,
+            *messages,
             destination=routing_key,
             correlation_id=correlation_id,
             headers=headers,
@@ -96,13 +97,18 @@ class RabbitPublishCommand(PublishCommand):
     def from_cmd(
         cls,
         cmd: Union["PublishCommand", "RabbitPublishCommand"],
+        *,
+        batch: bool = False,
     ) -> "RabbitPublishCommand":
         if isinstance(cmd, RabbitPublishCommand):
             # NOTE: Should return a copy probably.
             return cmd
 
+        body, extra_bodies = cls._parse_bodies(cmd.body, batch=batch)
+
         return cls(
-            message=cmd.body,
+            body,
+            *extra_bodies,
             routing_key=cmd.destination,
             correlation_id=cmd.correlation_id,
             headers=cmd.headers,
@@ -26,6 +26,7 @@ def create_subscriber(
     channel: Optional["Channel"],
     # Subscriber args
     no_reply: bool,
+    log_sample_rate: float | None,
     ack_policy: "AckPolicy",
     no_ack: bool,
     # Broker args
@@ -39,6 +40,7 @@ def create_subscriber(
 
     subscriber_config = RabbitSubscriberConfig(
         no_reply=no_reply,
+        log_sample_rate=log_sample_rate,
         consume_args=consume_args,
         channel=channel,
         queue=queue,
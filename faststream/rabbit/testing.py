@@ -1,4 +1,4 @@
-from collections.abc import Generator, Iterator, Mapping
+from collections.abc import Generator, Iterator, Mapping, Sequence
 from contextlib import ExitStack, contextmanager
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
 from unittest import mock
@@ -13,6 +13,7 @@ from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.testing.broker import TestBroker, change_producer
+from faststream._internal.testing.routing import RoutingIndex, RoutingTable
 from faststream.exceptions import SubscriberNotFound
 from faststream.message import gen_cor_id
 from faststream.rabbit.broker.broker import RabbitBroker
@@ -28,6 +29,7 @@ if TYPE_CHECKING:
     from aio_pika.abc import DateType, HeadersType
     from fast_depends.library.serializer import SerializerProto
 
+    from faststream._internal.endpoint.subscriber import SubscriberUsecase
     from faststream.rabbit.publisher import RabbitPublisher
     from faststream.rabbit.response import RabbitPublishCommand
     from faststream.rabbit.subscriber import RabbitSubscriber
@@ -206,6 +208,8 @@ class FakeProducer(AioPikaFastProducer):
             default_parser.decode_message,
         )
 
+        self._routes = RoutingTable(broker, _build_routes)
+
     @override
     async def publish(
         self,
@@ -224,8 +228,7 @@ class FakeProducer(AioPikaFastProducer):
         )
 
         called = False
-        for handler in self.broker.subscribers:  # pragma: no branch
-            handler = cast("RabbitSubscriber", handler)
+        for handler in self._routes.index.match(incoming.routing_key):
             if _is_handler_matches(
                 handler,
                 incoming.routing_key,
@@ -238,6 +241,38 @@ class FakeProducer(AioPikaFastProducer):
         if not called:
             raise SubscriberNotFound
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> None:
+        """Publish messages to a RabbitMQ queue or exchange one by one."""
+        for body in cmd.batch_bodies:
+            incoming = build_message(
+                message=body,
+                exchange=cmd.exchange,
+                routing_key=cmd.destination,
+                correlation_id=cmd.correlation_id,
+                headers=cmd.headers,
+                reply_to=cmd.reply_to,
+                serializer=self.broker.config.fd_config._serializer,
+                **cmd.message_options,
+            )
+
+            called = False
+            for handler in self._routes.index.match(incoming.routing_key):
+                if _is_handler_matches(
+                    handler,
+                    incoming.routing_key,
+                    incoming.headers,
+                    cmd.exchange,
+                ):
+                    called = True
+                    await self._execute_handler(incoming, handler)
+
+            if not called:
+                raise SubscriberNotFound
+
     @override
     async def request(
         self,
@@ -253,8 +288,7 @@ class FakeProducer(AioPikaFastProducer):
             **cmd.message_options,
         )
 
-        for handler in self.broker.subscribers:  # pragma: no branch
-            handler = cast("RabbitSubscriber", handler)
+        for handler in self._routes.index.match(incoming.routing_key):
             if _is_handler_matches(
                 handler,
                 incoming.routing_key,
@@ -280,6 +314,24 @@ class FakeProducer(AioPikaFastProducer):
         )
 
 
+def _build_routes(
+    subscribers: Sequence["SubscriberUsecase[Any]"],
+) -> RoutingIndex["RabbitSubscriber"]:
+    index: RoutingIndex[RabbitSubscriber] = RoutingIndex(single="*", multi="#")
+
+    for handler in cast("Sequence[RabbitSubscriber]", subscribers):
+        if handler.exchange is None or handler.exchange.type == ExchangeType.DIRECT:
+            index.add(handler.routing(), handler)
+
+        elif handler.exchange.type == ExchangeType.TOPIC:
+            index.add_pattern(handler.routing(), handler)
+
+        else:
+            index.add_any(handler)
+
+    return index
+
+
 def _is_handler_matches(
     handler: "RabbitSubscriber",
     routing_key: str,
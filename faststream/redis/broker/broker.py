@@ -177,6 +177,19 @@ class RedisBroker(
             int,
             Doc("Service messages log level."),
         ] = logging.INFO,
+        log_queue_size: Annotated[
+            int | None,
+            Doc(
+                "Size of the queue to write service messages from a background thread. "
+                "Messages are written synchronously if not set.",
+            ),
+        ] = None,
+        log_sample_rate: Annotated[
+            float,
+            Doc(
+                "Share of consumed messages to write `Received` and `Processed` lines for."
+            ),
+        ] = 1.0,
         # FastDepends args
         apply_types: Annotated[
             bool,
@@ -246,6 +259,8 @@ class RedisBroker(
                 logger=make_redis_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    queue_size=log_queue_size,
+                    sample_rate=log_sample_rate,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
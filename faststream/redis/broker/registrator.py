@@ -73,6 +73,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -108,6 +109,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -143,6 +145,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -178,6 +181,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -213,6 +217,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -248,6 +253,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -283,6 +289,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -318,6 +325,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -353,6 +361,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -388,6 +397,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         message_format: type["MessageFormat"] | None = None,
         # AsyncAPI information
         title: str | None = None,
@@ -408,6 +418,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             decoder: Function to decode FastStream msg bytes body to python objects.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
+            log_sample_rate: Share of consumed messages to write `Received` and `Processed` lines for. Overrides the broker `log_sample_rate` option.
             message_format: Which format to use when parsing messages.
             max_workers: Number of workers to process messages concurrently.
             title: AsyncAPI subscriber object title.
@@ -425,6 +436,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             max_workers=max_workers or 1,
             no_ack=no_ack,
             no_reply=no_reply,
+            log_sample_rate=log_sample_rate,
             ack_policy=ack_policy,
             message_format=message_format,
             config=cast("RedisBrokerConfig", self.config),
@@ -23,6 +23,7 @@ class RedisBrokerConfig(BrokerConfig):
         await self.connection.connect()
 
     async def disconnect(self) -> None:
+        await self.producer.disconnect()
         await self.connection.disconnect()
 
 
@@ -1,10 +1,207 @@
-from typing import Any
+import asyncio
+import logging
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Optional
 
+import anyio
 from redis.asyncio.client import Redis
 from redis.asyncio.connection import ConnectionPool
 
 from faststream.__about__ import __version__
 from faststream.exceptions import IncorrectState
+from faststream.redis.message import PubSubMessage
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import PubSub
+
+    from faststream._internal.logger import LoggerState
+
+
+DEFAULT_QUEUE_SIZE = 10_000
+
+
+class _Listener:
+    """Subscriber messages queue of the shared Pub/Sub connection."""
+
+    __slots__ = ("dropped", "logger", "name", "overflowed", "queue")
+
+    def __init__(
+        self,
+        name: str,
+        queue: "asyncio.Queue[PubSubMessage | Exception]",
+        logger: Optional["LoggerState"],
+    ) -> None:
+        self.name = name
+        self.queue = queue
+        self.logger = logger
+        self.overflowed = False
+        self.dropped = 0
+
+    def put(self, msg: "PubSubMessage | Exception") -> None:
+        try:
+            self.queue.put_nowait(msg)
+
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+            # warn once per overflow to not flood logs by each dropped message
+            if not self.overflowed and self.logger is not None:
+                self.logger.log(
+                    f"`{self.name}` subscriber queue is full, "
+                    "new messages are dropped until it is processed.",
+                    log_level=logging.WARNING,
+                )
+            self.overflowed = True
+
+        else:
+            self.overflowed = False
+
+
+class PubSubMultiplexer:
+    """A single Pub/Sub connection shared by all broker channel subscribers.
+
+    Each subscriber gets its own bounded messages queue filled by the only
+    connection reading task. Reading never waits for subscribers, so messages
+    for a subscriber with a full queue are dropped (and logged) without
+    blocking others - the same at-most-once way Redis drops them for slow
+    Pub/Sub clients.
+    """
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        self._queue_size = queue_size
+
+        self._channels: dict[str, list[_Listener]] = {}
+        self._patterns: dict[str, list[_Listener]] = {}
+
+        self._lock = anyio.Lock()
+        self._subscription: PubSub | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def subscribe(
+        self,
+        client: "Redis[bytes]",
+        name: str,
+        *,
+        pattern: bool = False,
+        logger: Optional["LoggerState"] = None,
+        queue_size: int | None = None,
+    ) -> _Listener:
+        listener = _Listener(
+            name,
+            asyncio.Queue(maxsize=queue_size or self._queue_size),
+            logger,
+        )
+
+        async with self._lock:
+            if self._subscription is None:
+                self._subscription = client.pubsub()
+
+            routes = self._patterns if pattern else self._channels
+
+            if (listeners := routes.get(name)) is None:
+                if pattern:
+                    await self._subscription.psubscribe(name)
+                else:
+                    await self._subscription.subscribe(name)
+
+                listeners = routes[name] = []
+
+            listeners.append(listener)
+
+            if self._task is None:
+                self._task = asyncio.create_task(
+                    self._read_messages(self._subscription),
+                )
+
+        return listener
+
+    async def unsubscribe(
+        self,
+        name: str,
+        queue: "asyncio.Queue[PubSubMessage | Exception]",
+        *,
+        pattern: bool = False,
+    ) -> None:
+        async with self._lock:
+            routes = self._patterns if pattern else self._channels
+
+            listeners = routes.get(name, [])
+            for listener in listeners:
+                if listener.queue is queue:
+                    break
+            else:
+                return
+
+            listeners.remove(listener)
+
+            # drop not processed messages
+            while not queue.empty():
+                queue.get_nowait()
+
+            if listeners:
+                return
+
+            del routes[name]
+
+            if self._channels or self._patterns:
+                assert self._subscription
+                if pattern:
+                    await self._subscription.punsubscribe(name)
+                else:
+                    await self._subscription.unsubscribe(name)
+
+            else:
+                # nothing to listen, so release the connection
+                await self.close()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._subscription is not None:
+            with suppress(Exception):
+                await self._subscription.aclose()  # type: ignore[attr-defined]
+            self._subscription = None
+
+        self._channels.clear()
+        self._patterns.clear()
+
+    async def _read_messages(self, psub: "PubSub") -> None:
+        while True:  # pragma: no branch
+            try:
+                raw_msg = await psub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=None,
+                )
+
+            except Exception as e:
+                # pass the error to subscribers to log it,
+                # the connection resubscribes at the next read
+                for listeners in (*self._channels.values(), *self._patterns.values()):
+                    for listener in listeners:
+                        listener.put(e)
+
+                await anyio.sleep(1)
+                continue
+
+            if not raw_msg:
+                continue
+
+            if (pattern := raw_msg["pattern"]) is not None:
+                listeners = self._patterns.get(pattern.decode(), [])
+            else:
+                listeners = self._channels.get(raw_msg["channel"].decode(), [])
+
+            for listener in listeners:
+                listener.put(
+                    PubSubMessage(
+                        type=raw_msg["type"],
+                        data=raw_msg["data"],
+                        channel=raw_msg["channel"].decode(),
+                        pattern=pattern,
+                    ),
+                )
 
 
 class ConnectionState:
@@ -14,6 +211,8 @@ class ConnectionState:
         self._connected = False
         self._client: Redis[bytes] | None = None
 
+        self.pubsub = PubSubMultiplexer()
+
     @property
     def client(self) -> "Redis[bytes]":
         if not self._client:
@@ -39,6 +238,8 @@ class ConnectionState:
         return client
 
     async def disconnect(self) -> None:
+        await self.pubsub.close()
+
         if self._client:
             await self._client.aclose()  # type: ignore[attr-defined]
 
@@ -153,6 +153,19 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
             int,
             Doc("Service messages log level."),
         ] = logging.INFO,
+        log_queue_size: Annotated[
+            int | None,
+            Doc(
+                "Size of the queue to write service messages from a background thread. "
+                "Messages are written synchronously if not set.",
+            ),
+        ] = None,
+        log_sample_rate: Annotated[
+            float,
+            Doc(
+                "Share of consumed messages to write `Received` and `Processed` lines for."
+            ),
+        ] = 1.0,
         # StreamRouter options
         setup_state: Annotated[
             bool,
@@ -412,6 +425,8 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
             # logger options
             logger=logger,
             log_level=log_level,
+            log_queue_size=log_queue_size,
+            log_sample_rate=log_sample_rate,
             # AsyncAPI options
             security=security,
             protocol=protocol,
@@ -467,6 +482,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -509,6 +525,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -551,6 +568,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -593,6 +611,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -635,6 +654,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -677,6 +697,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -719,6 +740,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -761,6 +783,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -803,6 +826,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         ] = EMPTY,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
+        log_sample_rate: float | None = None,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -831,6 +855,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
                 ack_policy=ack_policy,
                 no_ack=no_ack,
                 no_reply=no_reply,
+                log_sample_rate=log_sample_rate,
                 title=title,
                 description=description,
                 include_in_schema=include_in_schema,
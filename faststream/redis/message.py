@@ -41,7 +41,7 @@ class UnifyRedisDict(TypedDict):
 
 
 class RedisMessage(BrokerStreamMessage[UnifyRedisDict]):
-    pass
+    __slots__ = ()
 
 
 class PubSubMessage(TypedDict):
@@ -54,7 +54,7 @@ class PubSubMessage(TypedDict):
 
 
 class RedisChannelMessage(BrokerStreamMessage[PubSubMessage]):
-    pass
+    __slots__ = ()
 
 
 class _ListMessage(TypedDict):
@@ -80,10 +80,14 @@ class BatchListMessage(_ListMessage):
 class RedisListMessage(BrokerStreamMessage[DefaultListMessage]):
     """StreamMessage for single List message."""
 
+    __slots__ = ()
+
 
 class RedisBatchListMessage(BrokerStreamMessage[BatchListMessage]):
     """StreamMessage for single List message."""
 
+    __slots__ = ("decoded_body",)
+
     decoded_body: list["DecodedMessage"]
 
 
@@ -110,6 +114,8 @@ _StreamMsgType = TypeVar("_StreamMsgType", bound=_StreamMessage)
 
 
 class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
+    __slots__ = ()
+
     @override
     async def ack(
         self,
@@ -146,8 +152,10 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
 
 
 class RedisStreamMessage(_RedisStreamMessageMixin[DefaultStreamMessage]):
-    pass
+    __slots__ = ()
 
 
 class RedisBatchStreamMessage(_RedisStreamMessageMixin[BatchStreamMessage]):
+    __slots__ = ("decoded_body",)
+
     decoded_body: list["DecodedMessage"]
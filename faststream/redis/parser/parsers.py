@@ -1,11 +1,11 @@
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional, Protocol
 
 from faststream._internal._compat import dump_json, json_loads
 from faststream._internal.basic_types import DecodedMessage
 from faststream._internal.constants import EMPTY, ContentTypes
-from faststream.message import decode_message, gen_cor_id
+from faststream.message import decode_message, gen_cor_id, loads_json_batch
 from faststream.redis.message import (
     RedisBatchListMessage,
     RedisBatchStreamMessage,
@@ -102,24 +102,7 @@ class RedisBatchListParser(SimpleParser):
         self,
         message: Mapping[str, Any],
     ) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
-        body: list[Any] = []
-        batch_headers: list[dict[str, Any]] = []
-
-        for x in message["data"]:
-            msg_data, msg_headers = _decode_batch_body_item(x, self.config.message_format)
-            body.append(msg_data)
-            batch_headers.append(msg_headers)
-
-        first_msg_headers = next(iter(batch_headers), {})
-
-        return (
-            dump_json(body),
-            {
-                **first_msg_headers,
-                "content-type": ContentTypes.JSON.value,
-            },
-            batch_headers,
-        )
+        return _parse_batch_data(message["data"], self.config.message_format)
 
 
 class RedisStreamParser(SimpleParser):
@@ -143,35 +126,42 @@ class RedisBatchStreamParser(SimpleParser):
         self,
         message: Mapping[str, Any],
     ) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
-        body: list[Any] = []
-        batch_headers: list[dict[str, Any]] = []
+        return _parse_batch_data(
+            (x.get(bDATA_KEY, x) for x in message["data"]),
+            self.config.message_format,
+        )
 
-        for x in message["data"]:
-            msg_data, msg_headers = _decode_batch_body_item(
-                x.get(bDATA_KEY, x),
-                self.config.message_format,
-            )
 
-            body.append(msg_data)
-            batch_headers.append(msg_headers)
+def _parse_batch_data(
+    items: Iterable[bytes],
+    message_format: type["MessageFormat"],
+) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
+    bodies: list[bytes] = []
+    batch_headers: list[dict[str, Any]] = []
 
-        first_msg_headers = next(iter(batch_headers), {})
+    for x in items:
+        msg_body, msg_headers = message_format.parse(x)
+        bodies.append(msg_body)
+        batch_headers.append(msg_headers)
 
-        return (
-            dump_json(body),
-            {
-                **first_msg_headers,
-                "content-type": ContentTypes.JSON.value,
-            },
-            batch_headers,
-        )
+    # parse all JSON bodies by a single call, decode one by one otherwise
+    if (body := loads_json_batch(bodies)) is None:
+        body = [_decode_batch_body_item(b) for b in bodies]
+
+    first_msg_headers = next(iter(batch_headers), {})
+
+    return (
+        dump_json(body),
+        {
+            **first_msg_headers,
+            "content-type": ContentTypes.JSON.value,
+        },
+        batch_headers,
+    )
 
 
-def _decode_batch_body_item(
-    msg_content: bytes, message_format: type["MessageFormat"]
-) -> tuple[Any, dict[str, Any]]:
-    msg_body, headers = message_format.parse(msg_content)
+def _decode_batch_body_item(msg_body: bytes) -> Any:
     try:
-        return json_loads(msg_body), headers
+        return json_loads(msg_body)
     except Exception:
-        return msg_body, headers
+        return msg_body
@@ -20,6 +20,7 @@ class RedisPrometheusMiddleware(
         app_name: str = EMPTY,
         metrics_prefix: str = "faststream",
         received_messages_size_buckets: Sequence[float] | None = None,
+        labels_cache_size: int = 4096,
     ) -> None:
         super().__init__(
             settings_provider_factory=settings_provider_factory,
@@ -27,4 +28,5 @@ class RedisPrometheusMiddleware(
             app_name=app_name,
             metrics_prefix=metrics_prefix,
             received_messages_size_buckets=received_messages_size_buckets,
+            labels_cache_size=labels_cache_size,
         )
@@ -46,12 +46,16 @@ class BatchRedisMetricsSettingsProvider(BaseRedisMetricsSettingsProvider):
         }
 
 
+_PROVIDER = RedisMetricsSettingsProvider()
+_BATCH_PROVIDER = BatchRedisMetricsSettingsProvider()
+
+
 def settings_provider_factory(
     msg: dict[str, Any] | None,
 ) -> RedisMetricsSettingsProvider | BatchRedisMetricsSettingsProvider:
     if msg is not None and msg.get("type", "").startswith("b"):
-        return BatchRedisMetricsSettingsProvider()
-    return RedisMetricsSettingsProvider()
+        return _BATCH_PROVIDER
+    return _PROVIDER
 
 
 def _get_destination(kwargs: dict[str, Any]) -> str:
@@ -1,4 +1,6 @@
-from contextlib import suppress
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 import anyio
@@ -13,6 +15,7 @@ from faststream.redis.response import DestinationType, RedisPublishCommand
 
 if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
+    from redis.asyncio.client import PubSub, Redis
 
     from faststream._internal.types import CustomCallable
     from faststream.redis.configs import ConnectionState
@@ -46,6 +49,8 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
         )
         self.serializer = serializer
 
+        self._inbox = _RPCInbox()
+
     @override
     async def publish(self, cmd: "RedisPublishCommand") -> int | bytes:
         msg = cmd.message_format.encode(
@@ -60,13 +65,9 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
 
     @override
     async def request(self, cmd: "RedisPublishCommand") -> "Any":
-        nuid = NUID()
-        reply_to = str(nuid.next(), "utf-8")
-        psub = self._connection.client.pubsub()
-
-        try:
-            await psub.subscribe(reply_to)
+        await self._inbox.start(self._connection.client)
 
+        with self._inbox.wait_reply() as (reply_to, response):
             msg = cmd.message_format.encode(
                 message=cmd.body,
                 reply_to=reply_to,
@@ -75,30 +76,9 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
                 serializer=self.serializer,
             )
 
-            await self.__publish(msg, cmd)
-
-            with anyio.fail_after(cmd.timeout) as scope:
-                # skip subscribe message
-                await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=cmd.timeout or 0.0,
-                )
-
-                # get real response
-                response_msg = await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=cmd.timeout or 0.0,
-                )
-
-            if scope.cancel_called:
-                raise TimeoutError
-
-            return response_msg
-
-        finally:
-            with suppress(Exception):
-                await psub.unsubscribe()
-                await psub.aclose()  # type: ignore[attr-defined]
+            with anyio.fail_after(cmd.timeout):
+                await self.__publish(msg, cmd)
+                return await response
 
     @override
     async def publish_batch(self, cmd: "RedisPublishCommand") -> int:
@@ -144,3 +124,92 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
 
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
         self.serializer = serializer
+
+    async def disconnect(self) -> None:
+        await self._inbox.stop()
+
+
+class _RPCInbox:
+    """A shared reply channels subscription for all RPC requests.
+
+    Each request gets an unique `<prefix>.<token>` reply channel,
+    the only pattern subscription routes responses by this channel.
+    """
+
+    def __init__(self) -> None:
+        self.prefix = f"faststream.inbox.{NUID().next().decode()}"
+        self.responses: dict[str, asyncio.Future[Any]] = {}
+
+        self._nuid = NUID()
+        self._lock = anyio.Lock()
+        self._subscription: PubSub | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self, client: "Redis[bytes]") -> None:
+        if self._task is not None:
+            return
+
+        async with self._lock:
+            if self._task is None:
+                psub = client.pubsub()
+                await psub.psubscribe(f"{self.prefix}.*")
+                self._subscription = psub
+                self._task = asyncio.create_task(self._read_responses(psub))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._subscription is not None:
+            with suppress(Exception):
+                await self._subscription.punsubscribe()
+                await self._subscription.aclose()  # type: ignore[attr-defined]
+            self._subscription = None
+
+        for future in self.responses.values():
+            if not future.done():
+                future.cancel()
+
+        self.responses.clear()
+
+    @contextmanager
+    def wait_reply(self) -> Iterator[tuple[str, "asyncio.Future[Any]"]]:
+        reply_to = f"{self.prefix}.{self._nuid.next().decode()}"
+
+        future = self.responses[reply_to] = asyncio.get_running_loop().create_future()
+
+        try:
+            yield reply_to, future
+        finally:
+            self.responses.pop(reply_to, None)
+
+    async def _read_responses(self, psub: "PubSub") -> None:
+        while True:  # pragma: no branch
+            try:
+                msg = await psub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=None,
+                )
+
+            except Exception as e:
+                # subscription is broken, it will be recreated by the next request
+                with suppress(Exception):
+                    await psub.aclose()  # type: ignore[attr-defined]
+
+                self._task = self._subscription = None
+                for future in self.responses.values():
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            if msg is None:
+                continue
+
+            channel = msg["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+
+            response = self.responses.get(channel)
+            if response is not None and not response.done():
+                response.set_result(msg)
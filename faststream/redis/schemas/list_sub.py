@@ -5,7 +5,11 @@ from faststream._internal.proto import NameRequired
 
 
 class ListSub(NameRequired):
-    """A class to represent a Redis List subscriber."""
+    """A class to represent a Redis List subscriber.
+
+    Subscriber blocks up to `polling_interval` seconds waiting for the first list element,
+    and then pops up to `max_records` elements at once (`10` for batch subscriber and `1` otherwise).
+    """
 
     __slots__ = (
         "batch",
@@ -18,13 +22,13 @@ class ListSub(NameRequired):
         self,
         list_name: str,
         batch: bool = False,
-        max_records: int = 10,
+        max_records: int | None = None,
         polling_interval: float = 0.1,
     ) -> None:
         super().__init__(list_name)
 
         self.batch = batch
-        self.max_records = max_records
+        self.max_records = max_records or (10 if batch else 1)
         self.polling_interval = polling_interval
 
     @cached_property
@@ -1,3 +1,4 @@
+import warnings
 from copy import deepcopy
 
 from faststream._internal.proto import NameRequired
@@ -8,6 +9,7 @@ class PubSub(NameRequired):
     """A class to represent a Redis PubSub channel."""
 
     __slots__ = (
+        "buffer_size",
         "name",
         "path_regex",
         "pattern",
@@ -18,8 +20,17 @@ class PubSub(NameRequired):
         self,
         channel: str,
         pattern: bool = False,
-        polling_interval: float = 1.0,
+        polling_interval: float | None = None,
+        buffer_size: int | None = None,
     ) -> None:
+        if polling_interval is not None:
+            warnings.warn(
+                "`polling_interval` option has no effect, channel messages are pushed "
+                "by the broker shared Pub/Sub connection. Scheduled to remove in 0.7.0",
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+
         reg, path = compile_path(
             channel,
             replace_symbol="*",
@@ -33,7 +44,9 @@ class PubSub(NameRequired):
 
         self.path_regex = reg
         self.pattern = channel if pattern else None
-        self.polling_interval = polling_interval
+        self.polling_interval = polling_interval or 1.0
+        # not processed messages limit, the broker default is used if not set
+        self.buffer_size = buffer_size
 
     def add_prefix(self, prefix: str) -> "PubSub":
         new_ch = deepcopy(self)
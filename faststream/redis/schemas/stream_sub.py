@@ -10,13 +10,17 @@ class StreamSub(NameRequired):
 
     __slots__ = (
         "batch",
+        "batch_latency_ms",
         "consumer",
         "group",
         "last_id",
+        "max_deliveries",
         "max_records",
         "maxlen",
+        "min_idle_time",
         "name",
         "no_ack",
+        "pipeline",
         "polling_interval",
     )
 
@@ -31,11 +35,40 @@ class StreamSub(NameRequired):
         last_id: str | None = None,
         maxlen: int | None = None,
         max_records: int | None = None,
+        pipeline: bool = False,
+        min_idle_time: int | None = None,
+        max_deliveries: int | None = None,
+        batch_latency_ms: int | None = None,
     ) -> None:
         if (group and not consumer) or (not group and consumer):
             msg = "You should specify `group` and `consumer` both"
             raise SetupError(msg)
 
+        if min_idle_time and not group:
+            msg = "`min_idle_time` can be used with consumer `group` only"
+            raise SetupError(msg)
+
+        if max_deliveries and not min_idle_time:
+            msg = "`max_deliveries` requires `min_idle_time` to be set"
+            raise SetupError(msg)
+
+        if pipeline and batch:
+            msg = "You can't use `pipeline` and `batch` options simultaneously"
+            raise SetupError(msg)
+
+        if batch_latency_ms is not None:
+            if not batch:
+                msg = "`batch_latency_ms` can be used with `batch=True` only"
+                raise SetupError(msg)
+
+            if not max_records:
+                msg = "`batch_latency_ms` requires `max_records` to limit the batch size"
+                raise SetupError(msg)
+
+            if batch_latency_ms <= 0:
+                msg = "`batch_latency_ms` should be a positive number"
+                raise SetupError(msg)
+
         if group and consumer:
             if last_id != ">":
                 if polling_interval:
@@ -72,6 +105,10 @@ class StreamSub(NameRequired):
         self.last_id = last_id
         self.maxlen = maxlen
         self.max_records = max_records
+        self.pipeline = pipeline
+        self.min_idle_time = min_idle_time
+        self.max_deliveries = max_deliveries
+        self.batch_latency_ms = batch_latency_ms
 
     def add_prefix(self, prefix: str) -> "StreamSub":
         new_stream = deepcopy(self)
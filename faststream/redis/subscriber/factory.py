@@ -25,6 +25,7 @@ from .usecases import (
     LogicSubscriber,
     StreamBatchSubscriber,
     StreamConcurrentSubscriber,
+    StreamPipelineSubscriber,
     StreamSubscriber,
 )
 
@@ -44,6 +45,7 @@ def create_subscriber(
     no_ack: bool,
     config: "RedisBrokerConfig",
     no_reply: bool = False,
+    log_sample_rate: float | None = None,
     message_format: type["MessageFormat"] | None,
     # AsyncAPI args
     title_: str | None = None,
@@ -66,6 +68,7 @@ def create_subscriber(
         list_sub=ListSub.validate(list),
         stream_sub=StreamSub.validate(stream),
         no_reply=no_reply,
+        log_sample_rate=log_sample_rate,
         _outer_config=config,
         _ack_policy=ack_policy,
         _message_format=message_format,
@@ -112,6 +115,14 @@ def create_subscriber(
             # TODO: raise warning if max_workers in `_validate_input_for_misconfigure`
             return StreamBatchSubscriber(subscriber_config, specification, calls)
 
+        if subscriber_config.stream_sub.pipeline:
+            return StreamPipelineSubscriber(
+                subscriber_config,
+                specification,
+                calls,
+                max_workers=max_workers,
+            )
+
         if max_workers > 1:
             return StreamConcurrentSubscriber(
                 subscriber_config,
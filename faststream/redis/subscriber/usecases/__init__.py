@@ -8,6 +8,7 @@ from .list_subscriber import (
 from .stream_subscriber import (
     StreamBatchSubscriber,
     StreamConcurrentSubscriber,
+    StreamPipelineSubscriber,
     StreamSubscriber,
 )
 
@@ -20,5 +21,6 @@ __all__ = (
     "LogicSubscriber",
     "StreamBatchSubscriber",
     "StreamConcurrentSubscriber",
+    "StreamPipelineSubscriber",
     "StreamSubscriber",
 )
@@ -2,9 +2,6 @@ from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any, Optional, TypeAlias
 
 import anyio
-from redis.asyncio.client import (
-    PubSub as RPubSub,
-)
 from typing_extensions import override
 
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin
@@ -20,11 +17,16 @@ from faststream.redis.parser import (
 from .basic import LogicSubscriber
 
 if TYPE_CHECKING:
+    import asyncio
+
+    from anyio import Event
+
     from faststream._internal.endpoint.subscriber import SubscriberSpecification
     from faststream._internal.endpoint.subscriber.call_item import (
         CallsCollection,
     )
     from faststream.message import StreamMessage as BrokerStreamMessage
+    from faststream.redis.configs.state import _Listener
     from faststream.redis.schemas import PubSub
     from faststream.redis.subscriber.config import RedisSubscriberConfig
 
@@ -47,7 +49,16 @@ class ChannelSubscriber(LogicSubscriber):
         super().__init__(config, specification, calls)
 
         self._channel = config.channel_sub
-        self.subscription: RPubSub | None = None
+        self.subscription: asyncio.Queue[PubSubMessage | Exception] | None = None
+        self._listener: _Listener | None = None
+        self._dropped_count = 0
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of messages dropped because the subscriber buffer was full."""
+        if self._listener is None:
+            return self._dropped_count
+        return self._dropped_count + self._listener.dropped
 
     @property
     def channel(self) -> "PubSub":
@@ -64,26 +75,43 @@ class ChannelSubscriber(LogicSubscriber):
 
     @override
     async def start(self) -> None:
-        if self.subscription:
+        if self.subscription is not None:
             return
 
-        self.subscription = psub = self._client.pubsub()
+        channel = self.channel
+        self._listener = await self._outer_config.connection.pubsub.subscribe(
+            self._client,
+            channel.name,
+            pattern=bool(channel.pattern),
+            logger=self._outer_config.logger,
+            queue_size=channel.buffer_size,
+        )
+        self.subscription = queue = self._listener.queue
 
-        if self.channel.pattern:
-            await psub.psubscribe(self.channel.name)
-        else:
-            await psub.subscribe(self.channel.name)
+        await super().start(queue)
 
-        await super().start(psub)
+    @override
+    async def _consume(self, *args: Any, start_signal: "Event") -> None:
+        # channel is already subscribed, so do not wait for the first message
+        start_signal.set()
+        await super()._consume(*args, start_signal=start_signal)
 
     async def stop(self) -> None:
         await super().stop()
 
         if self.subscription is not None:
-            await self.subscription.unsubscribe()
-            await self.subscription.aclose()  # type: ignore[attr-defined]
+            channel = self.channel
+            await self._outer_config.connection.pubsub.unsubscribe(
+                channel.name,
+                self.subscription,
+                pattern=bool(channel.pattern),
+            )
             self.subscription = None
 
+        if self._listener is not None:
+            self._dropped_count += self._listener.dropped
+            self._listener = None
+
     @override
     async def get_one(
         self,
@@ -95,13 +123,10 @@ class ChannelSubscriber(LogicSubscriber):
             "You can't use `get_one` method if subscriber has registered handlers."
         )
 
-        sleep_interval = timeout / 10
-
         raw_message: PubSubMessage | None = None
 
         with anyio.move_on_after(timeout):
-            while (raw_message := await self._get_message(self.subscription)) is None:  # noqa: ASYNC110
-                await anyio.sleep(sleep_interval)
+            raw_message = await self._get_message(self.subscription)
 
         context = self._outer_config.fd_config.context
 
@@ -122,23 +147,11 @@ class ChannelSubscriber(LogicSubscriber):
             "You can't use iterator if subscriber has registered handlers."
         )
 
-        timeout = 5
-        sleep_interval = timeout / 10
-
-        raw_message: PubSubMessage | None = None
-
         while True:
-            with anyio.move_on_after(timeout):
-                while (  # noqa: ASYNC110
-                    raw_message := await self._get_message(self.subscription)
-                ) is None:
-                    await anyio.sleep(sleep_interval)
+            raw_message = await self._get_message(self.subscription)
 
             context = self._outer_config.fd_config.context
 
-            if raw_message is None:
-                continue
-
             msg: RedisChannelMessage = await process_msg(  # type: ignore[assignment]
                 msg=raw_message,
                 middlewares=(
@@ -149,25 +162,19 @@ class ChannelSubscriber(LogicSubscriber):
             )
             yield msg
 
-    async def _get_message(self, psub: RPubSub) -> PubSubMessage | None:
-        raw_msg = await psub.get_message(
-            ignore_subscribe_messages=True,
-            timeout=self.channel.polling_interval,
-        )
+    async def _get_message(
+        self,
+        queue: "asyncio.Queue[PubSubMessage | Exception]",
+    ) -> PubSubMessage:
+        msg = await queue.get()
 
-        if raw_msg:
-            return PubSubMessage(
-                type=raw_msg["type"],
-                data=raw_msg["data"],
-                channel=raw_msg["channel"].decode(),
-                pattern=raw_msg["pattern"],
-            )
+        if isinstance(msg, Exception):
+            raise msg
 
-        return None
+        return msg
 
-    async def _get_msgs(self, psub: RPubSub) -> None:
-        if msg := await self._get_message(psub):
-            await self.consume_one(msg)
+    async def _get_msgs(self, queue: "asyncio.Queue[PubSubMessage | Exception]") -> None:
+        await self.consume_one(await self._get_message(queue))
 
 
 class ChannelConcurrentSubscriber(
@@ -76,6 +76,34 @@ class _ListHandlerMixin(LogicSubscriber):
 
         await super().start(self._client)
 
+    async def _pop(
+        self,
+        client: "Redis[bytes]",
+        name: str,
+        *,
+        count: int,
+        timeout: float,
+    ) -> list[bytes]:
+        """Wait for the first list element and pop up to `count` elements."""
+        # zero timeout blocks BLPOP forever
+        timeout = max(timeout, 0.01)
+
+        if count == 1:
+            raw_msg = await client.blpop([name], timeout=timeout)
+            return [raw_msg[1]] if raw_msg else []
+
+        # LPOP is processed by Redis right after BLPOP returns,
+        # so the rest elements are taken in the same round trip
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.blpop([name], timeout=timeout)
+            pipe.lpop(name, count - 1)
+            first, rest = await pipe.execute()
+
+        if not first:
+            return []
+
+        return [first[1], *(rest or ())]
+
     @override
     async def get_one(
         self,
@@ -86,22 +114,21 @@ class _ListHandlerMixin(LogicSubscriber):
             "You can't use `get_one` method if subscriber has registered handlers."
         )
 
-        sleep_interval = timeout / 10
-        raw_message = None
+        name = self.list_sub.name
 
-        with anyio.move_on_after(timeout):
-            while (  # noqa: ASYNC110
-                raw_message := await self._client.lpop(name=self.list_sub.name)
-            ) is None:
-                await anyio.sleep(sleep_interval)
+        raw_messages: list[bytes] = []
+        # BLPOP returns by the server timeout, so the client deadline is only
+        # a guard against a hung connection and must not cancel a popped element
+        with anyio.move_on_after(timeout + 1):
+            raw_messages = await self._pop(self._client, name, count=1, timeout=timeout)
 
-        if not raw_message:
+        if not raw_messages:
             return None
 
         redis_incoming_msg = DefaultListMessage(
             type="list",
-            data=raw_message,
-            channel=self.list_sub.name,
+            data=raw_messages[0],
+            channel=name,
         )
 
         context = self._outer_config.fd_config.context
@@ -122,24 +149,23 @@ class _ListHandlerMixin(LogicSubscriber):
             "You can't use iterator if subscriber has registered handlers."
         )
 
+        name = self.list_sub.name
         timeout = 5
-        sleep_interval = timeout / 10
-        raw_message = None
 
         while True:
-            with anyio.move_on_after(timeout):
-                while (  # noqa: ASYNC110
-                    raw_message := await self._client.lpop(name=self.list_sub.name)
-                ) is None:
-                    await anyio.sleep(sleep_interval)
+            raw_messages: list[bytes] = []
+            with anyio.move_on_after(timeout + 1):
+                raw_messages = await self._pop(
+                    self._client, name, count=1, timeout=timeout
+                )
 
-            if not raw_message:
+            if not raw_messages:
                 continue
 
             redis_incoming_msg = DefaultListMessage(
                 type="list",
-                data=raw_message,
-                channel=self.list_sub.name,
+                data=raw_messages[0],
+                channel=name,
             )
 
             context = self._outer_config.fd_config.context
@@ -169,18 +195,18 @@ class ListSubscriber(_ListHandlerMixin):
         super().__init__(config, specification, calls)
 
     async def _get_msgs(self, client: "Redis[bytes]") -> None:
-        raw_msg = await client.blpop(
-            self.list_sub.name,
-            timeout=self.list_sub.polling_interval,
-        )
-
-        if raw_msg:
-            _, msg_data = raw_msg
-
+        list_sub = self.list_sub
+
+        for msg_data in await self._pop(
+            client,
+            list_sub.name,
+            count=list_sub.max_records,
+            timeout=list_sub.polling_interval,
+        ):
             msg = DefaultListMessage(
                 type="list",
                 data=msg_data,
-                channel=self.list_sub.name,
+                channel=list_sub.name,
             )
 
             await self.consume_one(msg)
@@ -199,23 +225,22 @@ class ListBatchSubscriber(_ListHandlerMixin):
         super().__init__(config, specification, calls)
 
     async def _get_msgs(self, client: "Redis[bytes]") -> None:
-        raw_msgs = await client.lpop(
-            name=self.list_sub.name,
-            count=self.list_sub.max_records,
-        )
-
-        if raw_msgs:
+        list_sub = self.list_sub
+
+        if raw_msgs := await self._pop(
+            client,
+            list_sub.name,
+            count=list_sub.max_records,
+            timeout=list_sub.polling_interval,
+        ):
             msg = BatchListMessage(
                 type="blist",
-                channel=self.list_sub.name,
+                channel=list_sub.name,
                 data=raw_msgs,
             )
 
             await self.consume_one(msg)
 
-        else:
-            await anyio.sleep(self.list_sub.polling_interval)
-
 
 class ListConcurrentSubscriber(
     ConcurrentMixin["BrokerStreamMessage[Any]"],
@@ -1,10 +1,15 @@
+import asyncio
+import logging
 import math
-from collections.abc import AsyncIterator, Awaitable, Callable
+from abc import abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING, Any, Optional, TypeAlias
 
+import anyio
 from redis.exceptions import ResponseError
 from typing_extensions import override
 
+from faststream._internal.endpoint.subscriber.batching import AdaptiveBatchSize
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin
 from faststream._internal.endpoint.utils import process_msg
 from faststream.redis.message import (
@@ -21,6 +26,7 @@ from .basic import LogicSubscriber
 
 if TYPE_CHECKING:
     from anyio import Event
+    from redis.asyncio.client import Redis
 
     from faststream._internal.endpoint.subscriber import SubscriberSpecification
     from faststream._internal.endpoint.subscriber.call_item import (
@@ -33,9 +39,24 @@ if TYPE_CHECKING:
 
 TopicName: TypeAlias = bytes
 Offset: TypeAlias = bytes
+ReadResult: TypeAlias = tuple[
+    tuple[
+        TopicName,
+        tuple[
+            tuple[
+                Offset,
+                dict[bytes, bytes],
+            ],
+            ...,
+        ],
+    ],
+    ...,
+]
 
 
 class _StreamHandlerMixin(LogicSubscriber):
+    adaptive_batch_size: AdaptiveBatchSize | None = None
+
     def __init__(
         self,
         config: "RedisSubscriberConfig",
@@ -48,6 +69,9 @@ class _StreamHandlerMixin(LogicSubscriber):
         self._stream_sub = config.stream_sub
         self.last_id = config.stream_sub.last_id
 
+        self.claimed_count = 0
+        self.dead_lettered_count = 0
+
     @property
     def stream_sub(self) -> "StreamSub":
         return self._stream_sub.add_prefix(self._outer_config.prefix)
@@ -61,6 +85,11 @@ class _StreamHandlerMixin(LogicSubscriber):
             channel=self.stream_sub.name,
         )
 
+    def _read_count(self) -> int | None:
+        if self.adaptive_batch_size is not None:
+            return self.adaptive_batch_size.size
+        return self._stream_sub.max_records
+
     @override
     async def _consume(self, *args: Any, start_signal: "Event") -> None:
         if await self._client.ping():
@@ -134,7 +163,7 @@ class _StreamHandlerMixin(LogicSubscriber):
                     groupname=stream.group,
                     consumername=stream.consumer,
                     streams={stream.name: stream.last_id},
-                    count=stream.max_records,
+                    count=self._read_count(),
                     block=stream.polling_interval,
                     noack=stream.no_ack,
                 )
@@ -161,11 +190,94 @@ class _StreamHandlerMixin(LogicSubscriber):
                 return client.xread(
                     {stream.name: last_id},
                     block=stream.polling_interval,
-                    count=stream.max_records,
+                    count=self._read_count(),
                 )
 
         await super().start(read)
 
+        if self.calls and stream.group and stream.min_idle_time:
+            self.add_task(self._reclaim())
+
+    async def _reclaim(self) -> None:
+        """Claim entries idle in the consumer group PEL longer than `min_idle_time`."""
+        stream = self.stream_sub
+        assert stream.group
+        assert stream.consumer
+        assert stream.min_idle_time
+
+        start_id: bytes | str = "0-0"
+
+        while self.running:
+            try:
+                if stream.max_deliveries:
+                    await self._drop_undeliverable()
+
+                start_id, msgs, *_ = await self._client.xautoclaim(
+                    name=stream.name,
+                    groupname=stream.group,
+                    consumername=stream.consumer,
+                    min_idle_time=stream.min_idle_time,
+                    start_id=start_id,
+                    count=stream.max_records,
+                )
+
+            except Exception as e:
+                self._log(
+                    log_level=logging.ERROR,
+                    message="Pending messages claim error",
+                    extra=self.get_log_context(None),
+                    exc_info=e,
+                )
+                start_id = "0-0"
+
+            else:
+                # entries deleted from the stream are returned without data
+                if msgs := [m for m in msgs if m[1] is not None]:
+                    self.claimed_count += len(msgs)
+                    await self._consume_entries(stream.name, msgs)
+
+            if start_id in {"0-0", b"0-0"}:
+                await anyio.sleep(stream.min_idle_time / 1000)
+
+    async def _drop_undeliverable(self) -> None:
+        stream = self.stream_sub
+        assert stream.group
+        assert stream.max_deliveries
+
+        pending = await self._client.xpending_range(
+            name=stream.name,
+            groupname=stream.group,
+            min="-",
+            max="+",
+            count=stream.max_records or 100,
+            idle=stream.min_idle_time,
+        )
+
+        if ids := [
+            p["message_id"]
+            for p in pending
+            if p["times_delivered"] >= stream.max_deliveries
+        ]:
+            await self._client.xack(stream.name, stream.group, *ids)
+            self.dead_lettered_count += len(ids)
+
+            self._log(
+                log_level=logging.WARNING,
+                message=(
+                    f"{len(ids)} messages exceeded {stream.max_deliveries} "
+                    "deliveries and were acknowledged without processing"
+                ),
+                extra=self.get_log_context(None),
+            )
+
+    @abstractmethod
+    async def _consume_entries(
+        self,
+        channel: str,
+        msgs: Sequence[tuple[Offset, dict[bytes, bytes]]],
+    ) -> None:
+        raise NotImplementedError
+
     @override
     async def get_one(
         self,
@@ -287,15 +399,23 @@ class StreamSubscriber(_StreamHandlerMixin):
             if msgs:
                 self.last_id = msgs[-1][0].decode()
 
-                for message_id, raw_msg in msgs:
-                    msg = DefaultStreamMessage(
-                        type="stream",
-                        channel=stream_name.decode(),
-                        message_ids=[message_id],
-                        data=raw_msg,
-                    )
+                await self._consume_entries(stream_name.decode(), msgs)
+
+    @override
+    async def _consume_entries(
+        self,
+        channel: str,
+        msgs: Sequence[tuple[Offset, dict[bytes, bytes]]],
+    ) -> None:
+        for message_id, raw_msg in msgs:
+            msg = DefaultStreamMessage(
+                type="stream",
+                channel=channel,
+                message_ids=[message_id],
+                data=raw_msg,
+            )
 
-                    await self.consume_one(msg)
+            await self.consume_one(msg)
 
 
 class StreamBatchSubscriber(_StreamHandlerMixin):
@@ -310,6 +430,14 @@ class StreamBatchSubscriber(_StreamHandlerMixin):
         config.parser = parser.parse_message
         super().__init__(config, specification, calls)
 
+        stream_sub = self._stream_sub
+        if stream_sub.batch_latency_ms is not None:
+            assert stream_sub.max_records
+            self.adaptive_batch_size = AdaptiveBatchSize(
+                stream_sub.batch_latency_ms / 1000,
+                max_size=stream_sub.max_records,
+            )
+
     async def _get_msgs(
         self,
         read: Callable[
@@ -323,20 +451,33 @@ class StreamBatchSubscriber(_StreamHandlerMixin):
             if msgs:
                 self.last_id = msgs[-1][0].decode()
 
-                data: list[dict[bytes, bytes]] = []
-                ids: list[bytes] = []
-                for message_id, i in msgs:
-                    data.append(i)
-                    ids.append(message_id)
-
-                msg = BatchStreamMessage(
-                    type="bstream",
-                    channel=stream_name.decode(),
-                    data=data,
-                    message_ids=ids,
-                )
+                await self._consume_entries(stream_name.decode(), msgs)
 
-                await self.consume_one(msg)
+    @override
+    async def _consume_entries(
+        self,
+        channel: str,
+        msgs: Sequence[tuple[Offset, dict[bytes, bytes]]],
+    ) -> None:
+        data: list[dict[bytes, bytes]] = []
+        ids: list[bytes] = []
+        for message_id, i in msgs:
+            data.append(i)
+            ids.append(message_id)
+
+        msg = BatchStreamMessage(
+            type="bstream",
+            channel=channel,
+            data=data,
+            message_ids=ids,
+        )
+
+        if self.adaptive_batch_size is None:
+            await self.consume_one(msg)
+            return
+
+        with self.adaptive_batch_size.measure(len(ids)):
+            await self.consume_one(msg)
 
 
 class StreamConcurrentSubscriber(
@@ -349,3 +490,138 @@ class StreamConcurrentSubscriber(
 
     async def consume_one(self, msg: "BrokerStreamMessage[Any]") -> None:
         await self._put_msg(msg)
+
+
+class _StreamAckBuffer:
+    """Collects acknowledged message IDs to send them by a single pipelined `XACK`.
+
+    Passed to the acknowledgement middleware instead of the Redis client.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[str, str], list[bytes]] = {}
+
+    async def xack(self, name: str, groupname: str, *ids: bytes) -> int:
+        self._pending.setdefault((name, groupname), []).extend(ids)
+        return len(ids)
+
+    async def flush(self, client: "Redis[bytes]") -> None:
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for (name, groupname), ids in pending.items():
+                    pipe.xack(name, groupname, *ids)
+                await pipe.execute()
+
+        except Exception:
+            # keep acks to send them with the next flush
+            for key, ids in pending.items():
+                self._pending.setdefault(key, [])[:0] = ids
+            raise
+
+
+class StreamPipelineSubscriber(StreamSubscriber):
+    """Processes each read batch concurrently and acknowledges it at once.
+
+    The next batch is requested while the current one is still processing.
+    Entries of a read in flight are already moved to the consumer PEL,
+    so stop waits for it and processes them before the subscriber shuts down.
+    """
+
+    def __init__(
+        self,
+        config: "RedisSubscriberConfig",
+        specification: "SubscriberSpecification[Any, Any]",
+        calls: "CallsCollection[Any]",
+        max_workers: int,
+    ) -> None:
+        super().__init__(config, specification, calls)
+
+        self.max_workers = max_workers
+        self.limiter = anyio.Semaphore(max_workers)
+
+        self._ack_buffer = _StreamAckBuffer()
+        self._prefetch: asyncio.Task[ReadResult] | None = None
+
+        self._closing = False
+        self._drained: anyio.Event | None = None
+
+    @override
+    async def _consume(self, *args: Any, start_signal: "Event") -> None:
+        self.extra_watcher_options["redis"] = self._ack_buffer
+        self._closing = False
+        self._drained = anyio.Event()
+        await super()._consume(*args, start_signal=start_signal)
+
+    @override
+    async def stop(self) -> None:
+        self._closing = True
+
+        if self.running and self._drained is not None:
+            # let the consume loop process already read entries
+            with anyio.move_on_after(self._outer_config.graceful_timeout):
+                await self._drained.wait()
+
+        await super().stop()
+
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+
+        await self._ack_buffer.flush(self._client)
+
+    @override
+    async def _get_msgs(self, read: Callable[[str], Awaitable[ReadResult]]) -> None:
+        if (prefetch := self._prefetch) is not None:
+            try:
+                result = await prefetch
+            finally:
+                self._prefetch = None
+
+        elif self._closing:
+            assert self._drained
+            self._drained.set()
+            # wait for the cancellation by stop
+            await anyio.sleep_forever()
+            return
+
+        else:
+            result = await read(self.last_id)
+
+        for stream_name, msgs in result:
+            if msgs:
+                self.last_id = msgs[-1][0].decode()
+
+                if not self._closing:
+                    self._prefetch = asyncio.ensure_future(read(self.last_id))
+
+                await self._consume_entries(stream_name.decode(), msgs)
+
+    @override
+    async def _consume_entries(
+        self,
+        channel: str,
+        msgs: Sequence[tuple[Offset, dict[bytes, bytes]]],
+    ) -> None:
+        async with anyio.create_task_group() as tg:
+            for message_id, raw_msg in msgs:
+                msg = DefaultStreamMessage(
+                    type="stream",
+                    channel=channel,
+                    message_ids=[message_id],
+                    data=raw_msg,
+                )
+
+                tg.start_soon(self._consume_msg, msg)
+
+        await self._ack_buffer.flush(self._client)
+
+    async def _consume_msg(self, msg: "DefaultStreamMessage") -> None:
+        async with self.limiter:
+            await self.consume(msg)
@@ -16,6 +16,7 @@ from typing_extensions import TypedDict, override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.testing.broker import TestBroker, change_producer
+from faststream._internal.testing.routing import RoutingIndex, RoutingTable
 from faststream.exceptions import SetupError, SubscriberNotFound
 from faststream.message import gen_cor_id
 from faststream.redis.broker.broker import RedisBroker
@@ -39,6 +40,7 @@ if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.endpoint.subscriber import SubscriberUsecase
     from faststream.redis.publisher.usecase import LogicPublisher
     from faststream.redis.subscriber.usecases.basic import LogicSubscriber
 
@@ -50,16 +52,22 @@ class TestRedisBroker(TestBroker[RedisBroker]):
 
     @contextmanager
     def _patch_producer(self, broker: RedisBroker) -> Iterator[None]:
+        routes = RoutingTable(broker, _build_routes)
+
         with ExitStack() as es:
             es.enter_context(
                 change_producer(
-                    broker.config.broker_config, FakeProducer(broker, broker.config)
+                    broker.config.broker_config,
+                    FakeProducer(broker, broker.config, routes),
                 ),
             )
 
             for publisher in cast("list[LogicPublisher]", broker.publishers):
                 es.enter_context(
-                    change_producer(publisher, FakeProducer(broker, publisher.config)),
+                    change_producer(
+                        publisher,
+                        FakeProducer(broker, publisher.config, routes),
+                    ),
                 )
 
             yield
@@ -100,8 +108,11 @@ class TestRedisBroker(TestBroker[RedisBroker]):
 
         pub_sub = AsyncMock()
 
-        async def get_msg(*args: Any, timeout: float, **kwargs: Any) -> None:
-            await anyio.sleep(timeout)
+        async def get_msg(*args: Any, timeout: float | None, **kwargs: Any) -> None:
+            if timeout is None:
+                await anyio.sleep_forever()
+            else:
+                await anyio.sleep(timeout)
 
         pub_sub.get_message = get_msg
 
@@ -112,8 +123,14 @@ class TestRedisBroker(TestBroker[RedisBroker]):
 
 
 class FakeProducer(RedisFastProducer):
-    def __init__(self, broker: RedisBroker, config: ParserConfig) -> None:
+    def __init__(
+        self,
+        broker: RedisBroker,
+        config: ParserConfig,
+        routes: Optional["RoutingTable[_Routes]"] = None,
+    ) -> None:
         self.broker = broker
+        self._routes = routes or RoutingTable(broker, _build_routes)
 
         default = RedisPubSubParser(config)
 
@@ -140,8 +157,9 @@ class FakeProducer(RedisFastProducer):
         destination = _make_destination_kwargs(cmd)
         visitors = (ChannelVisitor(), ListVisitor(), StreamVisitor())
 
-        for handler in self.broker.subscribers:  # pragma: no branch
-            handler = cast("LogicSubscriber", handler)
+        for handler in self._routes.index[cmd.destination_type].match(
+            cmd.destination,
+        ):
             for visitor in visitors:
                 if visited_ch := visitor.visit(**destination, sub=handler):
                     msg = visitor.get_message(
@@ -166,8 +184,9 @@ class FakeProducer(RedisFastProducer):
         destination = _make_destination_kwargs(cmd)
         visitors = (ChannelVisitor(), ListVisitor(), StreamVisitor())
 
-        for handler in self.broker.subscribers:  # pragma: no branch
-            handler = cast("LogicSubscriber", handler)
+        for handler in self._routes.index[cmd.destination_type].match(
+            cmd.destination,
+        ):
             for visitor in visitors:
                 if visited_ch := visitor.visit(**destination, sub=handler):
                     msg = visitor.get_message(
@@ -194,8 +213,9 @@ class FakeProducer(RedisFastProducer):
         ]
 
         visitor = ListVisitor()
-        for handler in self.broker.subscribers:  # pragma: no branch
-            handler = cast("LogicSubscriber", handler)
+        for handler in self._routes.index[DestinationType.List].match(
+            cmd.destination,
+        ):
             if visitor.visit(list=cmd.destination, sub=handler):
                 casted_handler = cast("_ListHandlerMixin", handler)
 
@@ -379,6 +399,38 @@ class StreamVisitor(Visitor):
         )
 
 
+_Routes = dict[DestinationType, RoutingIndex["LogicSubscriber"]]
+
+
+def _build_routes(subscribers: Sequence["SubscriberUsecase[Any]"]) -> _Routes:
+    channels: RoutingIndex[LogicSubscriber] = RoutingIndex()
+    lists: RoutingIndex[LogicSubscriber] = RoutingIndex()
+    streams: RoutingIndex[LogicSubscriber] = RoutingIndex()
+
+    for handler in cast("Sequence[LogicSubscriber]", subscribers):
+        if isinstance(handler, ChannelSubscriber):
+            channel = handler.channel
+            channels.add(channel.name, handler)
+
+            if channel.pattern:
+                channels.add_regex(
+                    re.compile(channel.name.replace(".", "\\.").replace("*", ".*")),
+                    handler,
+                )
+
+        elif isinstance(handler, _ListHandlerMixin):
+            lists.add(handler.list_sub.name, handler)
+
+        elif isinstance(handler, _StreamHandlerMixin):
+            streams.add(handler.stream_sub.name, handler)
+
+    return {
+        DestinationType.Channel: channels,
+        DestinationType.List: lists,
+        DestinationType.Stream: streams,
+    }
+
+
 class _DestinationKwargs(TypedDict, total=False):
     channel: str
     list: str
@@ -252,6 +252,65 @@ class MiddlewaresOrderTestcase(BaseTestcaseConfig):
         call_order = [c.args[0] for c in mock.call_args_list]
         assert call_order == ["outer", "middle", "inner"], call_order
 
+    async def test_processing_pipeline_built_once(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        class Middleware(BaseMiddleware):
+            async def consume_scope(self, call_next, msg):
+                mock.consume()
+                return await call_next(msg)
+
+        broker = self.get_broker(middlewares=[Middleware])
+
+        args, kwargs = self.get_subscriber_params(queue)
+        subscriber = broker.subscriber(*args, **kwargs)
+
+        @subscriber
+        async def handler(msg) -> None:
+            mock.handler(msg)
+
+        async with self.patch_broker(broker) as br:
+            pipeline = subscriber._pipeline
+            assert pipeline is not None
+
+            await br.publish("1", queue)
+            await br.publish("2", queue)
+
+            assert subscriber._pipeline is pipeline
+
+        assert mock.consume.call_count == 2
+        assert [c.args[0] for c in mock.handler.call_args_list] == ["1", "2"]
+
+    async def test_processing_pipeline_rebuilt_by_new_middleware(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        class Middleware(BaseMiddleware):
+            async def consume_scope(self, call_next, msg):
+                mock.consume(msg.body)
+                return await call_next(msg)
+
+        broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(msg) -> None:
+            mock.handler(msg)
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("1", queue)
+
+            # middleware added to already started broker
+            br.add_middleware(Middleware)
+            await br.publish("2", queue)
+
+        mock.consume.assert_called_once_with(b"2")
+        assert [c.args[0] for c in mock.handler.call_args_list] == ["1", "2"]
+
 
 @pytest.mark.asyncio()
 class LocalMiddlewareTestcase(BaseTestcaseConfig):
@@ -55,6 +55,25 @@ class RequestsTestcase(BaseTestcaseConfig):
         assert await response.decode() == "Response"
         assert response.correlation_id == "1", response.correlation_id
 
+    async def test_concurrent_requests(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(msg: str) -> str:
+            await anyio.sleep(0.01)
+            return msg
+
+        async with self.patch_broker(broker):
+            await broker.start()
+
+            responses = await asyncio.gather(
+                *(broker.request(str(i), queue, timeout=self.timeout) for i in range(10))
+            )
+
+        assert [await r.decode() for r in responses] == [str(i) for i in range(10)]
+
     async def test_publisher_base_request(self, queue: str) -> None:
         broker = self.get_broker()
 
@@ -0,0 +1,94 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from confluent_kafka import KafkaException
+
+from faststream.confluent.helpers.client import (
+    AsyncConfluentProducer,
+    _BatchDelivery,
+    _DeliveryReports,
+)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.confluent()
+async def test_reports_resolved_by_dispatch() -> None:
+    reports = _DeliveryReports(asyncio.get_running_loop())
+
+    ok, failed = reports.loop.create_future(), reports.loop.create_future()
+    msg = MagicMock()
+    msg.error.return_value = None
+
+    reports.on_delivery(ok, None, msg)
+    reports.on_delivery(failed, "error", None)
+    await asyncio.sleep(0)
+    assert not ok.done()
+
+    reports.dispatch()
+    assert await ok is msg
+    with pytest.raises(KafkaException):
+        await failed
+
+
+@pytest.mark.asyncio()
+@pytest.mark.confluent()
+async def test_batch_resolved_after_seal() -> None:
+    reports = _DeliveryReports(asyncio.get_running_loop())
+    delivery = _BatchDelivery(reports)
+
+    delivery.produced = 2
+    delivery(None, None)
+    delivery(None, None)
+    reports.dispatch()
+    await asyncio.sleep(0)
+    assert not delivery.future.done()
+
+    delivery.seal()
+    reports.dispatch()
+    await delivery.future
+
+
+@pytest.mark.asyncio()
+@pytest.mark.confluent()
+async def test_batch_failed_by_message_error() -> None:
+    reports = _DeliveryReports(asyncio.get_running_loop())
+    delivery = _BatchDelivery(reports)
+
+    delivery.produced = 2
+    delivery.seal()
+    delivery(None, None)
+    delivery("error", None)
+    reports.dispatch()
+
+    with pytest.raises(KafkaException):
+        await delivery.future
+
+
+@pytest.mark.asyncio()
+@pytest.mark.confluent()
+async def test_batch_cancelled_by_produce_error() -> None:
+    client = MagicMock(
+        produce=MagicMock(side_effect=[None, BufferError("queue is full")]),
+        poll=time.sleep,
+    )
+
+    with patch("faststream.confluent.helpers.client.Producer", return_value=client):
+        producer = AsyncConfluentProducer(logger=MagicMock(), config=MagicMock())
+
+    batch = producer.create_batch()
+    batch.append(value=b"1")
+    batch.append(value=b"2")
+
+    try:
+        with pytest.raises(BufferError):
+            await producer.send_batch(batch, "topic", partition=None)
+
+        # report of the already produced message is not awaited by anyone
+        delivery = client.produce.call_args.kwargs["on_delivery"]
+        assert delivery.future.cancelled()
+
+        delivery(None, None)
+    finally:
+        await producer.stop()
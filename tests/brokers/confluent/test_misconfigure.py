@@ -103,3 +103,16 @@ def test_use_only_confluent_router() -> None:
 
     with pytest.raises(SetupError):
         broker.include_routers(routers)
+
+
+@pytest.mark.confluent()
+def test_poll_batch_size(queue: str) -> None:
+    broker = KafkaBroker()
+
+    broker.subscriber(queue, poll_batch_size=100)
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, batch=True, poll_batch_size=100)
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, poll_batch_size=0)
@@ -1,5 +1,8 @@
+from unittest.mock import MagicMock
+
 import pytest
 
+from faststream.confluent.parser import AsyncConfluentParser
 from tests.brokers.base.parser import CustomParserTestcase
 
 from .basic import ConfluentTestcaseConfig
@@ -9,3 +12,37 @@ from .basic import ConfluentTestcaseConfig
 @pytest.mark.confluent()
 class TestCustomParser(ConfluentTestcaseConfig, CustomParserTestcase):
     pass
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    "headers",
+    (
+        pytest.param(
+            [("content-type", b"text/plain"), ("empty", None), ("str", "1")],
+            id="list",
+        ),
+        pytest.param(
+            {"content-type": b"text/plain", "empty": None, "str": "1"},
+            id="dict",
+        ),
+    ),
+)
+async def test_parse_headers(headers: object) -> None:
+    raw_message = MagicMock()
+    raw_message.headers.return_value = headers
+    raw_message.timestamp.return_value = (0, 0)
+    raw_message.value.return_value = b"hi"
+
+    parser = AsyncConfluentParser()
+
+    parsed = {"content-type": "text/plain", "empty": "", "str": "1"}
+
+    message = await parser.parse_message(raw_message)
+    assert message.headers == parsed
+    assert message.content_type == "text/plain"
+
+    batch = await parser.parse_message_batch((raw_message, raw_message))
+    assert batch.batch_headers == [parsed, parsed]
+    assert await parser.decode_message_batch(batch) == ["hi", "hi"]
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream.confluent.helpers.client import _BufferedPoller
+
+
+class FakeConsumer:
+    def __init__(self, messages: list[Any]) -> None:
+        self.messages = messages
+        self.calls = 0
+
+    def consume(self, num_messages: int, timeout: float) -> list[Any]:
+        self.calls += 1
+        batch, self.messages = self.messages[:num_messages], self.messages[num_messages:]
+        return batch
+
+
+def make_message(offset: int, partition: int = 0) -> Any:
+    msg = MagicMock()
+    msg.error.return_value = None
+    msg.topic.return_value = "topic"
+    msg.partition.return_value = partition
+    msg.offset.return_value = offset
+    return msg
+
+
+@pytest.mark.asyncio()
+@pytest.mark.confluent()
+async def test_poller_bulk_handoff() -> None:
+    consumer = FakeConsumer([make_message(i) for i in range(5)])
+    poller = _BufferedPoller(consumer, batch_size=2, timeout=0.01)  # type: ignore[arg-type]
+
+    poller.start()
+    try:
+        offsets: list[int | None] = []
+        while len(offsets) < 5:
+            msg = await poller.get(timeout=1)
+            assert msg is not None
+            offsets.append(msg.offset())
+
+        assert offsets == [0, 1, 2, 3, 4]
+        assert await poller.get(timeout=0.05) is None
+
+    finally:
+        poller.stop()
+        await asyncio.to_thread(poller.join)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.confluent()
+async def test_poller_buffer_is_bounded() -> None:
+    consumer = FakeConsumer([make_message(i) for i in range(10)])
+    poller = _BufferedPoller(
+        consumer,  # type: ignore[arg-type]
+        batch_size=1,
+        max_batches=2,
+        timeout=0.01,
+    )
+
+    poller.start()
+    try:
+        await asyncio.sleep(0.1)
+        assert consumer.calls == 2
+
+        assert await poller.get(timeout=1) is not None
+        await asyncio.sleep(0.1)
+        assert consumer.calls == 3
+
+    finally:
+        poller.stop()
+        await asyncio.to_thread(poller.join)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.confluent()
+async def test_poller_raises_consume_error() -> None:
+    consumer = MagicMock()
+    consumer.consume.side_effect = ValueError()
+    poller = _BufferedPoller(consumer, batch_size=1, timeout=0.01)
+
+    poller.start()
+    try:
+        with pytest.raises(ValueError):  # noqa: PT011
+            await poller.get(timeout=1)
+
+    finally:
+        poller.stop()
+        await asyncio.to_thread(poller.join)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.confluent()
+async def test_poller_drops_revoked_partitions() -> None:
+    consumer = FakeConsumer([make_message(i, partition=i % 2) for i in range(6)])
+    poller = _BufferedPoller(consumer, batch_size=3, timeout=0.01)  # type: ignore[arg-type]
+
+    poller.start()
+    try:
+        first = await poller.get(timeout=1)
+        assert first is not None
+        assert first.offset() == 0
+
+        while len(poller._batches) < 2:  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+        await asyncio.to_thread(poller.call_in_loop, poller.drop, {("topic", 0)})
+
+        offsets = []
+        while (msg := await poller.get(timeout=0.05)) is not None:
+            offsets.append(msg.offset())
+
+        assert offsets == [1, 3, 5]
+
+    finally:
+        poller.stop()
+        await asyncio.to_thread(poller.join)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.confluent()
+async def test_poller_call_in_loop_timeout() -> None:
+    poller = _BufferedPoller(
+        MagicMock(),
+        batch_size=1,
+        call_timeout=0.05,
+        logger=(logger := MagicMock()),
+    )
+    poller._loop = asyncio.get_running_loop()
+
+    func = MagicMock(__name__="drop")
+
+    # the event loop is blocked by joining the thread waiting for the call
+    thread = threading.Thread(target=poller.call_in_loop, args=(func,))
+    thread.start()
+    thread.join()
+
+    logger.log.assert_called_once()
+    await asyncio.sleep(0)
+    func.assert_not_called()
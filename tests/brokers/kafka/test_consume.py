@@ -436,6 +436,46 @@ class TestConsume(KafkaTestcaseConfig, BrokerRealConsumeTestcase):
         assert event2.is_set()
         assert mock.call_count == 2, mock.call_count
 
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    async def test_concurrent_consume_ordered_by_key(self, queue: str) -> None:
+        consume_broker = self.get_broker()
+
+        received: dict[bytes, list[int]] = {b"a": [], b"d": []}
+        in_progress = 0
+        max_in_progress = 0
+        done = asyncio.Event()
+
+        @consume_broker.subscriber(
+            queue,
+            group_id="test",
+            max_workers=2,
+            ordered_by_key=True,
+            ack_policy=AckPolicy.ACK,
+            auto_offset_reset="earliest",
+        )
+        async def handler(msg: int, message: KafkaMessage) -> None:
+            nonlocal in_progress, max_in_progress
+            in_progress += 1
+            max_in_progress = max(max_in_progress, in_progress)
+            await asyncio.sleep(0.05)
+            received[message.raw_message.key].append(msg)
+            in_progress -= 1
+
+            if sum(map(len, received.values())) == 10:
+                done.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            for i in range(10):
+                await br.publish(i, queue, key=b"a" if i % 2 else b"d")
+
+            await asyncio.wait_for(done.wait(), timeout=10)
+
+        assert received == {b"a": [1, 3, 5, 7, 9], b"d": [0, 2, 4, 6, 8]}
+        assert max_in_progress == 2
+
     @pytest.mark.asyncio()
     @pytest.mark.slow()
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
@@ -6,6 +6,7 @@ from faststream import AckPolicy
 from faststream.exceptions import SetupError
 from faststream.kafka import KafkaBroker, KafkaRouter, TopicPartition
 from faststream.kafka.subscriber.usecase import (
+    ConcurrentBetweenKeysSubscriber,
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
 )
@@ -63,6 +64,46 @@ from faststream.rabbit import RabbitRouter
             },
             id="partitions with manual commit",
         ),
+        pytest.param(
+            ("topic",),
+            {"batch": True, "max_workers": 3, "ordered_by_key": True},
+            id="batch ordered by key",
+        ),
+        pytest.param(
+            ("topic",),
+            {"ordered_by_key": True},
+            id="ordered by key without workers",
+        ),
+        pytest.param(
+            ("topic",),
+            {"commit_batch_size": 0, "ack_policy": AckPolicy.ACK},
+            id="non-positive commit batch size",
+        ),
+        pytest.param(
+            ("topic",),
+            {"commit_batch_size": 10},
+            id="commit batch size with ack first",
+        ),
+        pytest.param(
+            ("topic",),
+            {"batch": True, "commit_batch_size": 10, "ack_policy": AckPolicy.ACK},
+            id="batch with commit batch size",
+        ),
+        pytest.param(
+            ("topic",),
+            {"batch_latency_ms": 100, "max_records": 10},
+            id="batch latency without batch",
+        ),
+        pytest.param(
+            ("topic",),
+            {"batch": True, "batch_latency_ms": 100},
+            id="batch latency without max records",
+        ),
+        pytest.param(
+            ("topic",),
+            {"batch": True, "batch_latency_ms": 0, "max_records": 10},
+            id="non-positive batch latency",
+        ),
     ),
 )
 def test_wrong_destination(args: list[str], kwargs: dict[str, Any]) -> None:
@@ -108,6 +149,15 @@ def test_max_workers_configuration(queue: str) -> None:
     sub = broker.subscriber(queue, max_workers=3, ack_policy=AckPolicy.REJECT_ON_ERROR)
     assert isinstance(sub, ConcurrentBetweenPartitionsSubscriber)
 
+    sub = broker.subscriber(
+        queue,
+        f"{queue}1",
+        max_workers=3,
+        ordered_by_key=True,
+        ack_policy=AckPolicy.ACK,
+    )
+    assert isinstance(sub, ConcurrentBetweenKeysSubscriber)
+
     with pytest.raises(SetupError), pytest.warns(DeprecationWarning):
         broker.subscriber(
             partitions=[TopicPartition(topic="topic", partition=1)],
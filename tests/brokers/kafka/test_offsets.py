@@ -0,0 +1,144 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiokafka import ConsumerRecord, TopicPartition
+
+from faststream.kafka.helpers.offsets import OffsetTracker
+from faststream.kafka.message import KafkaAckableMessage
+
+
+def make_record(offset: int, partition: int = 0) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic="topic",
+        partition=partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=b"",
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=(),
+    )
+
+
+def make_consumer(*partitions: int) -> MagicMock:
+    consumer = MagicMock()
+    consumer.commit = AsyncMock()
+    consumer.assignment.return_value = {
+        TopicPartition("topic", p) for p in partitions or (0,)
+    }
+    return consumer
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_commit_contiguous_offsets() -> None:
+    consumer = make_consumer()
+    tracker = OffsetTracker(consumer)
+
+    first, second, third = (tracker.track(make_record(i)) for i in range(3))
+
+    await second.commit()
+    await third.commit()
+    consumer.commit.assert_not_called()
+
+    await first.commit()
+    consumer.commit.assert_awaited_once_with({TopicPartition("topic", 0): 3})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_commit_partitions_independently() -> None:
+    consumer = make_consumer(0, 1)
+    tracker = OffsetTracker(consumer)
+
+    blocked = tracker.track(make_record(0, partition=0))
+    ready = tracker.track(make_record(10, partition=1))
+
+    await ready.commit()
+    consumer.commit.assert_awaited_once_with({TopicPartition("topic", 1): 11})
+
+    await blocked.commit()
+    consumer.commit.assert_awaited_with({TopicPartition("topic", 0): 1})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_seek_forgets_redelivered_offsets() -> None:
+    consumer = make_consumer()
+    tracker = OffsetTracker(consumer)
+
+    first, second = tracker.track(make_record(0)), tracker.track(make_record(1))
+
+    first.seek(first.partition, 0)
+    consumer.seek.assert_called_once_with(TopicPartition("topic", 0), 0)
+
+    await second.commit()
+    consumer.commit.assert_not_called()
+
+    await tracker.track(make_record(0)).commit()
+    consumer.commit.assert_awaited_once_with({TopicPartition("topic", 0): 1})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_skip_revoked_partitions() -> None:
+    consumer = make_consumer(1)
+    tracker = OffsetTracker(consumer)
+
+    await tracker.track(make_record(0, partition=0)).commit()
+    consumer.commit.assert_not_called()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_commit_by_batch_size() -> None:
+    consumer = make_consumer()
+    tracker = OffsetTracker(consumer, commit_batch_size=3)
+
+    records = [tracker.track(make_record(i)) for i in range(4)]
+
+    await records[0].commit()
+    await records[1].commit()
+    consumer.commit.assert_not_called()
+
+    await records[2].commit()
+    consumer.commit.assert_awaited_once_with({TopicPartition("topic", 0): 3})
+
+    await records[3].commit()
+    await tracker.commit()
+    consumer.commit.assert_awaited_with({TopicPartition("topic", 0): 4})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_reject_completes_tracked_offset() -> None:
+    consumer = make_consumer()
+    tracker = OffsetTracker(consumer)
+
+    record = make_record(0)
+    message = KafkaAckableMessage(
+        raw_message=record,
+        body=b"",
+        consumer=tracker.track(record),
+    )
+
+    await message.reject()
+    consumer.commit.assert_awaited_once_with({TopicPartition("topic", 0): 1})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_reject_not_commits_untracked() -> None:
+    consumer = make_consumer()
+
+    message = KafkaAckableMessage(
+        raw_message=make_record(0),
+        body=b"",
+        consumer=consumer,
+    )
+
+    await message.reject()
+    consumer.commit.assert_not_called()
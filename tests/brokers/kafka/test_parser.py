@@ -1,5 +1,8 @@
 import pytest
+from aiokafka import ConsumerRecord
 
+from faststream.kafka.message import KafkaMessage
+from faststream.kafka.parser import AioKafkaBatchParser
 from tests.brokers.base.parser import CustomParserTestcase
 
 from .basic import KafkaTestcaseConfig
@@ -9,3 +12,37 @@ from .basic import KafkaTestcaseConfig
 @pytest.mark.connected()
 class TestCustomParser(KafkaTestcaseConfig, CustomParserTestcase):
     pass
+
+
+def make_record(offset: int, value: bytes, headers: dict[str, str]) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic="in",
+        partition=0,
+        offset=offset,
+        timestamp=1,
+        timestamp_type=0,
+        key=None,
+        value=value,
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=len(value),
+        headers=[(k, v.encode()) for k, v in headers.items()],
+    )
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_batch_parser_headers() -> None:
+    parser = AioKafkaBatchParser(msg_class=KafkaMessage, regex=None)
+
+    message = await parser.parse_message((
+        make_record(0, b"1", {"content-type": "application/json", "key": "1"}),
+        make_record(1, b"hi", {"content-type": "text/plain", "key": "2"}),
+    ))
+
+    assert message.headers == {"content-type": "application/json", "key": "1"}
+    assert message.batch_headers == [
+        message.headers,
+        {"content-type": "text/plain", "key": "2"},
+    ]
+    assert await parser.decode_message(message) == [1, "hi"]
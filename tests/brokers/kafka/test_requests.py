@@ -1,11 +1,16 @@
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from aiokafka import TopicPartition
+from aiokafka.errors import ConsumerStoppedError
 
 from faststream import BaseMiddleware
+from faststream.exceptions import IncorrectState
+from faststream.kafka.publisher.producer import _RPCConsumer
 from tests.brokers.base.requests import RequestsTestcase
 
-from .basic import KafkaMemoryTestcaseConfig
+from .basic import KafkaMemoryTestcaseConfig, KafkaTestcaseConfig
 
 
 class Mid(BaseMiddleware):
@@ -17,8 +22,98 @@ class Mid(BaseMiddleware):
         return await call_next(msg)
 
 
-@pytest.mark.kafka()
 @pytest.mark.asyncio()
-class TestRequestTestClient(KafkaMemoryTestcaseConfig, RequestsTestcase):
+class KafkaRequestsTestcase(RequestsTestcase):
     def get_middleware(self, **kwargs: Any):
         return Mid
+
+
+@pytest.mark.connected()
+@pytest.mark.kafka()
+class TestRealRequests(KafkaTestcaseConfig, KafkaRequestsTestcase):
+    pass
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+class TestRequestTestClient(KafkaMemoryTestcaseConfig, KafkaRequestsTestcase):
+    pass
+
+
+def make_consumer(partitions: set[int]) -> MagicMock:
+    consumer = MagicMock(
+        start=AsyncMock(),
+        stop=AsyncMock(),
+        topics=AsyncMock(),
+        seek_to_end=AsyncMock(),
+        getone=AsyncMock(side_effect=ConsumerStoppedError),
+    )
+    consumer.partitions_for_topic.return_value = partitions
+    return consumer
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_rpc_temporary_reply_topic() -> None:
+    consumer = make_consumer(set())
+    admin_client = MagicMock(create_topics=AsyncMock(), delete_topics=AsyncMock())
+
+    rpc = _RPCConsumer(lambda **_: consumer, admin_client, replication_factor=3)
+    await rpc.start()
+
+    (new_topic,) = admin_client.create_topics.await_args.args[0]
+    assert new_topic.name == rpc.topic
+    assert new_topic.replication_factor == 3
+    consumer.assign.assert_called_once_with([TopicPartition(rpc.topic, 0)])
+
+    await rpc.disconnect()
+    admin_client.delete_topics.assert_awaited_once_with([rpc.topic])
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_rpc_shared_reply_topic() -> None:
+    consumer = make_consumer({0, 1})
+    admin_client = MagicMock(create_topics=AsyncMock(), delete_topics=AsyncMock())
+
+    rpc = _RPCConsumer(lambda **_: consumer, admin_client, reply_topic="replies")
+    await rpc.start()
+
+    admin_client.create_topics.assert_not_called()
+    assert set(consumer.assign.call_args.args[0]) == {
+        TopicPartition("replies", 0),
+        TopicPartition("replies", 1),
+    }
+    # responses to previous requests are skipped
+    consumer.seek_to_end.assert_awaited_once()
+
+    await rpc.disconnect()
+    admin_client.delete_topics.assert_not_called()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_rpc_missing_reply_topic() -> None:
+    consumer = make_consumer(set())
+
+    rpc = _RPCConsumer(lambda **_: consumer, MagicMock(), reply_topic="replies")
+
+    with pytest.raises(IncorrectState):
+        await rpc.start()
+
+    consumer.stop.assert_awaited_once()
+    assert rpc.consumer is None
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_rpc_drops_unknown_response() -> None:
+    rpc = _RPCConsumer(MagicMock(), MagicMock())
+
+    with rpc.wait_reply("1") as future:
+        # a late response to another request must not be taken for this one
+        rpc._on_response(MagicMock(headers=[("correlation_id", b"2")]))
+        assert not future.done()
+
+        rpc._on_response(response := MagicMock(headers=[("correlation_id", b"1")]))
+        assert future.result() is response
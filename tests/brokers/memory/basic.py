@@ -0,0 +1,16 @@
+from typing import Any
+
+from faststream.memory import MemoryBroker, MemoryRouter
+from tests.brokers.base.basic import BaseTestcaseConfig
+
+
+class MemoryTestcaseConfig(BaseTestcaseConfig):
+    def get_broker(
+        self,
+        apply_types: bool = False,
+        **kwargs: Any,
+    ) -> MemoryBroker:
+        return MemoryBroker(apply_types=apply_types, **kwargs)
+
+    def get_router(self, **kwargs: Any) -> MemoryRouter:
+        return MemoryRouter(**kwargs)
@@ -0,0 +1,158 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+
+from faststream import AckPolicy
+from faststream.exceptions import SetupError
+from faststream.memory import MemoryMessage
+from tests.brokers.base.consume import BrokerRealConsumeTestcase
+
+from .basic import MemoryTestcaseConfig
+
+
+@pytest.mark.asyncio()
+class TestConsume(MemoryTestcaseConfig, BrokerRealConsumeTestcase):
+    async def test_consume_groups(self, queue: str, mock: MagicMock) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, group="first")
+        async def first_1(msg: str) -> None:
+            mock.first(msg)
+
+        @broker.subscriber(queue, group="first")
+        async def first_2(msg: str) -> None:
+            mock.first(msg)
+
+        @broker.subscriber(queue, group="second")
+        async def second(msg: str) -> None:
+            mock.second(msg)
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            for i in range(10):
+                assert await br.publish(i, queue) == 2
+
+            with anyio.fail_after(self.timeout):
+                while mock.first.call_count + mock.second.call_count < 20:  # noqa: ASYNC110
+                    await asyncio.sleep(0.01)
+
+        # each group gets each message once
+        assert sorted(c.args[0] for c in mock.first.call_args_list) == list(range(10))
+        assert sorted(c.args[0] for c in mock.second.call_args_list) == list(range(10))
+
+    async def test_group_queue_dropped_by_last_subscriber(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        first = broker.subscriber(queue, group="group")
+        second = broker.subscriber(queue, group="group")
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            groups = br.config.connection.topic(queue).groups
+
+            await first.stop()
+            assert "group" in groups
+
+            await second.stop()
+            assert "group" not in groups
+            assert await br.publish("hello", queue) == 0
+
+    async def test_nack_redelivery(self, queue: str, mock: MagicMock) -> None:
+        event = asyncio.Event()
+
+        broker = self.get_broker(apply_types=True)
+
+        @broker.subscriber(queue, ack_policy=AckPolicy.NACK_ON_ERROR)
+        async def handler(msg: MemoryMessage) -> None:
+            mock(msg.raw_message.deliveries)
+            if msg.raw_message.deliveries < 3:
+                raise ValueError
+            event.set()
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            await br.publish("hello", queue)
+
+            with anyio.move_on_after(self.timeout):
+                await event.wait()
+
+        assert event.is_set()
+        assert [c.args[0] for c in mock.call_args_list] == [1, 2, 3]
+
+    async def test_reject_drops_message(self, queue: str, mock: MagicMock) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def handler(msg) -> None:
+            mock(msg)
+            raise ValueError
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            await br.publish("hello", queue)
+            await asyncio.sleep(0.1)
+
+        mock.assert_called_once_with("hello")
+
+    async def test_backpressure(self, queue: str) -> None:
+        release = asyncio.Event()
+
+        broker = self.get_broker(max_queue_size=1)
+
+        @broker.subscriber(queue)
+        async def handler(msg) -> None:
+            await release.wait()
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            # the first message is in processing, the second one fills the queue
+            await br.publish("1", queue)
+            await asyncio.sleep(0.01)
+            await br.publish("2", queue)
+
+            with anyio.move_on_after(0.1) as scope:
+                await br.publish("3", queue)
+            assert scope.cancelled_caught
+
+            release.set()
+            with anyio.fail_after(self.timeout):
+                await br.publish("3", queue)
+
+    async def test_max_workers(self, queue: str, mock: MagicMock) -> None:
+        event = asyncio.Event()
+
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, max_workers=2)
+        async def handler(msg) -> None:
+            mock()
+            if mock.call_count == 2:
+                event.set()
+            await asyncio.sleep(self.timeout)
+
+        async with self.patch_broker(broker, graceful_timeout=0) as br:
+            await br.start()
+
+            for _ in range(3):
+                await br.publish("hello", queue)
+
+            with anyio.move_on_after(self.timeout):
+                await event.wait()
+
+            await asyncio.sleep(0.1)
+
+        assert event.is_set()
+        assert mock.call_count == 2
+
+    async def test_incorrect_max_workers(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        with pytest.raises(SetupError):
+            broker.subscriber(queue, max_workers=-1)
@@ -0,0 +1,10 @@
+import pytest
+
+from tests.brokers.base.publish import BrokerPublishTestcase
+
+from .basic import MemoryTestcaseConfig
+
+
+@pytest.mark.asyncio()
+class TestPublish(MemoryTestcaseConfig, BrokerPublishTestcase):
+    pass
@@ -0,0 +1,21 @@
+import pytest
+
+from faststream import BaseMiddleware
+from tests.brokers.base.requests import RequestsTestcase
+
+from .basic import MemoryTestcaseConfig
+
+
+class Mid(BaseMiddleware):
+    async def on_receive(self) -> None:
+        self.msg.data *= 2
+
+    async def consume_scope(self, call_next, msg):
+        msg.body *= 2
+        return await call_next(msg)
+
+
+@pytest.mark.asyncio()
+class TestRequests(MemoryTestcaseConfig, RequestsTestcase):
+    def get_middleware(self, **kwargs):
+        return Mid
@@ -0,0 +1,9 @@
+from faststream.memory import MemoryPublisher, MemoryRoute
+from tests.brokers.base.router import RouterTestcase
+
+from .basic import MemoryTestcaseConfig
+
+
+class TestRouter(MemoryTestcaseConfig, RouterTestcase):
+    route_class = MemoryRoute
+    publisher_class = MemoryPublisher
@@ -1,12 +1,12 @@
 import asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from nats.aio.msg import Msg
 
 from faststream import AckPolicy
 from faststream.exceptions import AckMessage
-from faststream.nats import ConsumerConfig, JStream, PubAck, PullSub
+from faststream.nats import ConsumerConfig, JStream, NatsBroker, PubAck, PullSub
 from faststream.nats.annotations import NatsMessage
 from faststream.nats.message import NatsMessage as StreamMessage
 from tests.brokers.base.consume import BrokerRealConsumeTestcase
@@ -150,6 +150,37 @@ class TestConsume(NatsTestcaseConfig, BrokerRealConsumeTestcase):
             assert event.is_set()
             mock.assert_called_once_with("hello")
 
+    async def test_consume_pull_prefetch(
+        self,
+        queue: str,
+        stream: JStream,
+        mock,
+    ) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            queue,
+            stream=stream,
+            pull_sub=PullSub(1, prefetch=2, max_prefetch_bytes=1024),
+        )
+        def subscriber(m) -> None:
+            mock(m)
+            if mock.call_count == 5:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            for i in range(5):
+                await br.publish(i, queue)
+
+            await asyncio.wait((asyncio.create_task(event.wait()),), timeout=3)
+
+            assert event.is_set()
+            assert sorted(c.args[0] for c in mock.call_args_list) == list(range(5))
+
     async def test_consume_batch(
         self,
         queue: str,
@@ -976,3 +1007,24 @@ class TestConsume(NatsTestcaseConfig, BrokerRealConsumeTestcase):
                     break
 
                 await bucket.put(queue, expected_messages[index_message])
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_pull_prefetch_error_stops_consuming() -> None:
+    broker = NatsBroker()
+    subscriber = broker.subscriber(
+        "subject",
+        stream="stream",
+        pull_sub=PullSub(1, prefetch=2),
+    )
+
+    subscriber.subscription = MagicMock(
+        fetch=AsyncMock(side_effect=RuntimeError("fetch failed")),
+    )
+    subscriber.running = True
+
+    with pytest.raises(Exception) as exc_info:  # noqa: PT011
+        await asyncio.wait_for(subscriber._consume_pull(cb=AsyncMock()), timeout=3)
+
+    assert exc_info.group_contains(RuntimeError, match="fetch failed")
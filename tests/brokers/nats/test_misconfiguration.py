@@ -1,7 +1,7 @@
 import pytest
 
 from faststream.exceptions import SetupError
-from faststream.nats import NatsRouter
+from faststream.nats import NatsRouter, PullSub
 from faststream.nats.broker.broker import NatsBroker
 from faststream.rabbit import RabbitRouter
 
@@ -18,3 +18,18 @@ def test_use_only_nats_router() -> None:
 
     with pytest.raises(SetupError):
         broker.include_routers(routers)
+
+
+@pytest.mark.nats()
+@pytest.mark.parametrize(
+    "pull_sub",
+    (
+        pytest.param(PullSub(10, batch_latency=0.1), id="without batch"),
+        pytest.param(PullSub(10, batch=True, batch_latency=0), id="non-positive"),
+    ),
+)
+def test_pull_sub_batch_latency(pull_sub: PullSub) -> None:
+    broker = NatsBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber("subject", stream="stream", pull_sub=pull_sub)
@@ -5,6 +5,9 @@ import pytest
 
 from faststream import Context
 from faststream.nats import NatsResponse
+from faststream.nats.publisher.producer import NatsJSFastProducer
+from faststream.nats.response import NatsPublishCommand
+from faststream.response import PublishType
 from tests.brokers.base.publish import BrokerPublishTestcase
 
 from .basic import NatsTestcaseConfig
@@ -75,3 +78,58 @@ class TestPublish(NatsTestcaseConfig, BrokerPublishTestcase):
             )
 
             assert await response.decode() == "Hi!", response
+
+    @pytest.mark.asyncio()
+    async def test_publish_batch(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        pub_broker = self.get_broker()
+
+        received = asyncio.Event()
+
+        @pub_broker.subscriber(queue)
+        async def handle(msg: int) -> None:
+            mock(msg)
+            if mock.call_count == 3:
+                received.set()
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            await br.publish_batch(1, 2, 3, subject=queue)
+
+            await asyncio.wait_for(received.wait(), timeout=3)
+
+        assert [c.args for c in mock.call_args_list] == [(1,), (2,), (3,)]
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_js_publish_batch_is_bounded() -> None:
+    pending = max_pending = 0
+
+    async def publish(payload: bytes, **kwargs: object) -> bytes:
+        nonlocal pending, max_pending
+        pending += 1
+        max_pending = max(max_pending, pending)
+        await asyncio.sleep(0.01)
+        pending -= 1
+        return payload
+
+    producer = NatsJSFastProducer(parser=None, decoder=None)
+    producer.max_pending_acks = 2
+    producer.connect(MagicMock(publish=publish), serializer=None)
+
+    acks = await producer.publish_batch(
+        NatsPublishCommand(
+            *(str(i) for i in range(5)),
+            subject="test",
+            stream="test",
+            _publish_type=PublishType.PUBLISH,
+        ),
+    )
+
+    assert max_pending == 2
+    assert acks == [str(i).encode() for i in range(5)]
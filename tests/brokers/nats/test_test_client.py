@@ -223,6 +223,40 @@ class TestTestclient(NatsMemoryTestcaseConfig, BrokerTestclientTestcase):
             await br.publish("hello", queue)
             subscriber.mock.assert_called_once_with(["hello"])
 
+    async def test_publish_batch(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        def subscriber(m) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch("hello", "world", subject=queue)
+            assert [c.args for c in subscriber.mock.call_args_list] == [
+                ("hello",),
+                ("world",),
+            ]
+
+    async def test_publish_batch_to_batch_consumer(
+        self,
+        queue: str,
+        stream: JStream,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(
+            queue,
+            stream=stream,
+            pull_sub=PullSub(2, batch=True),
+        )
+        def subscriber(m) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch("hello", "world", subject=queue, stream=stream.name)
+            subscriber.mock.assert_called_once_with(["hello", "world"])
+
     async def test_consume_with_filter(
         self,
         queue,
@@ -119,7 +119,7 @@ class TestPublish(RabbitTestcaseConfig, BrokerPublishTestcase):
 
         @pub_broker.subscriber(queue)
         async def handle():
-            return RabbitResponse("Hi!", correlation_id="1")
+            return RabbitResponse("Hi!")
 
         async with self.patch_broker(pub_broker) as br:
             await br.start()
@@ -131,6 +131,24 @@ class TestPublish(RabbitTestcaseConfig, BrokerPublishTestcase):
 
             assert await response.decode() == "Hi!", response
 
+    @pytest.mark.asyncio()
+    async def test_rpc_drops_overridden_correlation_id(
+        self,
+        queue: str,
+    ) -> None:
+        pub_broker = self.get_broker(apply_types=True)
+
+        @pub_broker.subscriber(queue)
+        async def handle():
+            return RabbitResponse("Hi!", correlation_id="1")
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            # the response can't be told apart from a late one to another request
+            with pytest.raises(TimeoutError):
+                await br.request("", queue, timeout=0.5)
+
     @pytest.mark.asyncio()
     async def test_default_timestamp(
         self,
@@ -198,3 +216,28 @@ class TestPublish(RabbitTestcaseConfig, BrokerPublishTestcase):
 
         assert event.is_set()
         mock.assert_called_with("Hello!")
+
+    @pytest.mark.asyncio()
+    async def test_publish_batch(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        pub_broker = self.get_broker()
+
+        received = asyncio.Event()
+
+        @pub_broker.subscriber(queue)
+        async def handle(msg: int) -> None:
+            mock(msg)
+            if mock.call_count == 3:
+                received.set()
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            await br.publish_batch(1, 2, 3, queue=queue)
+
+            await asyncio.wait_for(received.wait(), timeout=3)
+
+        assert [c.args for c in mock.call_args_list] == [(1,), (2,), (3,)]
@@ -1,6 +1,9 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from faststream import BaseMiddleware
+from faststream.rabbit.publisher.producer import _RPCConsumer
 from tests.brokers.base.requests import RequestsTestcase
 
 from .basic import RabbitMemoryTestcaseConfig, RabbitTestcaseConfig
@@ -32,3 +35,17 @@ class TestRealRequests(RabbitTestcaseConfig, RabbitRequestsTestcase):
 @pytest.mark.asyncio()
 class TestRequestTestClient(RabbitMemoryTestcaseConfig, RabbitRequestsTestcase):
     pass
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_rpc_drops_unknown_response() -> None:
+    rpc = _RPCConsumer()
+
+    with rpc.wait_reply("1") as future:
+        # a late response to another request must not be taken for this one
+        await rpc._on_response(MagicMock(correlation_id="2"))
+        assert not future.done()
+
+        await rpc._on_response(response := MagicMock(correlation_id="1"))
+        assert future.result() is response
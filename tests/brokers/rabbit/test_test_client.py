@@ -55,6 +55,22 @@ class TestTestclient(RabbitMemoryTestcaseConfig, BrokerTestclientTestcase):
             with pytest.raises(SubscriberNotFound):
                 await br.request("", "")
 
+    async def test_publish_batch(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        def subscriber(m) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch("hello", "world", queue=queue)
+            assert [c.args for c in subscriber.mock.call_args_list] == [
+                ("hello",),
+                ("world",),
+            ]
+
     async def test_consume_manual_ack(
         self,
         queue: str,
@@ -138,6 +138,83 @@ class TestConsume(RedisTestcaseConfig, BrokerRealConsumeTestcase):
         assert event2.is_set()
         assert mock.call_count == 2, mock.call_count
 
+    async def test_channels_share_connection(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        event = asyncio.Event()
+        event2 = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(queue)
+        async def handler(msg) -> None:
+            mock(msg)
+            event.set()
+
+        @consume_broker.subscriber(PubSub(f"{queue}.*", pattern=True))
+        async def handler2(msg) -> None:
+            mock(msg)
+            event2.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            with patch.object(
+                Redis,
+                "pubsub",
+                spy_decorator(Redis.pubsub),
+            ) as m:
+                await br.start()
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("hello", queue)),
+                    asyncio.create_task(br.publish("world", f"{queue}.1")),
+                    asyncio.create_task(event.wait()),
+                    asyncio.create_task(event2.wait()),
+                ),
+                timeout=3,
+            )
+
+            m.mock.assert_called_once()
+
+        assert event.is_set()
+        assert event2.is_set()
+        mock.assert_has_calls([call("hello"), call("world")], any_order=True)
+
+    async def test_blocked_channel_does_not_stop_others(
+        self,
+        queue: str,
+    ) -> None:
+        release = asyncio.Event()
+        received: asyncio.Queue[int] = asyncio.Queue()
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        blocked_sub = consume_broker.subscriber(PubSub(queue, buffer_size=100))
+
+        @blocked_sub
+        async def blocked(msg: int) -> None:
+            await release.wait()
+
+        @consume_broker.subscriber(queue)
+        async def handler(msg: int) -> None:
+            received.put_nowait(msg)
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            try:
+                # more messages than the blocked subscriber queue can hold
+                for i in range(150):
+                    await br.publish(i, queue)
+                    assert await asyncio.wait_for(received.get(), self.timeout) == i
+
+                assert blocked_sub.dropped_count > 0
+
+            finally:
+                release.set()
+
 
 @pytest.mark.connected()
 @pytest.mark.redis()
@@ -197,6 +274,35 @@ class TestConsumeList(RedisTestcaseConfig):
 
         mock.assert_called_once_with(b"hello")
 
+    async def test_consume_list_multi_pop(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        @consume_broker.subscriber(list=ListSub(queue, max_records=2))
+        async def handler(msg: int) -> None:
+            mock(msg)
+            if mock.call_count == 3:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish_batch(1, 2, 3, list=queue)),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=3,
+            )
+
+        assert event.is_set()
+        mock.assert_has_calls([call(1), call(2), call(3)])
+
     @pytest.mark.slow()
     async def test_consume_list_batch_with_one(
         self,
@@ -386,10 +492,12 @@ class TestConsumeList(RedisTestcaseConfig):
             assert message is not None
             assert await message.decode() == "test_message"
 
+    @pytest.mark.parametrize("timeout", (pytest.param(0, id="zero"), 1e-24))
     async def test_get_one_timeout(
         self,
         queue: str,
         mock: MagicMock,
+        timeout: float,
     ) -> None:
         broker = self.get_broker(apply_types=True)
         subscriber = broker.subscriber(list=queue)
@@ -397,7 +505,7 @@ class TestConsumeList(RedisTestcaseConfig):
         async with self.patch_broker(broker) as br:
             await br.start()
 
-            mock(await subscriber.get_one(timeout=1e-24))
+            mock(await subscriber.get_one(timeout=timeout))
             mock.assert_called_once_with(None)
 
     async def test_concurrent_consume_list(
@@ -776,6 +884,130 @@ class TestConsumeStream(RedisTestcaseConfig):
 
         assert event.is_set()
 
+    async def test_consume_pipeline_ack(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            stream=StreamSub(queue, group="group", consumer=queue, pipeline=True),
+            max_workers=3,
+        )
+        async def handler(msg: str) -> None:
+            mock(msg)
+            if mock.call_count == 3:
+                event.set()
+
+        with patch.object(Redis, "xack", spy_decorator(Redis.xack)) as m:
+            async with self.patch_broker(consume_broker) as br:
+                await br._connection.xgroup_create(queue, "group", mkstream=True)
+                for i in range(3):
+                    await br.publish(str(i), stream=queue)
+
+                await br.start()
+                await asyncio.wait((asyncio.create_task(event.wait()),), timeout=3)
+
+        assert event.is_set()
+        m.mock.assert_called_once()
+        assert len(m.mock.call_args.args) == 6  # self, name, group and 3 ids
+        assert {c.args[0] for c in mock.call_args_list} == {"0", "1", "2"}
+
+    async def test_pipeline_stop_processes_prefetched(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        sub = consume_broker.subscriber(
+            stream=StreamSub(
+                queue,
+                group="group",
+                consumer=queue,
+                pipeline=True,
+                max_records=2,
+            ),
+            max_workers=2,
+        )
+
+        @sub
+        async def handler(msg: str) -> None:
+            mock(msg)
+            started.set()
+            await release.wait()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br._connection.xgroup_create(queue, "group", mkstream=True)
+            for i in range(4):
+                await br.publish(str(i), stream=queue)
+
+            await br.start()
+            await asyncio.wait_for(started.wait(), self.timeout)
+
+            # the next batch is already read into the consumer PEL
+            await asyncio.sleep(0.5)
+
+            stop_task = asyncio.create_task(sub.stop())
+            release.set()
+            await asyncio.wait_for(stop_task, self.timeout)
+
+            pending = await br._connection.xpending(queue, "group")
+
+        assert pending["pending"] == 0
+        assert {c.args[0] for c in mock.call_args_list} == {"0", "1", "2", "3"}
+
+    async def test_reclaim_pending(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        sub = consume_broker.subscriber(
+            stream=StreamSub(
+                queue,
+                group="group",
+                consumer=queue,
+                min_idle_time=10,
+                max_deliveries=3,
+            ),
+        )
+
+        @sub
+        async def handler(msg: str) -> None:
+            mock(msg)
+            if msg == "broken":
+                raise ValueError
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br._connection.xgroup_create(queue, "group", mkstream=True)
+            await br.publish("hello", stream=queue)
+            await br.publish("broken", stream=queue)
+
+            # read by a crashed consumer and never acknowledged
+            await br._connection.xreadgroup("group", "crashed", {queue: ">"})
+
+            await br.start()
+            await asyncio.wait((asyncio.create_task(event.wait()),), timeout=3)
+            await asyncio.sleep(0.5)
+
+            assert not (await br._connection.xpending(queue, "group"))["pending"]
+
+        assert event.is_set()
+        assert sub.claimed_count == 3
+        assert sub.dead_lettered_count == 1
+        mock.assert_has_calls([call("hello"), call("broken"), call("broken")])
+
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
     async def test_consume_and_delete_acked(
         self,
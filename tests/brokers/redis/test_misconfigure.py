@@ -2,7 +2,8 @@ import pytest
 
 from faststream.exceptions import SetupError
 from faststream.nats import NatsRouter
-from faststream.redis import RedisBroker, RedisRouter
+from faststream.redis import RedisBroker, RedisRouter, StreamSub
+from faststream.redis.subscriber.usecases.stream_subscriber import StreamBatchSubscriber
 
 
 @pytest.mark.redis()
@@ -17,3 +18,23 @@ def test_use_only_redis_router() -> None:
 
     with pytest.raises(SetupError):
         broker.include_routers(routers)
+
+
+@pytest.mark.redis()
+def test_stream_batch_latency_controls_read_count() -> None:
+    broker = RedisBroker()
+
+    sub = broker.subscriber(
+        stream=StreamSub("test", batch=True, max_records=10, batch_latency_ms=100),
+    )
+
+    assert isinstance(sub, StreamBatchSubscriber)
+    assert sub.adaptive_batch_size is not None
+    assert sub._read_count() == 1
+
+    sub.adaptive_batch_size.update(1, 0.01)
+    assert sub._read_count() == 2
+
+    sub = broker.subscriber(stream=StreamSub("test", batch=True, max_records=10))
+    assert sub.adaptive_batch_size is None
+    assert sub._read_count() == 10
@@ -1,7 +1,12 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from faststream import BaseMiddleware
 from faststream.redis import BinaryMessageFormatV1
+from faststream.redis.publisher.producer import _RPCInbox
 from tests.brokers.base.requests import RequestsTestcase
 
 from .basic import RedisMemoryTestcaseConfig, RedisTestcaseConfig
@@ -32,9 +37,65 @@ class RedisRequestsTestcase(RequestsTestcase):
 @pytest.mark.connected()
 @pytest.mark.redis()
 class TestRealRequests(RedisTestcaseConfig, RedisRequestsTestcase):
-    pass
+    async def test_requests_share_inbox(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def handler(msg: str) -> str:
+            return msg
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            await br.request("1", queue, timeout=self.timeout)
+            inbox = br.config.producer._inbox
+            subscription = inbox._subscription
+
+            response = await br.request("2", queue, timeout=self.timeout)
+
+            assert await response.decode() == "2"
+            assert inbox._subscription is subscription
+            assert not inbox.responses
 
 
 @pytest.mark.redis()
 class TestRequestTestClient(RedisMemoryTestcaseConfig, RedisRequestsTestcase):
     pass
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_inbox_routes_responses_by_channel() -> None:
+    messages: asyncio.Queue[Any] = asyncio.Queue()
+
+    async def get_message(**kwargs: Any) -> Any:
+        msg = await messages.get()
+        if isinstance(msg, Exception):
+            raise msg
+        return msg
+
+    psub = MagicMock(
+        psubscribe=AsyncMock(),
+        aclose=AsyncMock(),
+        get_message=get_message,
+    )
+
+    inbox = _RPCInbox()
+    await inbox.start(MagicMock(pubsub=MagicMock(return_value=psub)))
+    psub.psubscribe.assert_awaited_once_with(f"{inbox.prefix}.*")
+
+    with (
+        inbox.wait_reply() as (_, first_response),
+        inbox.wait_reply() as (second, second_response),
+    ):
+        await messages.put({"channel": second.encode(), "data": b"hello"})
+        assert (await second_response)["data"] == b"hello"
+        assert not first_response.done()
+
+        await messages.put(ConnectionError("connection lost"))
+        with pytest.raises(ConnectionError):
+            await first_response
+
+    psub.aclose.assert_awaited_once()
+    assert inbox._task is None
+    assert inbox._subscription is None
@@ -12,3 +12,40 @@ def test_stream_group() -> None:
         StreamSub("test", consumer="consumer")
 
     StreamSub("test", group="group", consumer="consumer")
+
+
+@pytest.mark.redis()
+def test_stream_pipeline_batch() -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        StreamSub("test", batch=True, pipeline=True)
+
+
+@pytest.mark.redis()
+def test_stream_reclaim_options() -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        StreamSub("test", min_idle_time=1000)
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        StreamSub("test", group="group", consumer="consumer", max_deliveries=3)
+
+    StreamSub(
+        "test",
+        group="group",
+        consumer="consumer",
+        min_idle_time=1000,
+        max_deliveries=3,
+    )
+
+
+@pytest.mark.redis()
+def test_stream_batch_latency() -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        StreamSub("test", max_records=10, batch_latency_ms=100)
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        StreamSub("test", batch=True, batch_latency_ms=100)
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        StreamSub("test", batch=True, max_records=10, batch_latency_ms=0)
+
+    StreamSub("test", batch=True, max_records=10, batch_latency_ms=100)
@@ -1,9 +1,12 @@
 import os
 import signal
+import time
 
 import pytest
 
+from faststream._internal.cli.supervisors.health import WorkerHealth
 from faststream._internal.cli.supervisors.multiprocess import Multiprocess
+from faststream._internal.cli.supervisors.utils import get_cpu_sets
 from tests.marks import skip_windows
 
 
@@ -23,3 +26,120 @@ def test_base() -> None:
         assert p.exitcode
         code = abs(p.exitcode)
         assert code in {signal.SIGTERM.value, 0}
+
+
+def idle(*args) -> None:  # pragma: no cover
+    time.sleep(60)
+
+
+def hung(*args, health: WorkerHealth) -> None:  # pragma: no cover
+    health.conn.send((0, 0.0))
+    time.sleep(60)
+
+
+def busy(*args, health: WorkerHealth) -> None:  # pragma: no cover
+    health.conn.send((10, 0.0))
+    time.sleep(60)
+
+
+def wait_ping(processor: Multiprocess) -> None:
+    # block on the health pipes instead of sleeping
+    for monitor in processor.monitors:
+        assert monitor is not None
+        assert monitor.conn.poll(10)
+        monitor.poll()
+
+
+@skip_windows
+def test_kill_hung_worker() -> None:
+    processor = Multiprocess(target=hung, args=(), workers=1, health_timeout=5.0)
+    processor._args = (processor.pid, {})
+    processor.startup()
+
+    process = processor.processes[0]
+    try:
+        wait_ping(processor)
+
+        monitor = processor.monitors[0]
+        monitor.last_seen -= processor.health_timeout + 1
+
+        processor.restart()
+        assert processor.processes[0] is not process
+    finally:
+        processor.shutdown()
+
+    assert process.exitcode == -signal.SIGKILL
+
+
+@skip_windows
+def test_recycle_worker() -> None:
+    processor = Multiprocess(
+        target=busy,
+        args=(),
+        workers=2,
+        health_timeout=5.0,
+        max_messages_per_worker=5,
+    )
+    processor._args = (processor.pid, {})
+    processor.startup()
+
+    first, second = processor.processes
+    try:
+        wait_ping(processor)
+
+        processor.restart()
+        # drain workers one by one
+        assert processor.processes[0] is not first
+        assert processor.processes[1] is second
+        assert processor._draining[0] is first
+
+        first.join()
+        processor.restart()
+        assert processor.processes[1] is not second
+    finally:
+        processor.shutdown()
+
+    assert first.exitcode == -signal.SIGTERM
+    assert second.exitcode == -signal.SIGTERM
+
+
+@skip_windows
+def test_sighup_handler_restored() -> None:
+    previous = signal.getsignal(signal.SIGHUP)
+
+    processor = Multiprocess(target=idle, args=(), workers=1)
+    processor._args = (processor.pid, {})
+    processor.startup()
+    try:
+        # not supervised workers are not restarted by SIGHUP
+        assert signal.getsignal(signal.SIGHUP) is previous
+    finally:
+        processor.shutdown()
+
+    processor = Multiprocess(target=hung, args=(), workers=1, health_timeout=5.0)
+    assert signal.getsignal(signal.SIGHUP) is previous
+
+    processor._args = (processor.pid, {})
+    processor.startup()
+    try:
+        assert signal.getsignal(signal.SIGHUP) is not previous
+    finally:
+        processor.shutdown()
+
+    assert signal.getsignal(signal.SIGHUP) is previous
+
+
+@pytest.mark.parametrize(
+    ("workers", "cpu_sets"),
+    (
+        pytest.param(2, [{0, 2}, {1, 3}], id="less workers"),
+        pytest.param(6, [{0}, {1}, {2}, {3}, {0}, {1}], id="more workers"),
+    ),
+)
+def test_cpu_sets(
+    workers: int,
+    cpu_sets: list[set[int]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(os, "sched_getaffinity", lambda _: {0, 1, 2, 3}, raising=False)
+    assert get_cpu_sets(workers) == cpu_sets
@@ -0,0 +1,115 @@
+import logging
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream import ContextRepo
+from faststream._internal.logger import LoggerState
+from faststream._internal.logger.logger_proxy import (
+    QueuedLoggerObject,
+    RealLoggerObject,
+)
+from faststream.message.source_type import SourceType
+from faststream.middlewares.logging import CriticalLogMiddleware
+
+
+class RecordsHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+def make_logger(handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(f"{__name__}.{id(handler)}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def test_write_from_listener_thread() -> None:
+    handler = RecordsHandler()
+    logger = QueuedLoggerObject(make_logger(handler), max_size=10)
+
+    logger.log(logging.INFO, "Received", extra={"message_id": "1"})
+    logger.log(logging.DEBUG, "Skipped")
+    logger.log(logging.ERROR, "Failed", exc_info=ValueError("error"))
+    logger.close()
+
+    assert [r.getMessage() for r in handler.records] == ["Received", "Failed"]
+    assert handler.records[0].message_id == "1"
+    assert handler.records[1].exc_info[0] is ValueError
+    assert handler.threads == {"faststream-logger"}
+
+
+def test_count_dropped_records() -> None:
+    entered, release = threading.Event(), threading.Event()
+
+    class BlockingHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            entered.set()
+            release.wait()
+
+    logger = QueuedLoggerObject(make_logger(BlockingHandler()), max_size=1)
+
+    logger.log(logging.INFO, "first")
+    assert entered.wait(1.0)
+
+    for _ in range(3):
+        logger.log(logging.INFO, "next")
+
+    release.set()
+    logger.close()
+
+    assert logger.dropped_count == 2
+
+
+def test_state_uses_queue() -> None:
+    handler = RecordsHandler()
+    state = LoggerState(queue_size=10)
+    state.params_storage.get_logger = lambda context: make_logger(handler)  # type: ignore[method-assign]
+
+    state._setup(ContextRepo())
+    assert isinstance(state.logger, QueuedLoggerObject)
+
+    state.log("Hi")
+    state.close()
+    assert [r.getMessage() for r in handler.records] == ["Hi"]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(("sample_rate", "logs"), ((0.0, 0), (1.0, 2)))
+async def test_sample_consume_logs(sample_rate: float, logs: int) -> None:
+    state = LoggerState(sample_rate=sample_rate)
+    state.logger = RealLoggerObject(mock := MagicMock())
+
+    middleware = CriticalLogMiddleware(state)(None, context=ContextRepo())
+    async with middleware:
+        await middleware.consume_scope(
+            AsyncMock(),
+            MagicMock(source_type=SourceType.CONSUME),
+        )
+
+    assert mock.log.call_count == logs
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(("sample_rate", "logs"), ((0.0, 0), (1.0, 2)))
+async def test_subscriber_sample_rate_override(sample_rate: float, logs: int) -> None:
+    state = LoggerState(sample_rate=1.0 - sample_rate)
+    state.logger = RealLoggerObject(mock := MagicMock())
+
+    middleware = CriticalLogMiddleware(state, sample_rate)(None, context=ContextRepo())
+    async with middleware:
+        await middleware.consume_scope(
+            AsyncMock(),
+            MagicMock(source_type=SourceType.CONSUME),
+        )
+
+    assert mock.log.call_count == logs
@@ -374,6 +374,44 @@ class LocalTelemetryTestcase(BaseTestcaseConfig):
         self.assert_metrics(metrics, error_type=expected_value_type)
         mock.assert_called_once_with(msg)
 
+    async def test_sample_ratio_skip_spans(
+        self,
+        queue: str,
+        mock: MagicMock,
+        tracer_provider: TracerProvider,
+        trace_exporter: InMemorySpanExporter,
+        meter_provider: MeterProvider,
+        metric_reader: InMemoryMetricReader,
+        event: asyncio.Event,
+    ) -> None:
+        mid = self.telemetry_middleware_class(
+            tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            sample_ratio=0.0,
+        )
+        broker = self.get_broker(middlewares=(mid,), apply_types=True)
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m, span: CurrentSpan) -> None:
+            mock(sampled=span.get_span_context().trace_flags.sampled)
+            event.set()
+
+        broker = self.patch_broker(broker)
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish("start", queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert not self.get_spans(trace_exporter)
+        self.assert_metrics(self.get_metrics(metric_reader))
+        mock.assert_called_once_with(sampled=False)
+
     async def test_span_in_context(
         self,
         queue: str,
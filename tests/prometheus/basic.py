@@ -328,3 +328,11 @@ class LocalMetricsSettingsProviderTestcase:
             middleware_1._metrics_container.received_messages_total
             is middleware_2._metrics_container.received_messages_total
         )
+
+    def test_labels_cache_size(self) -> None:
+        middleware = self.get_middleware(
+            registry=CollectorRegistry(),
+            labels_cache_size=8,
+        )
+
+        assert middleware._metrics_manager._labels.cache_info().maxsize == 8
@@ -1,5 +1,6 @@
 import random
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from prometheus_client import CollectorRegistry
@@ -421,3 +422,31 @@ class TestCaseMetrics:
         metric_values = manager._container.published_messages_exceptions_total.collect()
 
         assert metric_values == [expected]
+
+    def test_labeled_metrics_cached(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+        )
+        metric = manager._container.received_messages_total
+
+        with patch.object(metric, "labels", wraps=metric.labels) as labels:
+            manager.add_received_message(broker=broker, handler=queue)
+            manager.add_received_message(broker=broker, handler=queue)
+
+        labels.assert_called_once_with(app_name, broker, queue)
+
+        expected = get_received_messages_metric(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+            queue=queue,
+            broker=broker,
+            messages_amount=2,
+        )
+        assert metric.collect() == [expected]
@@ -0,0 +1,52 @@
+from faststream._internal.endpoint.subscriber.batching import AdaptiveBatchSize
+
+
+def test_starts_from_min_size() -> None:
+    assert AdaptiveBatchSize(1.0, max_size=100, min_size=5).size == 5
+
+
+def test_grows_after_fast_full_batch() -> None:
+    batch_size = AdaptiveBatchSize(1.0, max_size=100)
+
+    assert batch_size.update(1, 0.01) == 2
+    assert batch_size.update(2, 0.02) == 4
+
+
+def test_grows_to_target() -> None:
+    batch_size = AdaptiveBatchSize(1.0, max_size=100)
+    batch_size.size = 10
+
+    assert batch_size.update(10, 0.8) == 12
+
+
+def test_does_not_grow_after_partial_batch() -> None:
+    batch_size = AdaptiveBatchSize(1.0, max_size=100)
+    batch_size.size = 10
+
+    assert batch_size.update(5, 0.01) == 10
+
+
+def test_shrinks_after_slow_batch() -> None:
+    batch_size = AdaptiveBatchSize(1.0, max_size=100)
+    batch_size.size = 40
+
+    assert batch_size.update(40, 4.0) == 10
+
+
+def test_stays_in_bounds() -> None:
+    batch_size = AdaptiveBatchSize(1.0, max_size=10, min_size=2)
+
+    for _ in range(10):
+        batch_size.update(batch_size.size, 0.0)
+    assert batch_size.size == 10
+
+    assert batch_size.update(10, 100.0) == 2
+
+
+def test_measure_updates_size() -> None:
+    batch_size = AdaptiveBatchSize(10.0, max_size=100)
+
+    with batch_size.measure(1):
+        pass
+
+    assert batch_size.size == 2
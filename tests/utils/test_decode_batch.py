@@ -0,0 +1,45 @@
+import pytest
+
+from faststream._internal.constants import ContentTypes
+from faststream.message import decode_batch_bodies, loads_json_batch
+
+JSON = ContentTypes.JSON.value
+TEXT = ContentTypes.TEXT.value
+
+
+def test_loads_json_batch() -> None:
+    assert loads_json_batch([b'{"a": 1}', b"[1, 2]", b'"s"']) == [{"a": 1}, [1, 2], "s"]
+
+
+def test_loads_empty_batch() -> None:
+    assert loads_json_batch([]) == []
+
+
+@pytest.mark.parametrize(
+    "bodies",
+    (
+        pytest.param([b"1", b"hello"], id="invalid document"),
+        pytest.param([b"1,2", b"3"], id="joinable documents"),
+        pytest.param([b"1", b""], id="empty document"),
+        pytest.param([b"1,2", b"[3", b"4]"], id="joinable to same length"),
+        pytest.param([b'"x', b'y"],[1'], id="joinable strings"),
+    ),
+)
+def test_loads_invalid_json_batch(bodies: list[bytes]) -> None:
+    assert loads_json_batch(bodies) is None
+
+
+def test_decode_invalid_json_batch() -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        decode_batch_bodies([b"1,2", b"[3", b"4]"], [JSON, JSON, JSON])
+
+
+def test_decode_json_batch() -> None:
+    assert decode_batch_bodies([b"1", b'{"a": 1}'], [JSON, JSON]) == [1, {"a": 1}]
+
+
+def test_decode_mixed_batch() -> None:
+    assert decode_batch_bodies(
+        [b"1", b"hello", b"raw", b"2"],
+        [JSON, TEXT, None, None],
+    ) == [1, "hello", b"raw", 2]
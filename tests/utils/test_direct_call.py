@@ -0,0 +1,172 @@
+from typing import Any
+
+import msgspec
+import pytest
+from fast_depends import Depends
+from fast_depends.exceptions import ValidationError as FDValidationError
+from fast_depends.msgspec import MsgSpecSerializer
+from pydantic import BaseModel, ValidationError
+
+from faststream import Context
+from faststream._internal.di import FastDependsConfig
+from faststream.message import StreamMessage, decode_message, encode_message
+
+
+class Model(BaseModel):
+    field: int
+
+
+def make_message(body: Any) -> StreamMessage[Any]:
+    data, content_type = encode_message(body, None)
+    message = StreamMessage(raw_message=None, body=data, content_type=content_type)
+
+    async def decoder(msg: StreamMessage[Any]) -> Any:
+        return decode_message(msg)
+
+    message.set_decoder(decoder)
+    return message
+
+
+@pytest.mark.asyncio()
+async def test_untyped_body_is_passed_as_is() -> None:
+    async def handler(body):  # type: ignore[no-untyped-def]
+        return body
+
+    built = FastDependsConfig().build_call(handler)
+
+    assert await built.wrapped_call(make_message({"field": "1"})) == {"field": "1"}
+
+
+@pytest.mark.asyncio()
+async def test_typed_body_is_casted() -> None:
+    def handler(body: Model) -> int:
+        assert isinstance(body, Model)
+        return body.field
+
+    built = FastDependsConfig().build_call(handler)
+
+    assert await built.wrapped_call(make_message({"field": "1"})) == 1
+
+    with pytest.raises(ValidationError):
+        await built.wrapped_call(make_message({"field": "a"}))
+
+
+@pytest.mark.asyncio()
+async def test_response_is_casted() -> None:
+    async def handler(body: str) -> int:
+        return body  # type: ignore[return-value]
+
+    built = FastDependsConfig().build_call(handler)
+
+    assert await built.wrapped_call(make_message("1")) == 1
+
+
+@pytest.mark.asyncio()
+async def test_keyword_only_body() -> None:
+    async def handler(*, body: int) -> int:
+        return body
+
+    built = FastDependsConfig().build_call(handler)
+
+    assert await built.wrapped_call(make_message("1")) == 1
+
+
+@pytest.mark.asyncio()
+async def test_no_arguments() -> None:
+    async def handler() -> str:
+        return "done"
+
+    built = FastDependsConfig().build_call(handler)
+
+    assert await built.wrapped_call(make_message(b"")) == "done"
+
+
+@pytest.mark.asyncio()
+async def test_no_cast_without_fastdepends() -> None:
+    async def handler(body: int) -> Any:
+        return body
+
+    built = FastDependsConfig(use_fastdepends=False).build_call(handler)
+
+    assert await built.wrapped_call(make_message("1")) == "1"
+
+
+@pytest.mark.asyncio()
+async def test_dependencies_use_fastdepends() -> None:
+    def dep() -> int:
+        return 1
+
+    async def handler(body: int, d: int = Depends(dep)) -> int:
+        return body + d
+
+    built = FastDependsConfig().build_call(handler)
+
+    assert await built.wrapped_call(make_message("1")) == 2
+
+
+@pytest.mark.asyncio()
+async def test_context_uses_fastdepends() -> None:
+    config = FastDependsConfig()
+    config.context.set_global("value", 1)
+
+    async def handler(body: int, value: int = Context()) -> int:
+        return body + value
+
+    built = config.build_call(handler)
+
+    assert await built.wrapped_call(make_message("1")) == 2
+
+
+class Struct(msgspec.Struct):
+    field: int
+
+
+@pytest.mark.asyncio()
+async def test_msgspec_decodes_raw_json() -> None:
+    config = FastDependsConfig(serializer=MsgSpecSerializer())
+
+    async def handler(body: Struct) -> int:
+        return body.field
+
+    built = config.build_call(handler, default_decoder=True)
+
+    message = make_message({"field": "1"})
+
+    async def decoder(msg: StreamMessage[Any]) -> Any:
+        pytest.fail("Message should be decoded by handler type")
+
+    message.set_decoder(decoder)
+
+    assert await built.wrapped_call(message) == 1
+
+
+@pytest.mark.asyncio()
+async def test_msgspec_invalid_body_raises_serializer_error() -> None:
+    config = FastDependsConfig(serializer=MsgSpecSerializer())
+
+    async def handler(body: Struct) -> int:
+        return body.field
+
+    built = config.build_call(handler, default_decoder=True)
+
+    with pytest.raises(FDValidationError):
+        await built.wrapped_call(make_message({"field": "a"}))
+
+
+@pytest.mark.asyncio()
+async def test_msgspec_custom_decoder_is_used() -> None:
+    config = FastDependsConfig(serializer=MsgSpecSerializer())
+
+    async def handler(body: Struct) -> int:
+        return body.field
+
+    built = config.build_call(handler)
+
+    message = make_message({"field": 1})
+
+    async def decoder(msg: StreamMessage[Any]) -> Any:
+        return {"field": 2}
+
+    message.set_decoder(decoder)
+
+    assert await built.wrapped_call(message) == 2
@@ -0,0 +1,62 @@
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream._internal.testing.routing import RoutingIndex, RoutingTable
+from faststream.memory import MemoryBroker, MemoryRouter
+
+
+@pytest.mark.parametrize(
+    ("pattern", "destination", "result"),
+    (
+        pytest.param("test", "test", True, id="exact"),
+        pytest.param("test", "test.1", False, id="exact - broken"),
+        pytest.param("test.*", "test.1", True, id="test.*"),
+        pytest.param("test.*", "test.1.2", False, id="test.* - broken"),
+        pytest.param("test.>", "test.1.2", True, id="test.>"),
+        pytest.param("test.>", "test", False, id="test.> - broken"),
+        pytest.param(">.test.*", "1.2.test.1", True, id=">.test.*"),
+        pytest.param(">.*.*.test", "1.2.test", False, id=">.*.*.test - broken"),
+    ),
+)
+def test_pattern(pattern: str, destination: str, result: bool) -> None:
+    index: RoutingIndex[str] = RoutingIndex()
+    index.add_pattern(pattern, "handler")
+
+    assert bool(index.match(destination)) is result
+
+
+def test_match_order() -> None:
+    index: RoutingIndex[str] = RoutingIndex()
+
+    index.add_any("first")
+    index.add_pattern("test.*", "second")
+    index.add("test.1", "third")
+    index.add_regex(re.compile(r"test\..*"), "fourth")
+    index.add_pattern("test.>", "second")
+
+    assert index.match("test.1") == ["first", "second", "third", "fourth"]
+    assert index.match("other") == ["first"]
+
+
+def test_table_rebuild() -> None:
+    broker = MemoryBroker()
+    first = broker.subscriber("first")
+    build = MagicMock()
+
+    table = RoutingTable(broker, build)
+
+    assert table.index is table.index
+    assert build.call_count == 1
+
+    router = MemoryRouter()
+    broker.include_router(router)
+    assert table.index
+    assert build.call_count == 2
+
+    # subscriber registered in the already included router
+    second = router.subscriber("second")
+    assert table.index
+    assert build.call_count == 3
+    assert build.call_args.args[0] == [first, second]